@@ -1,14 +1,15 @@
-from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from collections.abc import AsyncGenerator
 
-from app.shared.database import async_session_maker
-from app.api.deps import get_current_user_id
+from app.api.deps import get_db, get_current_user_id
+from app.shared.export import ExportFormat, streaming_export
+from app.shared.pagination import PageParams, PageResponse, page_params, trusted_page_json
 
 from ..services.alerta_service import AlertaService
+from ..persistence.alerta_orm import AlertaORM
 from ..repositories.alerta_repository_impl import AlertaRepositoryImpl
 from .schemas import AlertaResponse, AlertaUpdate
 
@@ -21,38 +22,33 @@ router = APIRouter(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
 async def get_alerta_service(session: AsyncSession = Depends(get_db)) -> AlertaService:
     repo = AlertaRepositoryImpl(session)
-    return AlertaService(repo)
+    return AlertaService(repo, session)
 
 
 @router.get(
     "/",
-    response_model=List[AlertaResponse],
+    response_model=PageResponse[AlertaResponse],
     summary="Listar alertas não lidos",
-    description="Retorna todos os alertas não lidos do usuário autenticado",
+    description="Retorna os alertas não lidos do usuário autenticado, paginados por cursor",
     responses={
         200: {
             "description": "Lista de alertas não lidos retornada com sucesso",
             "content": {
                 "application/json": {
-                    "example": [
-                        {
-                            "id_alerta": 1,
-                            "fk_pessoa_id_pessoa": "123e4567-e89b-12d3-a456-426614174000",
-                            "data": "2025-01-16T10:30:00Z",
-                            "conteudo": "Nova atividade relacionada à sua meta",
-                            "lida": False
-                        }
-                    ]
+                    "example": {
+                        "items": [
+                            {
+                                "id_alerta": 1,
+                                "fk_pessoa_id_pessoa": "123e4567-e89b-12d3-a456-426614174000",
+                                "data": "2025-01-16T10:30:00Z",
+                                "conteudo": "Nova atividade relacionada à sua meta",
+                                "lida": False
+                            }
+                        ],
+                        "next_cursor": None
+                    }
                 }
             }
         },
@@ -61,32 +57,71 @@ async def get_alerta_service(session: AsyncSession = Depends(get_db)) -> AlertaS
     }
 )
 async def list_alertas(
+    page: PageParams = Depends(page_params),
     service: AlertaService = Depends(get_alerta_service),
     user_id: UUID = Depends(get_current_user_id),
-) -> List[AlertaResponse]:
+) -> Response:
     """
-    Lista todos os alertas não lidos do usuário autenticado.
+    Lista os alertas não lidos do usuário autenticado, mais recentes primeiro.
     
     **Comportamento:**
     - Retorna apenas alertas com `lida=False` pertencentes ao usuário autenticado
-    - Automaticamente exclui alertas com mais de 1 mês antes de retornar os resultados
-    - A limpeza de alertas antigos ajuda a evitar poluição do banco de dados
+    - Alertas com mais de 1 mês (configurável) são removidos periodicamente em background
     
     **Autenticação:**
     - Requer token Bearer válido no header `Authorization`
     - O `user_id` é extraído automaticamente do token
     
+    **Paginação:**
+    - `limit` define o tamanho da página (padrão 50, máximo 200)
+    - Envie o `next_cursor` recebido como `cursor` para obter a próxima página
+    - `next_cursor` é `null` na última página
+
     **Resposta:**
-    - Lista vazia `[]` se não houver alertas não lidos
-    - Lista de objetos `AlertaResponse` com os alertas encontrados
+    - `items` vazio se não houver alertas não lidos
+    - `items` com objetos `AlertaResponse` dos alertas encontrados
     """
     try:
-        alertas = await service.listar_por_pessoa(user_id)
-        return [AlertaResponse.model_validate(alerta.__dict__) for alerta in alertas]
+        alertas = await service.listar_por_pessoa(user_id, page)
+        # Linhas vêm direto da tabela alerta: serializa sem revalidar contra AlertaResponse
+        return trusted_page_json(AlertaResponse, alertas)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Exportar histórico de alertas",
+    description="Exporta todos os alertas (lidos e não lidos) do usuário autenticado em NDJSON ou CSV",
+    responses={
+        200: {
+            "description": "Arquivo gerado em streaming",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        401: {"description": "Token de autenticação inválido ou ausente"}
+    }
+)
+async def exportar_alertas(
+    formato: ExportFormat = Query("ndjson", description="Formato do arquivo: 'ndjson' ou 'csv'"),
+    user_id: UUID = Depends(get_current_user_id),
+) -> StreamingResponse:
+    """
+    Exporta o histórico completo de alertas do usuário autenticado.
+
+    **Comportamento:**
+    - Inclui alertas lidos e não lidos, em ordem de criação
+    - As linhas são lidas do banco em lotes e enviadas à medida que chegam,
+      com uso de memória constante independentemente do tamanho do histórico
+    """
+    return streaming_export(
+        lambda session: AlertaRepositoryImpl(session).stream_by_pessoa(user_id),
+        AlertaORM.__table__.columns.keys(),
+        formato,
+        "alertas",
+    )
+
+
 @router.patch(
     "/{id_alerta}",
     response_model=AlertaResponse,
@@ -149,7 +184,7 @@ async def marcar_alerta_como_lido(
             )
         
         updated = await service.marcar_como_lida(id_alerta, user_id)
-        return AlertaResponse.model_validate(updated.__dict__)
+        return AlertaResponse.model_validate(updated)
     except ValueError as e:
         if "permissão" in str(e).lower() or "não tem" in str(e).lower():
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
@@ -1,8 +1,6 @@
 """ORM models do módulo Alertas."""
 
-from typing import TYPE_CHECKING
+from app.alertas.persistence.alerta_orm import AlertaORM
+from app.alertas.persistence.alerta_outbox_orm import AlertaOutboxORM
 
-if TYPE_CHECKING:
-    from app.alertas.persistence.alerta_orm import AlertaORM
-
-__all__ = ["AlertaORM"]
+__all__ = ["AlertaORM", "AlertaOutboxORM"]
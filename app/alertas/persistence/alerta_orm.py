@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,13 @@ from app.shared.database import Base
 
 class AlertaORM(Base):
     __tablename__ = "alerta"
+    __table_args__ = (
+        Index("ix_alerta_fk_pessoa_id_pessoa_lida", "fk_pessoa_id_pessoa", "lida"),
+        # Caixa de entrada: alertas não lidos de uma pessoa
+        Index("ix_alerta_nao_lidas", "fk_pessoa_id_pessoa", "id_alerta", postgresql_where=text("lida = false")),
+        # Retenção: remoção de alertas antigos
+        Index("ix_alerta_data", "data"),
+    )
 
     id_alerta: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared.database import Base
+
+
+class AlertaOutboxORM(Base):
+    """Alerta ainda não entregue: gravado na transação da operação que o gerou.
+
+    Tabela só de passagem, sem índices secundários nem FK, para o INSERT no caminho do
+    usuário ser o mais barato possível. O `AlertaOutboxWorker` move as linhas para `alerta`
+    em lotes (pessoas removidas nesse meio-tempo são descartadas na entrega).
+    """
+
+    __tablename__ = "alerta_outbox"
+
+    id_outbox: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    fk_pessoa_id_pessoa: Mapped[UUID] = mapped_column(PostgresUUID(as_uuid=True), nullable=False)
+    data: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    conteudo: Mapped[str] = mapped_column(String, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<AlertaOutboxORM id={self.id_outbox} conteudo={self.conteudo[:30]}...>"
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-from typing import Protocol
-from collections.abc import Iterable
-from datetime import datetime, timedelta
+from typing import Any, Protocol
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import Row, RowMapping
+
 from app.alertas.persistence.alerta_orm import AlertaORM
+from app.shared.pagination import Page, PageParams
 
 
 class AlertaRepository(Protocol):
     """Contrato que define as operações para o repositório de Alertas."""
 
     async def get_by_id(self, id_alerta: int) -> AlertaORM | None: ...
-    async def list_by_pessoa(self, id_pessoa: UUID) -> Iterable[AlertaORM]: ...
-    async def list_all(self) -> Iterable[AlertaORM]: ...
+    async def list_by_pessoa(self, id_pessoa: UUID, page: PageParams) -> Page[Row[Any]]: ...
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]: ...
+    def stream_by_pessoa(self, id_pessoa: UUID) -> AsyncIterator[RowMapping]: ...
     async def add(self, alerta: AlertaORM) -> AlertaORM: ...
+    async def add_many(self, alertas: Sequence[dict[str, Any]]) -> int: ...
     async def update(self, alerta: AlertaORM) -> AlertaORM: ...
     async def delete(self, id_alerta: int) -> None: ...
-    async def delete_old_alertas(self, id_pessoa: UUID, older_than: datetime) -> int: ...
+    async def purge_older_than(self, older_than: datetime, batch_size: int | None = None) -> int: ...
+    async def deliver_outbox(self, limit: int) -> int: ...
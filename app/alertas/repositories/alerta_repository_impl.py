@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Row, RowMapping, delete, false, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.alertas.persistence.alerta_orm import AlertaORM
+from app.alertas.persistence.alerta_outbox_orm import AlertaOutboxORM
 from app.alertas.repositories.alerta_repository import AlertaRepository
+from app.identidade.persistence.pessoa_orm import PessoaORM
+from app.shared.export import EXPORT_BATCH_SIZE
+from app.shared.pagination import Page, PageParams, paginate
 
 
 class AlertaRepositoryImpl(AlertaRepository):
@@ -20,46 +26,98 @@ class AlertaRepositoryImpl(AlertaRepository):
         """Busca um alerta pelo ID."""
         return await self.session.get(AlertaORM, id_alerta)
 
-    async def list_by_pessoa(self, id_pessoa: UUID) -> list[AlertaORM]:
-        """Lista todos os alertas não lidos de uma pessoa específica."""
-        result = await self.session.execute(
-            select(AlertaORM)
+    async def list_by_pessoa(self, id_pessoa: UUID, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página dos alertas não lidos de uma pessoa, mais recentes primeiro (linhas).
+
+        Servida pelo índice parcial ix_alerta_nao_lidas (fk_pessoa_id_pessoa, id_alerta).
+        """
+        stmt = (
+            select(*AlertaORM.__table__.columns)
             .where(AlertaORM.fk_pessoa_id_pessoa == id_pessoa)
             .where(AlertaORM.lida == False)
         )
-        return list(result.scalars())
+        return await paginate(self.session, stmt, [AlertaORM.id_alerta], page, descending=True)
 
-    async def list_all(self) -> list[AlertaORM]:
-        """Lista todos os alertas cadastrados."""
-        result = await self.session.execute(select(AlertaORM))
-        return list(result.scalars())
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todos os alertas cadastrados, em ordem de ID (linhas)."""
+        return await paginate(self.session, select(*AlertaORM.__table__.columns), [AlertaORM.id_alerta], page)
+
+    async def stream_by_pessoa(self, id_pessoa: UUID) -> AsyncIterator[RowMapping]:
+        """Percorre todos os alertas (lidos ou não) de uma pessoa via cursor no servidor (exportação)."""
+        stmt = (
+            select(*AlertaORM.__table__.columns)
+            .where(AlertaORM.fk_pessoa_id_pessoa == id_pessoa)
+            .order_by(AlertaORM.id_alerta)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result.mappings():
+            yield row
 
     async def add(self, alerta: AlertaORM) -> AlertaORM:
         """Adiciona um novo alerta."""
         self.session.add(alerta)
         await self.session.flush()
-        await self.session.commit()
-        await self.session.refresh(alerta)
         return alerta
 
+    async def add_many(self, alertas: Sequence[dict[str, Any]]) -> int:
+        """Insere vários alertas com um único INSERT multi-linha (sem commit)."""
+        if not alertas:
+            return 0
+        await self.session.execute(insert(AlertaORM).values(list(alertas)))
+        return len(alertas)
+
     async def update(self, alerta: AlertaORM) -> AlertaORM:
         """Atualiza um alerta existente."""
         merged = await self.session.merge(alerta)
-        await self.session.commit()
+        await self.session.flush()
         return merged
 
     async def delete(self, id_alerta: int) -> None:
         """Remove um alerta pelo ID."""
         await self.session.execute(delete(AlertaORM).where(AlertaORM.id_alerta == id_alerta))
-        await self.session.commit()
 
-    async def delete_old_alertas(self, id_pessoa: UUID, older_than: datetime) -> int:
-        """Remove alertas antigos de uma pessoa específica."""
-        stmt = (
-            delete(AlertaORM)
-            .where(AlertaORM.fk_pessoa_id_pessoa == id_pessoa)
-            .where(AlertaORM.data < older_than)
-        )
+    async def purge_older_than(self, older_than: datetime, batch_size: int | None = None) -> int:
+        """Remove alertas (de todas as pessoas) anteriores a `older_than`; com `batch_size`, no máximo
+        esse número de linhas (sem commit). Servida pelo índice ix_alerta_data."""
+        stmt = delete(AlertaORM)
+        if batch_size is None:
+            stmt = stmt.where(AlertaORM.data < older_than)
+        else:
+            lote = select(AlertaORM.id_alerta).where(AlertaORM.data < older_than).limit(batch_size)
+            stmt = stmt.where(AlertaORM.id_alerta.in_(lote.scalar_subquery()))
         result = await self.session.execute(stmt)
-        await self.session.commit()
         return result.rowcount or 0
+
+    async def deliver_outbox(self, limit: int) -> int:
+        """Move até `limit` alertas do outbox para `alerta` num único statement (sem commit).
+
+        Um CTE com DELETE ... RETURNING alimenta o INSERT ... SELECT multi-linha, e o SKIP LOCKED
+        deixa outro processo entregar um lote diferente em paralelo. Intenções de pessoas já
+        removidas saem do outbox sem gerar alerta. Retorna quantas linhas saíram do outbox.
+        """
+        pendentes = (
+            select(AlertaOutboxORM.id_outbox)
+            .order_by(AlertaOutboxORM.id_outbox)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        lote = (
+            delete(AlertaOutboxORM)
+            .where(AlertaOutboxORM.id_outbox.in_(pendentes.scalar_subquery()))
+            .returning(AlertaOutboxORM.fk_pessoa_id_pessoa, AlertaOutboxORM.data, AlertaOutboxORM.conteudo)
+            .cte("lote")
+        )
+        entregues = (
+            insert(AlertaORM)
+            .from_select(
+                ["fk_pessoa_id_pessoa", "data", "conteudo", "lida"],
+                select(lote.c.fk_pessoa_id_pessoa, lote.c.data, lote.c.conteudo, false()).join(
+                    PessoaORM, PessoaORM.id_pessoa == lote.c.fk_pessoa_id_pessoa
+                ),
+            )
+            .returning(AlertaORM.id_alerta)
+            .cte("entregues")
+        )
+        stmt = select(func.count()).select_from(lote).add_cte(entregues)
+        return (await self.session.execute(stmt)).scalar_one()
@@ -1,39 +1,39 @@
-from datetime import datetime, timedelta
-from typing import Any, List
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.alertas.persistence.alerta_orm import AlertaORM
+from app.alertas.persistence.alerta_outbox_orm import AlertaOutboxORM
 from app.alertas.repositories.alerta_repository import AlertaRepository
+from app.shared.pagination import Page, PageParams
+from app.shared.transaction_service import transactional
 
 
 class AlertaService:
     """Camada de regras de negócio de Alerta."""
 
-    def __init__(self, repo: AlertaRepository):
+    def __init__(self, repo: AlertaRepository, session: AsyncSession | None = None):
         self.repo = repo
+        self.session = session
 
     # -------------------------------------------------------------------------
     # CRUD principal
     # -------------------------------------------------------------------------
 
-    async def listar_todos(self) -> List[AlertaORM]:
-        """Lista todos os alertas cadastrados (uso administrativo)."""
-        return await self.repo.list_all()
+    async def listar_todos(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todos os alertas cadastrados (uso administrativo)."""
+        return await self.repo.list_all(page)
 
-    async def listar_por_pessoa(self, id_pessoa: UUID) -> List[AlertaORM]:
+    async def listar_por_pessoa(self, id_pessoa: UUID, page: PageParams) -> Page[Row[Any]]:
         """
-        Lista todos os alertas não lidos de uma pessoa.
-        Antes de retornar, deleta alertas com mais de 1 mês do mesmo usuário.
+        Lista uma página dos alertas não lidos de uma pessoa.
+        Somente leitura: alertas antigos são removidos pelo `AlertaRetentionJob`.
         """
-        # Deleta alertas antigos (>1 mês)
-        um_mes_atras = datetime.now() - timedelta(days=30)
-        await self.repo.delete_old_alertas(id_pessoa, um_mes_atras)
-        
-        # Retorna apenas alertas não lidos
-        return await self.repo.list_by_pessoa(id_pessoa)
+        return await self.repo.list_by_pessoa(id_pessoa, page)
 
     async def buscar_por_id(self, id_alerta: int) -> AlertaORM:
         """Busca um alerta pelo ID."""
@@ -42,6 +42,7 @@ class AlertaService:
             raise ValueError("Alerta não encontrado.")
         return alerta
 
+    @transactional
     async def criar(self, dados: dict[str, Any]) -> AlertaORM:
         """
         Cria um novo alerta.
@@ -71,6 +72,7 @@ class AlertaService:
         except IntegrityError as e:
             raise ValueError(f"Erro ao salvar alerta: {e}")
 
+    @transactional
     async def marcar_como_lida(self, id_alerta: int, user_id: UUID) -> AlertaORM:
         """
         Marca um alerta como lido.
@@ -89,38 +91,34 @@ class AlertaService:
             raise ValueError(f"Erro ao atualizar alerta: {e}")
 
     async def criar_alerta_automatico(
-        self, conteudo: str, user_id: UUID, session: AsyncSession, data: datetime = datetime.now()
-    ) -> AlertaORM:
+        self, conteudo: str, user_id: UUID, session: AsyncSession, data: datetime | None = None
+    ) -> AlertaOutboxORM:
         """
-        Cria um alerta automaticamente.
+        Registra a intenção de criar um alerta (outbox).
         Usado internamente quando eventos ocorrem (criação de meta, movimentação, etc).
+
+        O alerta não é inserido em `alerta` aqui: a intenção vai para `alerta_outbox` no
+        commit da operação que o originou (mesma transação, sem commit próprio) e o
+        `AlertaOutboxWorker` a entrega em lote logo depois.
         
         Args:
             conteudo: Mensagem do alerta
             user_id: ID do usuário que receberá o alerta
-            session: Sessão do banco de dados (para usar na mesma transação)
+            session: Sessão do banco de dados da operação chamadora
+            data: Data do alerta (padrão: agora)
         
         Returns:
-            AlertaORM criado
+            AlertaOutboxORM pendente na sessão
         """
         if not conteudo.strip():
             raise ValueError("Conteudo não pode ser vazio.")
         
-        novo_alerta = AlertaORM(
-            id_alerta=None,
+        intencao = AlertaOutboxORM(
             fk_pessoa_id_pessoa=user_id,
-            data=data,
+            data=data or datetime.now(),
             conteudo=conteudo,
-            lida=False,
         )
         
-        try:
-            # Adiciona à sessão e faz commit
-            session.add(novo_alerta)
-            await session.flush()
-            await session.commit()
-            await session.refresh(novo_alerta)
-            return novo_alerta
-        except IntegrityError as e:
-            await session.rollback()
-            raise ValueError(f"Erro ao criar alerta automático: {e}")
+        # Apenas adiciona à sessão: o INSERT vai junto com o flush/commit da operação chamadora
+        session.add(intencao)
+        return intencao
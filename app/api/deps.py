@@ -1,12 +1,13 @@
 """Dependências compartilhadas da API."""
-from typing import AsyncGenerator
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database import async_session_maker
+from app.shared.database import get_db
+from app.shared.redis import get_redis_client
 from app.identidade.services.sessao_service import SessaoService
 from app.identidade.repositories.sessao_repository_impl import SessaoRepositoryImpl
 from app.identidade.repositories.pessoa_repository_impl import PessoaRepositoryImpl
@@ -15,18 +16,14 @@ from app.identidade.repositories.pessoa_repository_impl import PessoaRepositoryI
 security = HTTPBearer(auto_error=False)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Fornece uma sessão de banco de dados assíncrona."""
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+async def get_redis() -> Redis:
+    """Fornece o cliente Redis compartilhado (pool criado no lifespan da aplicação)."""
+    return get_redis_client()
 
 
 async def get_sessao_service(session: AsyncSession = Depends(get_db)) -> SessaoService:
     """Fornece o serviço de sessão/autenticação."""
-    return SessaoService(SessaoRepositoryImpl(session), PessoaRepositoryImpl(session))
+    return SessaoService(SessaoRepositoryImpl(session), PessoaRepositoryImpl(session), session=session)
 
 
 async def get_current_user_id(
@@ -1,13 +1,12 @@
-from typing import List, AsyncGenerator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database import async_session_maker
 from app.comercial.repositories.assinatura_repository_impl import AssinaturaRepositoryImpl
 from app.comercial.services.assinatura_service import AssinaturaService
-from app.api.deps import get_current_user_id  # <-- NOVO: pega o id do usuário autenticado
+from app.api.deps import get_db, get_current_user_id  # <-- NOVO: pega o id do usuário autenticado
+from app.shared.pagination import PageParams, PageResponse, page_adapter, page_json, page_params
 from .assinatura_schema import (
     AssinaturaCreate,
     AssinaturaResponse,
@@ -16,23 +15,17 @@ from .assinatura_schema import (
 
 router = APIRouter(tags=["assinaturas"])
 
+ASSINATURA_PAGE = page_adapter(AssinaturaResponse)
+
 
 # -------------------------------------------------------------------------
 # Dependências
 # -------------------------------------------------------------------------
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
 async def get_assinatura_service(
     session: AsyncSession = Depends(get_db),
 ) -> AssinaturaService:
     repo = AssinaturaRepositoryImpl(session)
-    return AssinaturaService(repo)
+    return AssinaturaService(repo, session)
 
 
 # -------------------------------------------------------------------------
@@ -56,7 +49,7 @@ async def criar_assinatura(
         dados["fk_pessoa_id_pessoa"] = user_id  # <-- NOVO
 
         criada = await service.criar(dados)
-        return AssinaturaResponse.model_validate(criada.__dict__)
+        return AssinaturaResponse.model_validate(criada)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -64,14 +57,20 @@ async def criar_assinatura(
         )
 
 
-@router.get("/", response_model=List[AssinaturaResponse])
+@router.get("/", response_model=PageResponse[AssinaturaResponse])
 async def listar_assinaturas(
+    page: PageParams = Depends(page_params),
     service: AssinaturaService = Depends(get_assinatura_service),
-) -> List[AssinaturaResponse]:
-    """Lista todas as assinaturas (uso administrativo)."""
+) -> Response:
+    """Lista as assinaturas paginadas por cursor (uso administrativo)."""
     try:
-        assinaturas = await service.listar_todas()
-        return [AssinaturaResponse.model_validate(a.__dict__) for a in assinaturas]
+        assinaturas = await service.listar_todas(page)
+        return page_json(ASSINATURA_PAGE, assinaturas)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -99,7 +98,7 @@ async def buscar_assinatura(
                 detail="Você não tem permissão para acessar esta assinatura",
             )
 
-        return AssinaturaResponse.model_validate(assinatura.__dict__)
+        return AssinaturaResponse.model_validate(assinatura)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,7 +128,7 @@ async def atualizar_assinatura(
 
         dados = assinatura.model_dump(exclude_unset=True)
         atualizada = await service.atualizar(id_assinatura, dados)
-        return AssinaturaResponse.model_validate(atualizada.__dict__)
+        return AssinaturaResponse.model_validate(atualizada)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -187,7 +186,7 @@ async def renovar_assinatura(
             )
 
         renovada = await service.renovar(id_assinatura, meses)
-        return AssinaturaResponse.model_validate(renovada.__dict__)
+        return AssinaturaResponse.model_validate(renovada)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -215,7 +214,7 @@ async def cancelar_assinatura(
             )
 
         cancelada = await service.cancelar(id_assinatura)
-        return AssinaturaResponse.model_validate(cancelada.__dict__)
+        return AssinaturaResponse.model_validate(cancelada)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,8 +1,8 @@
-from typing import List, AsyncGenerator
+from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database import async_session_maker
+from app.api.deps import get_db
 from ..repositories.plano_repository_impl import PlanoRepositoryImpl
 from ..services.plano_service import PlanoService
 from .plano_schema import PlanoCreate, PlanoResponse, PlanoUpdate
@@ -14,17 +14,9 @@ router = APIRouter(tags=["planos"])
 # -------------------------------------------------------------------------
 # Dependências de injeção
 # -------------------------------------------------------------------------
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
 async def get_plano_service(session: AsyncSession = Depends(get_db)) -> PlanoService:
     repo = PlanoRepositoryImpl(session)
-    return PlanoService(repo)
+    return PlanoService(repo, session=session)
 
 
 # -------------------------------------------------------------------------
@@ -1,8 +1,8 @@
-from typing import List, AsyncGenerator
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database import async_session_maker
+from app.api.deps import get_db
+from app.shared.pagination import PageParams, PageResponse, page_adapter, page_json, page_params
 from ..repositories.solicitacao_pagamento_repository_impl import SolicitacaoPagamentoRepositoryImpl
 from ..services.solicitacao_pagamento_service import SolicitacaoPagamentoService
 from .solicitacao_pagamento_schema import (
@@ -13,23 +13,17 @@ from .solicitacao_pagamento_schema import (
 
 router = APIRouter(tags=["solicitacoes_pagamento"])
 
+SOLICITACAO_PAGE = page_adapter(SolicitacaoPagamentoResponse)
+
 
 # -------------------------------------------------------------------------
 # Dependências de injeção
 # -------------------------------------------------------------------------
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
 async def get_solicitacao_pagamento_service(
     session: AsyncSession = Depends(get_db),
 ) -> SolicitacaoPagamentoService:
     repo = SolicitacaoPagamentoRepositoryImpl(session)
-    return SolicitacaoPagamentoService(repo)
+    return SolicitacaoPagamentoService(repo, session)
 
 
 # -------------------------------------------------------------------------
@@ -54,14 +48,17 @@ async def criar_solicitacao_pagamento(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[SolicitacaoPagamentoResponse])
+@router.get("/", response_model=PageResponse[SolicitacaoPagamentoResponse])
 async def listar_solicitacoes_pagamento(
+    page: PageParams = Depends(page_params),
     service: SolicitacaoPagamentoService = Depends(get_solicitacao_pagamento_service),
-) -> List[SolicitacaoPagamentoResponse]:
-    """Lista todas as solicitações de pagamento."""
+) -> Response:
+    """Lista as solicitações de pagamento paginadas por cursor."""
     try:
-        solicitacoes = await service.listar_todas()
-        return [SolicitacaoPagamentoResponse.model_validate(s.__dict__) for s in solicitacoes]
+        solicitacoes = await service.listar_todas(page)
+        return page_json(SOLICITACAO_PAGE, solicitacoes)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import List, AsyncGenerator
+from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database import async_session_maker
+from app.api.deps import get_db
 from app.comercial.services.tipo_pagamento_service import TipoPagamentoService
 from app.comercial.repositories.tipo_pagamento_repository_impl import TipoPagamentoRepositoryImpl
 from .tipo_pagamento_schema import (
@@ -16,18 +16,9 @@ from .tipo_pagamento_schema import (
 router = APIRouter(tags=["tipos-pagamento"])
 
 
-# DB session
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
 # Service DI
 async def get_service(session: AsyncSession = Depends(get_db)) -> TipoPagamentoService:
-    return TipoPagamentoService(TipoPagamentoRepositoryImpl(session))
+    return TipoPagamentoService(TipoPagamentoRepositoryImpl(session), session=session)
 
 
 @router.post("/", response_model=TipoPagamentoResponse, status_code=status.HTTP_201_CREATED)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import Date, ForeignKey, Integer, String
+from sqlalchemy import Date, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,10 @@ from app.shared.database import Base
 
 class AssinaturaORM(Base):
     __tablename__ = "assinatura"
+    __table_args__ = (
+        Index("ix_assinatura_fk_pessoa_id_pessoa", "fk_pessoa_id_pessoa"),
+        Index("ix_assinatura_fk_plano_id_plano", "fk_plano_id_plano"),
+    )
 
     id_assinatura: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Float, Integer, String
+from sqlalchemy import Float, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shared.database import Base
@@ -8,6 +8,7 @@ from app.shared.database import Base
 
 class PlanoORM(Base):
     __tablename__ = "plano"
+    __table_args__ = (Index("ix_plano_titulo", "titulo"),)
 
     id_plano: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     titulo: Mapped[str] = mapped_column(String, nullable=False)
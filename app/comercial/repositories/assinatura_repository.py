@@ -1,10 +1,13 @@
 """Interface do repositório de Assinatura."""
 
 from collections.abc import Iterable
-from typing import Protocol
+from typing import Any, Protocol
 from uuid import UUID
 
+from sqlalchemy import Row
+
 from app.comercial.persistence.assinatura_orm import AssinaturaORM
+from app.shared.pagination import Page, PageParams
 
 
 class AssinaturaRepository(Protocol):
@@ -22,8 +25,8 @@ class AssinaturaRepository(Protocol):
         """Lista assinaturas por plano."""
         ...
 
-    async def list_all(self) -> Iterable[AssinaturaORM]:
-        """Lista todas as assinaturas."""
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todas as assinaturas."""
         ...
 
     async def add(self, assinatura: AssinaturaORM) -> AssinaturaORM:
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Row, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.comercial.persistence.assinatura_orm import AssinaturaORM
 from app.comercial.repositories.assinatura_repository import AssinaturaRepository
+from app.shared.pagination import Page, PageParams, paginate
 
 
 class AssinaturaRepositoryImpl(AssinaturaRepository):
@@ -29,26 +31,23 @@ class AssinaturaRepositoryImpl(AssinaturaRepository):
         result = await self.session.execute(select(AssinaturaORM).where(AssinaturaORM.fk_plano_id_plano == id_plano))
         return list(result.scalars())
 
-    async def list_all(self) -> list[AssinaturaORM]:
-        """Lista todas as assinaturas cadastradas."""
-        result = await self.session.execute(select(AssinaturaORM))
-        return list(result.scalars())
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todas as assinaturas cadastradas, em ordem de ID (linhas)."""
+        stmt = select(*AssinaturaORM.__table__.columns)
+        return await paginate(self.session, stmt, [AssinaturaORM.id_assinatura], page)
 
     async def add(self, assinatura: AssinaturaORM) -> AssinaturaORM:
         """Cria uma nova assinatura."""
         self.session.add(assinatura)
-        await self.session.commit()
-        await self.session.refresh(assinatura)
+        await self.session.flush()
         return assinatura
 
     async def update(self, assinatura: AssinaturaORM) -> AssinaturaORM:
         """Atualiza uma assinatura existente."""
         merged = await self.session.merge(assinatura)
-        await self.session.commit()
-        await self.session.refresh(merged)
+        await self.session.flush()
         return merged
 
     async def delete(self, id_assinatura: int) -> None:
         """Remove uma assinatura pelo ID."""
         await self.session.execute(delete(AssinaturaORM).where(AssinaturaORM.id_assinatura == id_assinatura))
-        await self.session.commit()
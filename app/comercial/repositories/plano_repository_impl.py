@@ -31,17 +31,14 @@ class PlanoRepositoryImpl(PlanoRepository):
         """Adiciona um novo plano."""
         self.session.add(plano)
         await self.session.flush()
-        await self.session.commit()
-        await self.session.refresh(plano)
         return plano
 
     async def update(self, plano: PlanoORM) -> PlanoORM:
         """Atualiza um plano existente."""
         merged = await self.session.merge(plano)
-        await self.session.commit()
+        await self.session.flush()
         return merged
 
     async def delete(self, id_plano: int) -> None:
         """Remove um plano pelo ID."""
         await self.session.execute(delete(PlanoORM).where(PlanoORM.id_plano == id_plano))
-        await self.session.commit()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Any, Protocol
 from collections.abc import Iterable  # <- em vez de typing.Iterable
+
+from sqlalchemy import Row
+
 from app.comercial.persistence.solicitacao_pagamento_orm import SolicitacaoPagamentoORM
+from app.shared.pagination import Page, PageParams
 
 
 class SolicitacaoPagamentoRepository(Protocol):
@@ -10,7 +14,7 @@ class SolicitacaoPagamentoRepository(Protocol):
 
     async def get_by_id(self, id_solicitacao: int) -> SolicitacaoPagamentoORM | None: ...
     async def list_by_assinatura(self, id_assinatura: int) -> Iterable[SolicitacaoPagamentoORM]: ...
-    async def list_all(self) -> Iterable[SolicitacaoPagamentoORM]: ...
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]: ...
     async def add(self, solicitacao: SolicitacaoPagamentoORM) -> SolicitacaoPagamentoORM: ...
     async def update(self, solicitacao: SolicitacaoPagamentoORM) -> SolicitacaoPagamentoORM: ...
     async def delete(self, id_solicitacao: int) -> None: ...
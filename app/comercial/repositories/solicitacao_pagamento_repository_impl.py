@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import delete, select
+from typing import Any
+
+from sqlalchemy import Row, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.comercial.persistence.solicitacao_pagamento_orm import SolicitacaoPagamentoORM
 from app.comercial.repositories.solicitacao_pagamento_repository import (
     SolicitacaoPagamentoRepository,
 )
+from app.shared.pagination import Page, PageParams, paginate
 
 
 class SolicitacaoPagamentoRepositoryImpl(SolicitacaoPagamentoRepository):
@@ -26,23 +29,22 @@ class SolicitacaoPagamentoRepositoryImpl(SolicitacaoPagamentoRepository):
         )
         return list(result.scalars())
 
-    async def list_all(self) -> list[SolicitacaoPagamentoORM]:
-        """Lista todas as solicitações de pagamento."""
-        result = await self.session.execute(select(SolicitacaoPagamentoORM))
-        return list(result.scalars())
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todas as solicitações de pagamento, em ordem de ID (linhas)."""
+        keys = [SolicitacaoPagamentoORM.id_solicitacao]
+        stmt = select(*SolicitacaoPagamentoORM.__table__.columns)
+        return await paginate(self.session, stmt, keys, page)
 
     async def add(self, solicitacao: SolicitacaoPagamentoORM) -> SolicitacaoPagamentoORM:
         """Adiciona uma nova solicitação."""
         self.session.add(solicitacao)
-        await self.session.commit()  # grava no banco
-        await self.session.refresh(solicitacao)  # garante id/data_hora atualizados
+        await self.session.flush()  # envia o INSERT e preenche o id
         return solicitacao
 
     async def update(self, solicitacao: SolicitacaoPagamentoORM) -> SolicitacaoPagamentoORM:
         """Atualiza uma solicitação existente."""
         merged = await self.session.merge(solicitacao)
-        await self.session.commit()
-        await self.session.refresh(merged)
+        await self.session.flush()
         return merged
 
     async def delete(self, id_solicitacao: int) -> None:
@@ -50,4 +52,3 @@ class SolicitacaoPagamentoRepositoryImpl(SolicitacaoPagamentoRepository):
         await self.session.execute(
             delete(SolicitacaoPagamentoORM).where(SolicitacaoPagamentoORM.id_solicitacao == id_solicitacao)
         )
-        await self.session.commit()
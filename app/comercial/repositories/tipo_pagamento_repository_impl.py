@@ -30,26 +30,20 @@ class TipoPagamentoRepositoryImpl(TipoPagamentoRepository):
         try:
             self.session.add(tipo_pagamento)
             await self.session.flush()
-            await self.session.commit()
-            await self.session.refresh(tipo_pagamento)
             return tipo_pagamento
         except Exception as e:
-            await self.session.rollback()
             raise ValueError(f"Erro ao criar tipo_pagamento: {str(e)}")
 
     async def delete(self, id_pagamento: int) -> None:
         try:
             await self.session.execute(delete(TipoPagamentoORM).where(TipoPagamentoORM.id_pagamento == id_pagamento))
-            await self.session.commit()
         except Exception as e:
-            await self.session.rollback()
             raise ValueError(f"Erro ao deletar tipo_pagamento: {str(e)}")
 
     async def update(self, tipo_pagamento: TipoPagamentoORM) -> TipoPagamentoORM:
         try:
             merged = await self.session.merge(tipo_pagamento)
-            await self.session.commit()
+            await self.session.flush()
             return merged
         except Exception as e:
-            await self.session.rollback()
             raise ValueError(f"Erro ao atualizar tipo_pagamento: {str(e)}")
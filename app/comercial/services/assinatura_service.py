@@ -2,25 +2,30 @@ from datetime import date, timedelta
 from typing import Any, List
 from uuid import UUID
 
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.comercial.persistence.assinatura_orm import AssinaturaORM
 from app.comercial.repositories.assinatura_repository import AssinaturaRepository
+from app.shared.pagination import Page, PageParams
+from app.shared.transaction_service import transactional
 
 
 class AssinaturaService:
     """Camada de regras de negócio de Assinatura."""
 
-    def __init__(self, repo: AssinaturaRepository):
+    def __init__(self, repo: AssinaturaRepository, session: AsyncSession | None = None):
         self.repo = repo
+        self.session = session
 
     # -------------------------------------------------------------------------
     # CRUD principal
     # -------------------------------------------------------------------------
 
-    async def listar_todas(self) -> List[AssinaturaORM]:
-        """Lista todas as assinaturas (uso administrativo)."""
-        return await self.repo.list_all()
+    async def listar_todas(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todas as assinaturas (uso administrativo)."""
+        return await self.repo.list_all(page)
 
     async def listar_por_pessoa(self, id_pessoa: UUID) -> List[AssinaturaORM]:
         """Lista todas as assinaturas vinculadas a uma pessoa."""
@@ -37,6 +42,7 @@ class AssinaturaService:
             raise ValueError("Assinatura não encontrada.")
         return assinatura
 
+    @transactional
     async def criar(self, dados: dict[str, Any]) -> AssinaturaORM:
         """
         Cria uma nova assinatura.
@@ -85,6 +91,7 @@ class AssinaturaService:
         except IntegrityError as e:
             raise ValueError(f"Erro ao criar assinatura: {e}")
 
+    @transactional
     async def atualizar(self, id_assinatura: int, dados: dict[str, Any]) -> AssinaturaORM:
         """Atualiza uma assinatura existente."""
         assinatura = await self.repo.get_by_id(id_assinatura)
@@ -103,6 +110,7 @@ class AssinaturaService:
         except IntegrityError as e:
             raise ValueError(f"Erro ao atualizar assinatura: {e}")
 
+    @transactional
     async def remover(self, id_assinatura: int) -> None:
         """Remove uma assinatura existente."""
         assinatura = await self.repo.get_by_id(id_assinatura)
@@ -114,6 +122,7 @@ class AssinaturaService:
     # Regras de negócio adicionais
     # -------------------------------------------------------------------------
 
+    @transactional
     async def renovar(self, id_assinatura: int, meses: int = 1) -> AssinaturaORM:
         """
         Renova uma assinatura existente, estendendo o período.
@@ -137,6 +146,7 @@ class AssinaturaService:
 
         return await self.repo.update(assinatura)
 
+    @transactional
     async def cancelar(self, id_assinatura: int) -> AssinaturaORM:
         """Cancela uma assinatura (define status='cancelada')."""
         assinatura = await self.repo.get_by_id(id_assinatura)
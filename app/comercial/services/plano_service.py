@@ -1,29 +1,61 @@
 from typing import Any, List
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.comercial.persistence.plano_orm import PlanoORM
 from app.comercial.repositories.plano_repository import PlanoRepository
+from app.core.settings import settings
+from app.shared.cache import TwoTierCache
+from app.shared.transaction import UnitOfWork
+
+# Catálogo de planos (LRU local + Redis). Lido a cada visualização do checkout e
+# raramente alterado; toda escrita deste serviço invalida o namespace inteiro, logo
+# após o commit (invalidar antes deixaria outro processo recarregar o dado antigo).
+plano_cache = TwoTierCache(
+    "comercial:plano",
+    ttl=settings.catalog_cache_ttl_seconds,
+    local_ttl=settings.catalog_cache_local_ttl_seconds,
+    local_maxsize=settings.catalog_cache_local_max_size,
+)
+
+
+def _to_dict(plano: PlanoORM) -> dict[str, Any]:
+    return {coluna.key: getattr(plano, coluna.key) for coluna in PlanoORM.__table__.columns}
 
 
 class PlanoService:
     """Camada de regras de negócio de Plano."""
 
-    def __init__(self, repo: PlanoRepository):
+    def __init__(self, repo: PlanoRepository, cache: TwoTierCache | None = None, session: AsyncSession | None = None):
         self.repo = repo
+        self.cache = plano_cache if cache is None else cache
+        self.session = session
 
     # -------------------------------------------------------------------------
     # CRUD principal
     # -------------------------------------------------------------------------
 
     async def listar_todos(self) -> List[PlanoORM]:
-        """Lista todos os planos cadastrados."""
-        return await self.repo.list_all()
+        """Lista todos os planos cadastrados (servido pelo cache do catálogo).
+
+        Os objetos retornados são transientes (reconstruídos do cache), apenas para leitura.
+        """
+
+        async def carregar() -> list[dict[str, Any]]:
+            return [_to_dict(p) for p in await self.repo.list_all()]
+
+        return [PlanoORM(**dados) for dados in await self.cache.get_or_load("all", carregar)]
 
     async def buscar_por_id(self, id_plano: int) -> PlanoORM:
-        """Busca um plano específico pelo ID."""
-        plano = await self.repo.get_by_id(id_plano)
-        if not plano:
+        """Busca um plano específico pelo ID (servido pelo cache do catálogo)."""
+
+        async def carregar() -> dict[str, Any] | None:
+            plano = await self.repo.get_by_id(id_plano)
+            return _to_dict(plano) if plano else None
+
+        dados = await self.cache.get_or_load(f"id:{id_plano}", carregar)
+        if not dados:
             raise ValueError("Plano não encontrado.")
-        return plano
+        return PlanoORM(**dados)
 
     async def buscar_por_titulo(self, titulo: str) -> PlanoORM:
         """Busca um plano específico pelo título."""
@@ -62,9 +94,12 @@ class PlanoService:
         novo_plano = PlanoORM(**dados)
 
         try:
-            return await self.repo.add(novo_plano)
+            async with UnitOfWork(self.session):
+                criado = await self.repo.add(novo_plano)
         except IntegrityError as e:
             raise ValueError(f"Erro ao salvar plano: {e}")
+        await self.cache.invalidate()
+        return criado
 
     async def atualizar(self, id_plano: int, dados: dict[str, Any]) -> PlanoORM:
         """Atualiza os dados de um plano existente."""
@@ -82,16 +117,21 @@ class PlanoService:
             raise ValueError("A duração mínima de um plano é de 1 mês.")
 
         try:
-            return await self.repo.update(plano)
+            async with UnitOfWork(self.session):
+                atualizado = await self.repo.update(plano)
         except IntegrityError as e:
             raise ValueError(f"Erro ao atualizar plano: {e}")
+        await self.cache.invalidate()
+        return atualizado
 
     async def remover(self, id_plano: int) -> None:
         """Remove um plano existente."""
         plano = await self.repo.get_by_id(id_plano)
         if not plano:
             raise ValueError("Plano não encontrado.")
-        await self.repo.delete(id_plano)
+        async with UnitOfWork(self.session):
+            await self.repo.delete(id_plano)
+        await self.cache.invalidate()
 
     # -------------------------------------------------------------------------
     # Regras adicionais (opcionais)
@@ -103,7 +143,10 @@ class PlanoService:
         if not plano:
             raise ValueError("Plano não encontrado.")
         plano.status = "ativo"
-        return await self.repo.update(plano)
+        async with UnitOfWork(self.session):
+            atualizado = await self.repo.update(plano)
+        await self.cache.invalidate()
+        return atualizado
 
     async def desativar(self, id_plano: int) -> PlanoORM:
         """Desativa um plano (define status='inativo')."""
@@ -111,4 +154,7 @@ class PlanoService:
         if not plano:
             raise ValueError("Plano não encontrado.")
         plano.status = "inativo"
-        return await self.repo.update(plano)
+        async with UnitOfWork(self.session):
+            atualizado = await self.repo.update(plano)
+        await self.cache.invalidate()
+        return atualizado
@@ -1,26 +1,31 @@
 from datetime import datetime
 from typing import Any, List
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.comercial.persistence.solicitacao_pagamento_orm import SolicitacaoPagamentoORM
 from app.comercial.repositories.solicitacao_pagamento_repository import (
     SolicitacaoPagamentoRepository,
 )
+from app.shared.pagination import Page, PageParams
+from app.shared.transaction_service import transactional
 
 
 class SolicitacaoPagamentoService:
     """Camada de regras de negócio de Solicitação de Pagamento."""
 
-    def __init__(self, repo: SolicitacaoPagamentoRepository):
+    def __init__(self, repo: SolicitacaoPagamentoRepository, session: AsyncSession | None = None):
         self.repo = repo
+        self.session = session
 
     # -------------------------------------------------------------------------
     # CRUD principal
     # -------------------------------------------------------------------------
 
-    async def listar_todas(self) -> List[SolicitacaoPagamentoORM]:
-        """Lista todas as solicitações de pagamento (uso administrativo)."""
-        return await self.repo.list_all()
+    async def listar_todas(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todas as solicitações de pagamento (uso administrativo)."""
+        return await self.repo.list_all(page)
 
     async def listar_por_assinatura(self, id_assinatura: int) -> List[SolicitacaoPagamentoORM]:
         """Lista solicitações vinculadas a uma assinatura específica."""
@@ -33,6 +38,7 @@ class SolicitacaoPagamentoService:
             raise ValueError("Solicitação de pagamento não encontrada.")
         return solicitacao
 
+    @transactional
     async def criar(self, dados: dict[str, Any]) -> SolicitacaoPagamentoORM:
         """
         Cria uma nova solicitação de pagamento.
@@ -63,6 +69,7 @@ class SolicitacaoPagamentoService:
             raise ValueError(f"Erro ao salvar solicitação: {e}")
 
 
+    @transactional
     async def remover(self, id_solicitacao: int) -> None:
         """Remove uma solicitação existente."""
         solicitacao = await self.repo.get_by_id(id_solicitacao)
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any, Sequence
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.comercial.domain.tipo_pagamento import TipoPagamento
 from app.comercial.persistence.tipo_pagamento_orm import TipoPagamentoORM
 from app.comercial.repositories.tipo_pagamento_repository import TipoPagamentoRepository
 from app.comercial.mappers.tipo_pagamento_mapper import orm_to_model, model_to_orm_new
+from app.core.settings import settings
+from app.shared.cache import TwoTierCache
+from app.shared.transaction import UnitOfWork
+
+# Catálogo de tipos de pagamento (LRU local + Redis); invalidado após o commit de cada escrita.
+tipo_pagamento_cache = TwoTierCache(
+    "comercial:tipo_pagamento",
+    ttl=settings.catalog_cache_ttl_seconds,
+    local_ttl=settings.catalog_cache_local_ttl_seconds,
+    local_maxsize=settings.catalog_cache_local_max_size,
+)
 
 
 class TipoPagamentoService:
     """Regras de negócio para Tipo de Pagamento."""
 
-    def __init__(self, repo: TipoPagamentoRepository) -> None:
+    def __init__(
+        self,
+        repo: TipoPagamentoRepository,
+        cache: TwoTierCache | None = None,
+        session: AsyncSession | None = None,
+    ) -> None:
         self.repo = repo
+        self.cache = tipo_pagamento_cache if cache is None else cache
+        self.session = session
 
     async def criar(self, data: dict[str, Any]) -> TipoPagamento:
         try:
@@ -23,26 +44,38 @@ class TipoPagamentoService:
             if existente:
                 raise ValueError("Tipo de pagamento já cadastrado")
 
-            created_orm = await self.repo.add(model_to_orm_new(tp))
+            async with UnitOfWork(self.session):
+                created_orm = await self.repo.add(model_to_orm_new(tp))
+            await self.cache.invalidate()
             return orm_to_model(created_orm)
         except Exception as e:
             raise ValueError(f"Erro ao criar tipo de pagamento: {str(e)}")
 
     async def listar(self) -> list[TipoPagamento]:
-        itens = await self.repo.list_all()
-        return [orm_to_model(i) for i in itens] if itens else []
+        async def carregar() -> list[dict[str, Any]]:
+            return [asdict(orm_to_model(i)) for i in await self.repo.list_all()]
+
+        return [TipoPagamento(**d) for d in await self.cache.get_or_load("all", carregar)]
 
     async def buscar_por_id(self, id_pagamento: int) -> TipoPagamento:
-        orm = await self.repo.get_by_id(id_pagamento)
-        if not orm:
+        async def carregar() -> dict[str, Any] | None:
+            orm = await self.repo.get_by_id(id_pagamento)
+            return asdict(orm_to_model(orm)) if orm else None
+
+        dados = await self.cache.get_or_load(f"id:{id_pagamento}", carregar)
+        if not dados:
             raise ValueError("Tipo de pagamento não encontrado")
-        return orm_to_model(orm)
+        return TipoPagamento(**dados)
 
     async def buscar_por_tipo(self, tipo: str) -> TipoPagamento:
-        orm = await self.repo.get_by_tipo(tipo)
-        if not orm:
+        async def carregar() -> dict[str, Any] | None:
+            orm = await self.repo.get_by_tipo(tipo)
+            return asdict(orm_to_model(orm)) if orm else None
+
+        dados = await self.cache.get_or_load(f"tipo:{tipo}", carregar)
+        if not dados:
             raise ValueError("Tipo de pagamento não encontrado")
-        return orm_to_model(orm)
+        return TipoPagamento(**dados)
 
     async def atualizar(self, id_pagamento: int, data: dict[str, Any]) -> TipoPagamento:
         try:
@@ -60,7 +93,9 @@ class TipoPagamentoService:
                     raise ValueError("Já existe outro registro com este tipo_pagamento")
                 atual.tipo_pagamento = data["tipo_pagamento"]
 
-            updated = await self.repo.update(atual)
+            async with UnitOfWork(self.session):
+                updated = await self.repo.update(atual)
+            await self.cache.invalidate()
             return orm_to_model(updated)
         except Exception as e:
             raise ValueError(f"Erro ao atualizar tipo de pagamento: {str(e)}")
@@ -69,7 +104,9 @@ class TipoPagamentoService:
         existe = await self.repo.get_by_id(id_pagamento)
         if not existe:
             raise ValueError("Tipo de pagamento não encontrado")
-        await self.repo.delete(id_pagamento)
+        async with UnitOfWork(self.session):
+            await self.repo.delete(id_pagamento)
+        await self.cache.invalidate()
 
     # utilitários (mesmo padrão dos outros serviços)
     @staticmethod
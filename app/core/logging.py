@@ -1 +1,197 @@
-"""Module logging."""
+"""Queue-based logging: JSON lines written by a background thread, tagged with the request id.
+
+Log calls made by request coroutines only put the record on an in-memory queue
+(:class:`ContextQueueHandler`); a :class:`~logging.handlers.QueueListener` thread formats it and
+writes to stdout. A slow container stdout therefore never blocks the event loop.
+
+While a request is being served (see :class:`RequestContextMiddleware`), every record carries its
+``request_id`` and ``elapsed_ms`` since the request started. The middleware also writes one
+``app.access`` record per request with method, path, status and ``duration_ms``.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TextIO
+
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+access_logger = logging.getLogger("app.access")
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+@dataclass(frozen=True)
+class RequestContext:
+    request_id: str
+    started: float
+
+
+_request_context: ContextVar[RequestContext | None] = ContextVar("request_context", default=None)
+
+
+def current_request_id() -> str | None:
+    ctx = _request_context.get()
+    return ctx.request_id if ctx else None
+
+
+# ────────────────────────── Formatters ──────────────────────────
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, request context and extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update((k, v) for k, v in vars(record).items() if k not in _RECORD_ATTRS)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines for local development (``LOG_JSON=false``)."""
+
+    def __init__(self) -> None:
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "request_id"):
+            record.request_id = "-"
+        return super().format(record)
+
+
+# ─────────────────────────── Pipeline ───────────────────────────
+
+
+class ContextQueueHandler(QueueHandler):
+    """Enqueue records for the listener thread, capturing the request context first.
+
+    Only cheap work happens in the caller: merging ``args`` into the message and reading the
+    context variables (which the listener thread cannot see). Formatting, including tracebacks,
+    is left to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        ctx = _request_context.get()
+        if ctx is not None:
+            record.request_id = ctx.request_id
+            record.elapsed_ms = round((time.perf_counter() - ctx.started) * 1000, 1)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class LoggingPipeline:
+    """The installed queue handler and its listener; :meth:`stop` flushes and restores the root logger."""
+
+    def __init__(
+        self, listener: QueueListener, handler: QueueHandler, previous: list[logging.Handler], level: int
+    ) -> None:
+        self.listener = listener
+        self.handler = handler
+        self._previous = previous
+        self._previous_level = level
+
+    def stop(self) -> None:
+        root = logging.getLogger()
+        self.listener.stop()  # drains the queue before returning
+        root.removeHandler(self.handler)
+        for handler in self._previous:
+            root.addHandler(handler)
+        root.setLevel(self._previous_level)
+
+
+def configure_logging(
+    level: str | int = "INFO", *, json_format: bool = True, stream: TextIO | None = None
+) -> LoggingPipeline:
+    """Route the root logger (and uvicorn's loggers) through a queue to a background writer thread."""
+    root = logging.getLogger()
+    previous, previous_level = list(root.handlers), root.level
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if json_format else TextFormatter())
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = ContextQueueHandler(log_queue)
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+
+    for existing in previous:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    # uvicorn and SQLAlchemy's ``echo`` install their own (synchronous) stream handlers; send their
+    # records through the queue instead. uvicorn's access log is replaced by the app.access record,
+    # which has the request id and duration.
+    for name in ("uvicorn", "uvicorn.error", "sqlalchemy.engine.Engine"):
+        logging.getLogger(name).handlers.clear()
+        logging.getLogger(name).propagate = True
+    logging.getLogger("uvicorn.access").disabled = True
+
+    listener.start()
+    return LoggingPipeline(listener, handler, previous, previous_level)
+
+
+# ─────────────────────────── Middleware ───────────────────────────
+
+
+class RequestContextMiddleware:
+    """Assign a request id (or reuse the caller's ``X-Request-ID``), echo it back and log the access."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = MutableHeaders(scope=scope).get(REQUEST_ID_HEADER)
+        request_id = incoming if incoming and len(incoming) <= 128 else uuid.uuid4().hex
+        ctx = RequestContext(request_id, time.perf_counter())
+        token = _request_context.set(ctx)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            access_logger.info(
+                "%s %s %s",
+                scope["method"],
+                scope["path"],
+                status,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - ctx.started) * 1000, 1),
+                },
+            )
+            _request_context.reset(token)
@@ -0,0 +1,373 @@
+"""Prometheus metrics: HTTP latency, DB pool and per-request query cost, Pluggy calls.
+
+Everything is registered on the default ``prometheus_client`` registry and served by ``/metrics``
+(see :func:`metrics_response`). Together they split a slow request into its parts: time waiting
+for a pooled connection, time inside Postgres, and the rest (CPU, serialization, external calls).
+
+- :class:`PrometheusMiddleware` times every request per route template and tracks in-flight ones.
+- :func:`instrument_engine` hooks SQLAlchemy events: query durations, pool checkout wait and
+  connections in use. Queries run while a request is being served are also attributed to it.
+- :class:`InstrumentedTransport` wraps the Pluggy ``httpx`` transport.
+- :func:`track_workers` exposes the background workers' :class:`~app.workers.base.WorkerStats`.
+- :func:`track_queries` counts the statements run in a block (query budgets in tests) and
+  :class:`QueryCountMiddleware` reports them per request in debug, flagging likely N+1 loops.
+
+Metrics are per process; with several uvicorn workers, scrape each one (or aggregate upstream).
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from fastapi import Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+if TYPE_CHECKING:
+    from app.workers.base import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+# Finer than the client default at the low end: most queries and cached routes finish in < 5 ms.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+# The same SQL text this many times in one request is most likely a query in a loop (N+1)
+N_PLUS_ONE_THRESHOLD = 3
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge("http_requests_in_progress", "HTTP requests being served", ["method"])
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request",
+    ["method", "route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Total time spent executing SQL per HTTP request",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram("db_query_duration_seconds", "SQL statement execution time", buckets=LATENCY_BUCKETS)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time from a session's first statement until it holds a pooled connection",
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_IN_USE = Gauge("db_pool_connections_in_use", "Pooled DB connections currently checked out")
+PLUGGY_REQUEST_DURATION = Histogram(
+    "pluggy_request_duration_seconds",
+    "Pluggy API call latency",
+    ["method", "endpoint", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+PLUGGY_REQUEST_ERRORS = Counter(
+    "pluggy_request_errors_total",
+    "Pluggy API calls that failed without a response (timeouts, connection errors)",
+    ["method", "endpoint"],
+)
+
+
+@dataclass
+class RequestDbStats:
+    """SQL executed on behalf of the current request (or a :func:`track_queries` block).
+
+    Trackers nest: a statement is counted on the active one and on every enclosing one, so a test
+    budget around a request still sees the queries the request middlewares track for themselves.
+    """
+
+    queries: int = 0
+    duration: float = 0.0
+    statements: collections.Counter[str] = field(default_factory=collections.Counter)  # by SQL text
+    parent: RequestDbStats | None = field(default=None, repr=False)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        stats: RequestDbStats | None = self
+        while stats is not None:
+            stats.queries += 1
+            stats.duration += elapsed
+            stats.statements[statement] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict[str, int]:
+        """Statements run at least ``threshold`` times: the same query in a loop (N+1)."""
+        return {sql: n for sql, n in self.statements.items() if n >= threshold}
+
+    def report(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> str:
+        lines = [f"{self.queries} statements"]
+        lines += [f"  {n}x {' '.join(sql.split())[:200]}" for sql, n in self.repeated(threshold).items()]
+        return "\n".join(lines)
+
+
+_request_db: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestDbStats]:
+    """Count the statements executed in this context (requires :func:`instrument_engine`)."""
+    stats = RequestDbStats(parent=_request_db.get())
+    token = _request_db.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_db.reset(token)
+
+
+_STARTED_AT = "metrics_started_at"
+
+
+def metrics_response() -> Response:
+    """Render the default registry in the Prometheus text exposition format."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# ────────────────────────────── HTTP ──────────────────────────────
+
+
+def route_template(scope: Scope) -> str:
+    """Route path template of a routed request (``/api/v1/metas/{id_meta}``), for low-cardinality labels.
+
+    Included routers may hand back the route as declared in its own router (``/{id_meta}``); the
+    prefix is recovered from the concrete path. Unrouted requests (404s) share one label.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+    path: str = scope["path"]
+    try:
+        rendered = template.format(**{k: str(v) for k, v in scope.get("path_params", {}).items()})
+    except (KeyError, IndexError, ValueError):
+        return template
+    if rendered != path and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class PrometheusMiddleware:
+    """Pure ASGI middleware recording latency, in-flight requests and per-request SQL cost."""
+
+    def __init__(self, app: ASGIApp, *, exclude_paths: frozenset[str] = frozenset({"/metrics"})) -> None:
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                elapsed = time.perf_counter() - started
+                in_progress.dec()
+        route = route_template(scope)
+        HTTP_REQUEST_DURATION.labels(method, route, str(status)).observe(elapsed)
+        HTTP_REQUEST_DB_QUERIES.labels(method, route).observe(stats.queries)
+        HTTP_REQUEST_DB_DURATION.labels(method, route).observe(stats.duration)
+
+
+class QueryCountMiddleware:
+    """Debug-only ASGI middleware: per-request statement count and N+1 warnings.
+
+    Adds ``X-DB-Query-Count`` and ``X-DB-Repeated-Queries`` (statements over the N+1 threshold) to
+    every response and logs the repeated SQL. Statements run after the response headers are sent
+    (streaming bodies) are not included. Needs :func:`instrument_engine`.
+    """
+
+    def __init__(self, app: ASGIApp, *, threshold: int = N_PLUS_ONE_THRESHOLD) -> None:
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    repeated = stats.repeated(self.threshold)
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.queries)
+                    headers["X-DB-Repeated-Queries"] = str(len(repeated))
+                    if repeated:
+                        logger.warning(
+                            "Possible N+1 in %s %s: %s",
+                            scope["method"],
+                            scope["path"],
+                            stats.report(self.threshold),
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+# ─────────────────────────────── DB ───────────────────────────────
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    conn.info[_STARTED_AT] = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    started = conn.info.pop(_STARTED_AT, None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    DB_QUERY_DURATION.observe(elapsed)
+    stats = _request_db.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def _mark_checkout_start(orm_execute_state: Any) -> None:
+    session = orm_execute_state.session
+    if not session.in_transaction():
+        session.info[_STARTED_AT] = time.perf_counter()
+
+
+def _observe_checkout(session: Session, transaction: Any, connection: Any) -> None:
+    started = session.info.pop(_STARTED_AT, None)
+    if started is not None:
+        DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach the query/pool listeners to ``engine`` (idempotent).
+
+    Checkout wait is measured at the session level (first statement → ``after_begin``): the pool
+    has no "checkout requested" event. It includes a connect and pre-ping when those happen.
+    """
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    if not event.contains(Session, "do_orm_execute", _mark_checkout_start):
+        event.listen(Session, "do_orm_execute", _mark_checkout_start)
+        event.listen(Session, "after_begin", _observe_checkout)
+
+    checkedout = getattr(sync_engine.pool, "checkedout", None)  # NullPool keeps no count
+    if checkedout is not None:
+        DB_POOL_IN_USE.set_function(checkedout)
+
+
+# ───────────────────────────── Pluggy ─────────────────────────────
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """``httpx`` transport wrapper timing Pluggy calls; labels use the first path segment only."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = "/" + request.url.path.strip("/").split("/", 1)[0]
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.HTTPError:
+            PLUGGY_REQUEST_ERRORS.labels(request.method, endpoint).inc()
+            raise
+        PLUGGY_REQUEST_DURATION.labels(request.method, endpoint, str(response.status_code)).observe(
+            time.perf_counter() - started
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# ───────────────────────────── Workers ─────────────────────────────
+
+
+class WorkerCollector(Collector):
+    """Reads each worker's ``WorkerStats`` at scrape time, labelled by worker name.
+
+    Only numbers are exported: ``last_error`` (which may hold SQL or connection details) stays in
+    the logs; ``worker_last_run_failed`` tells whether the last run raised.
+    """
+
+    def __init__(self) -> None:
+        self.workers: Sequence[PeriodicWorker] = ()
+
+    def collect(self) -> Iterable[Metric]:
+        by_worker = ["worker"]
+        runs = CounterMetricFamily("worker_runs", "Worker runs since process start", labels=by_worker)
+        failures = CounterMetricFamily("worker_failures", "Worker runs that raised", labels=by_worker)
+        rows = CounterMetricFamily("worker_rows_processed", "Rows processed by worker runs", labels=by_worker)
+        busy = CounterMetricFamily("worker_run_duration_seconds", "Time spent in worker runs", labels=by_worker)
+        last_duration = GaugeMetricFamily("worker_last_run_duration_seconds", "Last run duration", labels=by_worker)
+        last_rows = GaugeMetricFamily("worker_last_run_rows", "Rows processed by the last run", labels=by_worker)
+        last_run = GaugeMetricFamily("worker_last_run_timestamp_seconds", "Last run start (unix)", labels=by_worker)
+        last_failed = GaugeMetricFamily("worker_last_run_failed", "1 if the last run raised", labels=by_worker)
+        running = GaugeMetricFamily("worker_running", "1 while the worker loop is scheduled", labels=by_worker)
+
+        for worker in self.workers:
+            stats, label = worker.stats, [worker.name]
+            runs.add_metric(label, stats.runs)
+            failures.add_metric(label, stats.failures)
+            rows.add_metric(label, stats.rows_processed)
+            busy.add_metric(label, stats.total_duration_seconds)
+            last_duration.add_metric(label, stats.last_duration_seconds)
+            last_rows.add_metric(label, stats.last_rows)
+            if stats.last_run_at is not None:
+                last_run.add_metric(label, stats.last_run_at.timestamp())
+            last_failed.add_metric(label, 1.0 if stats.last_error is not None else 0.0)
+            running.add_metric(label, 1.0 if worker.running else 0.0)
+
+        return [runs, failures, rows, busy, last_duration, last_rows, last_run, last_failed, running]
+
+
+WORKERS = WorkerCollector()
+REGISTRY.register(WORKERS)
+
+
+def track_workers(workers: Sequence[PeriodicWorker]) -> None:
+    """Expose ``workers`` on ``/metrics`` (replaces the previously tracked ones; ``()`` to stop)."""
+    WORKERS.workers = workers
@@ -1,10 +1,10 @@
-from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user_id
+from app.shared.pagination import PageParams, PageResponse, page_params
 from ..services.pessoa_service import PessoaService
 from ..repositories.pessoa_repository_impl import PessoaRepositoryImpl
 from .pessoa_schema import PessoaCreate, PessoaResponse, PessoaUpdate
@@ -14,7 +14,7 @@ router = APIRouter(tags=["pessoas"])
 
 async def get_pessoa_service(session: AsyncSession = Depends(get_db)) -> PessoaService:
     repository = PessoaRepositoryImpl(session)
-    return PessoaService(repository)
+    return PessoaService(repository, session)
 
 
 @router.post("/", response_model=PessoaResponse, status_code=status.HTTP_201_CREATED)
@@ -31,14 +31,20 @@ async def create_pessoa(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[PessoaResponse])
+@router.get("/", response_model=PageResponse[PessoaResponse])
 async def list_pessoas(
+    page: PageParams = Depends(page_params),
     service: PessoaService = Depends(get_pessoa_service),
-) -> List[PessoaResponse]:
-    """Lista todas as pessoas (uso administrativo)."""
+) -> PageResponse[PessoaResponse]:
+    """Lista as pessoas paginadas por cursor (uso administrativo)."""
     try:
-        pessoas = await service.listar()
-        return [PessoaResponse.model_validate(p.__dict__) for p in pessoas]
+        pessoas = await service.listar(page)
+        return PageResponse(
+            items=[PessoaResponse.model_validate(p.__dict__) for p in pessoas.items],
+            next_cursor=pessoas.next_cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
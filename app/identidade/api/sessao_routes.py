@@ -1,34 +1,17 @@
-from typing import List, AsyncGenerator
+from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database import async_session_maker
+from app.api.deps import get_sessao_service
 from app.identidade.services.sessao_service import SessaoService
-from app.identidade.repositories.sessao_repository_impl import SessaoRepositoryImpl
-from app.identidade.repositories.pessoa_repository_impl import PessoaRepositoryImpl
 from .sessao_schema import LoginRequest, SessaoCriadaResponse, SessaoResponse
 
 router = APIRouter(tags=["sessoes"])
 security = HTTPBearer(auto_error=False)  # faz o Swagger exibir o cadeado "Authorize"
 
 
-# DB session
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
-# Service DI
-async def get_sessao_service(session: AsyncSession = Depends(get_db)) -> SessaoService:
-    return SessaoService(SessaoRepositoryImpl(session), PessoaRepositoryImpl(session))
-
-
 @router.post("/login", response_model=SessaoCriadaResponse, status_code=status.HTTP_201_CREATED)
 async def login(payload: LoginRequest, service: SessaoService = Depends(get_sessao_service)) -> SessaoCriadaResponse:
     """Autentica, cria sessão e retorna o token em claro uma única vez."""
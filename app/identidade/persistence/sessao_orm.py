@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import Date, ForeignKey, Integer, String
+from sqlalchemy import Date, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,10 @@ from app.shared.database import Base
 
 class SessaoORM(Base):
     __tablename__ = "sessao"
+    __table_args__ = (
+        Index("ix_sessao_fk_pessoa_id_pessoa", "fk_pessoa_id_pessoa"),
+        Index("ix_sessao_expira_em", "expira_em"),
+    )
 
     id_sessao: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 from typing import Protocol
-from collections.abc import Iterable
 from uuid import UUID
 
 from app.identidade.persistence.pessoa_orm import PessoaORM
+from app.shared.pagination import Page, PageParams
 
 
 class PessoaRepository(Protocol):
     async def create(self, pessoa: PessoaORM) -> PessoaORM: ...
-    async def list_all(self) -> Iterable[PessoaORM]: ...
+    async def list_all(self, page: PageParams) -> Page[PessoaORM]: ...
     async def get_by_id(self, id_pessoa: UUID) -> PessoaORM | None: ...
     async def get_by_email(self, email: str) -> PessoaORM | None: ...
     async def update(self, pessoa: PessoaORM) -> PessoaORM: ...
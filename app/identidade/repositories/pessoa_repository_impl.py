@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.identidade.persistence.pessoa_orm import PessoaORM
 from app.identidade.repositories.pessoa_repository import PessoaRepository
+from app.shared.pagination import Page, PageParams, paginate
 
 
 class PessoaRepositoryImpl(PessoaRepository):
@@ -19,18 +20,13 @@ class PessoaRepositoryImpl(PessoaRepository):
         try:
             self.session.add(pessoa)
             await self.session.flush()  # Flush to get the ID
-            await self.session.commit()  # Commit the transaction
-            await self.session.refresh(pessoa)  # Refresh to get all fields
+            await self.session.refresh(pessoa)  # Refresh to get server defaults
             return pessoa
         except Exception as e:
-            await self.session.rollback()
             raise ValueError(f"Erro ao criar pessoa: {str(e)}")
 
-    async def list_all(self) -> list[PessoaORM]:
-        stmt = select(PessoaORM)
-        result = await self.session.execute(stmt)
-        await self.session.commit()  # Add commit here
-        return list(result.scalars().all())
+    async def list_all(self, page: PageParams) -> Page[PessoaORM]:
+        return await paginate(self.session, select(PessoaORM), [PessoaORM.id_pessoa], page)
 
     async def get_by_id(self, id_pessoa: UUID) -> PessoaORM | None:
         stmt = select(PessoaORM).where(PessoaORM.id_pessoa == id_pessoa)
@@ -46,10 +42,9 @@ class PessoaRepositoryImpl(PessoaRepository):
 
     async def update(self, pessoa: PessoaORM) -> PessoaORM:
         await self.session.merge(pessoa)
-        await self.session.commit()  # Add commit here
+        await self.session.flush()
         return pessoa
 
     async def delete(self, id_pessoa: UUID) -> None:
         stmt = delete(PessoaORM).where(PessoaORM.id_pessoa == id_pessoa)
         await self.session.execute(stmt)
-        await self.session.commit()  # Add commit here
@@ -15,4 +15,4 @@ class SessaoRepository(Protocol):
     async def delete_by_id(self, id_sessao: int) -> None: ...
     async def delete_by_token_hash(self, token_hash: str) -> None: ...
     async def delete_all_for_pessoa(self, id_pessoa: UUID) -> int: ...
-    async def purge_expired(self) -> int: ...
+    async def purge_expired(self, batch_size: int | None = None) -> int: ...
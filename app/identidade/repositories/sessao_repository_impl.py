@@ -18,11 +18,8 @@ class SessaoRepositoryImpl(SessaoRepository):
         try:
             self.session.add(sessao)
             await self.session.flush()
-            await self.session.commit()
-            await self.session.refresh(sessao)
             return sessao
         except Exception as e:
-            await self.session.rollback()
             raise ValueError(f"Erro ao criar sessão: {str(e)}")
 
     async def get_by_id(self, id_sessao: int) -> SessaoORM | None:
@@ -41,19 +38,22 @@ class SessaoRepositoryImpl(SessaoRepository):
 
     async def delete_by_id(self, id_sessao: int) -> None:
         await self.session.execute(delete(SessaoORM).where(SessaoORM.id_sessao == id_sessao))
-        await self.session.commit()
 
     async def delete_by_token_hash(self, token_hash: str) -> None:
         await self.session.execute(delete(SessaoORM).where(SessaoORM.token_hash == token_hash))
-        await self.session.commit()
 
     async def delete_all_for_pessoa(self, id_pessoa: UUID) -> int:
         res = await self.session.execute(delete(SessaoORM).where(SessaoORM.fk_pessoa_id_pessoa == id_pessoa))
-        await self.session.commit()
         return res.rowcount or 0
 
-    async def purge_expired(self) -> int:
+    async def purge_expired(self, batch_size: int | None = None) -> int:
+        """Remove sessões expiradas; com `batch_size`, remove no máximo esse número de linhas (sem commit)."""
         today = date.today()
-        res = await self.session.execute(delete(SessaoORM).where(SessaoORM.expira_em < today))
-        await self.session.commit()
+        stmt = delete(SessaoORM)
+        if batch_size is None:
+            stmt = stmt.where(SessaoORM.expira_em < today)
+        else:
+            lote = select(SessaoORM.id_sessao).where(SessaoORM.expira_em < today).limit(batch_size)
+            stmt = stmt.where(SessaoORM.id_sessao.in_(lote.scalar_subquery()))
+        res = await self.session.execute(stmt)
         return res.rowcount or 0
@@ -2,18 +2,26 @@ from datetime import date
 from typing import Sequence, Any
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.identidade.domain.pessoa import Pessoa
 from app.identidade.persistence.pessoa_orm import PessoaORM
 from app.identidade.repositories.pessoa_repository import PessoaRepository
 from app.identidade.mappers.pessoa_mapper import orm_to_model, model_to_orm_new
+from app.identidade.services.sessao_service import sessao_cache
+from app.shared.pagination import Page, PageParams
+from app.shared.transaction import UnitOfWork
+from app.shared.transaction_service import transactional
 
 
 class PessoaService:
     """Camada de regras de negócio de Pessoa."""
 
-    def __init__(self, repo: PessoaRepository):
+    def __init__(self, repo: PessoaRepository, session: AsyncSession | None = None):
         self.repo = repo
+        self.session = session
 
+    @transactional
     async def criar(self, pessoa_data: dict[str, Any]) -> Pessoa:
         """Cria uma nova pessoa."""
         try:
@@ -38,10 +46,10 @@ class PessoaService:
         except Exception as e:
             raise ValueError(f"Erro ao criar pessoa: {str(e)}")
 
-    async def listar(self) -> list[Pessoa]:
-        """Lista todas as pessoas cadastradas."""
-        pessoas_orm = await self.repo.list_all()
-        return [orm_to_model(p) for p in pessoas_orm] if pessoas_orm else []
+    async def listar(self, page: PageParams) -> Page[Pessoa]:
+        """Lista uma página das pessoas cadastradas."""
+        pessoas_orm = await self.repo.list_all(page)
+        return pessoas_orm.map(orm_to_model)
 
     async def buscar_por_id(self, id_pessoa: UUID) -> Pessoa:
         """Busca uma pessoa por ID."""
@@ -57,6 +65,7 @@ class PessoaService:
             raise ValueError("Nenhum cadastro encontrado para esse e-mail.")
         return orm_to_model(pessoa_orm)
 
+    @transactional
     async def atualizar(self, id_pessoa: UUID, pessoa_data: dict[str, Any]) -> Pessoa:
         """Atualiza uma pessoa existente."""
         try:
@@ -93,7 +102,10 @@ class PessoaService:
         pessoa = await self.repo.get_by_id(id_pessoa)
         if not pessoa:
             raise ValueError("Pessoa não encontrada")
-        await self.repo.delete(id_pessoa)
+        async with UnitOfWork(self.session):
+            await self.repo.delete(id_pessoa)
+        # As sessões somem em cascata no banco; depois do commit, descarta também as que estão em cache
+        sessao_cache.discard_where(lambda _, s: s.fk_pessoa_id_pessoa == id_pessoa)
 
     @staticmethod
     def to_dict(p: PessoaORM) -> dict[str, Any]:
@@ -6,11 +6,25 @@ from datetime import date, timedelta
 from typing import Any, Sequence
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import settings
 from app.identidade.domain.sessao import Sessao as SessaoDomain
 from app.identidade.mappers.sessao_mapper import orm_to_model, model_to_orm_new
 from app.identidade.persistence.sessao_orm import SessaoORM
 from app.identidade.repositories.sessao_repository import SessaoRepository
 from app.identidade.repositories.pessoa_repository import PessoaRepository
+from app.shared.cache import TTLCache
+from app.shared.transaction import UnitOfWork
+from app.shared.transaction_service import transactional
+
+# Cache de sessões já validadas, indexado pelo sha256 do token.
+# Evita ir ao banco em toda requisição autenticada; o TTL limita por quanto
+# tempo outro worker pode aceitar um token já encerrado neste.
+sessao_cache: TTLCache[str, SessaoDomain] = TTLCache(
+    maxsize=settings.session_cache_max_size,
+    ttl=settings.session_cache_ttl_seconds,
+)
 
 
 def _sha256(value: str) -> str:
@@ -20,10 +34,19 @@ def _sha256(value: str) -> str:
 class SessaoService:
     """Regras de negócio de Sessão, aderente ao schema de banco atual."""
 
-    def __init__(self, sessao_repo: SessaoRepository, pessoa_repo: PessoaRepository) -> None:
+    def __init__(
+        self,
+        sessao_repo: SessaoRepository,
+        pessoa_repo: PessoaRepository,
+        cache: TTLCache[str, SessaoDomain] | None = None,
+        session: AsyncSession | None = None,
+    ) -> None:
         self.sessao_repo = sessao_repo
         self.pessoa_repo = pessoa_repo
+        self.cache = sessao_cache if cache is None else cache
+        self.session = session
 
+    @transactional
     async def criar_por_email_senha(self, email: str, senha: str, *, dias_validez: int = 1) -> tuple[SessaoDomain, str]:
         """Autentica por email/senha, cria sessão e retorna (SessaoDomain, token_claro)."""
         pessoa = await self.pessoa_repo.get_by_email(email)
@@ -48,26 +71,47 @@ class SessaoService:
         return orm_to_model(created), token_claro
 
     async def validar(self, token_claro: str) -> SessaoDomain:
-        """Valida o token: existe e não expirou."""
-        await self.sessao_repo.purge_expired()
+        """Valida o token: existe e não expirou.
+
+        Tokens já validados ficam em cache (ver `sessao_cache`), então um token
+        "quente" é validado sem nenhuma ida ao banco.
+        """
         token_hash = _sha256(token_claro)
+        cached = self.cache.get(token_hash)
+        if cached is not None:
+            if cached.expira_em < date.today():
+                self.cache.pop(token_hash)
+                raise ValueError("Sessão expirada")
+            return cached
+
+        # Sessões vencidas são apagadas pelo SessionSweeper (app/workers); aqui só conferimos a data
         sessao = await self.sessao_repo.get_by_token_hash(token_hash)
         if not sessao:
             raise ValueError("Sessão inválida")
         if sessao.expira_em < date.today():
-            await self.sessao_repo.delete_by_token_hash(token_hash)
             raise ValueError("Sessão expirada")
-        return orm_to_model(sessao)
+        dom = orm_to_model(sessao)
+        self.cache.set(token_hash, dom)
+        return dom
 
+    # Descarte do cache só depois do commit: antes dele, uma validação concorrente
+    # ainda encontraria a sessão no banco e a colocaria de volta no cache.
     async def encerrar_por_token(self, token_claro: str) -> None:
         token_hash = _sha256(token_claro)
-        await self.sessao_repo.delete_by_token_hash(token_hash)
+        async with UnitOfWork(self.session):
+            await self.sessao_repo.delete_by_token_hash(token_hash)
+        self.cache.pop(token_hash)
 
     async def encerrar_por_id(self, id_sessao: int) -> None:
-        await self.sessao_repo.delete_by_id(id_sessao)
+        async with UnitOfWork(self.session):
+            await self.sessao_repo.delete_by_id(id_sessao)
+        self.cache.discard_where(lambda _, s: s.id_sessao == id_sessao)
 
     async def encerrar_todas_de_pessoa(self, id_pessoa: UUID) -> int:
-        return await self.sessao_repo.delete_all_for_pessoa(id_pessoa)
+        async with UnitOfWork(self.session):
+            removidas = await self.sessao_repo.delete_all_for_pessoa(id_pessoa)
+        self.cache.discard_where(lambda _, s: s.fk_pessoa_id_pessoa == id_pessoa)
+        return removidas
 
     async def listar_por_pessoa(self, id_pessoa: UUID) -> list[SessaoDomain]:
         itens = await self.sessao_repo.list_by_pessoa(id_pessoa)
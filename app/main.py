@@ -1,7 +1,10 @@
 """FastAPI application entrypoint: sets up lifespan, CORS, and API v1 routes."""
 
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
 from typing import Any
 
 from fastapi import FastAPI
@@ -9,9 +12,18 @@ from fastapi.security import HTTPBearer
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.routes import api_router
+from app.core.logging import RequestContextMiddleware, configure_logging
+from app.core.metrics import (
+    PrometheusMiddleware,
+    QueryCountMiddleware,
+    instrument_engine,
+    metrics_response,
+    track_workers,
+)
 from app.core.settings import settings
-from app.shared.database import init_db
-from app.shared.seed import seed_db
+from app.shared.database import engine, init_db
+from app.shared.redis import close_redis_client, init_redis
+from app.workers import build_workers
 
 
 from app.providers.pluggy_client import PluggyClient
@@ -28,44 +40,116 @@ from app.comercial.api.solicitacao_pagamento_routes import (
     router as solicitacoes_pagamento_router,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Mede cada etapa do startup para o relatório logado ao final do lifespan."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.steps: dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    @property
+    def total_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 1)
+
+
+async def check_pluggy(client: PluggyClient) -> None:
+    """Valida as credenciais da Pluggy (e já deixa a API key em cache) sem derrubar a app."""
+    try:
+        await client.api_key()
+        logger.info("Pluggy: auth_token OK")
+    except Exception as e:
+        # Não derruba a app, mas deixa claro o motivo se /connect-token falhar depois
+        logger.warning("Pluggy: auth_token FAILED: %s", e)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    # DB
-    await init_db(create_all=(settings.environment != "production"))
-    # Seed (sugiro rodar só fora de produção)
-    if settings.environment != "production":
-        await seed_db()
-
-    # Sanity check das variáveis de ambiente da Pluggy
-    print(f"[PLUGGY] base_url = {settings.pluggy_base_url}")
-    print(f"[PLUGGY] client_id set? {bool(settings.pluggy_client_id)}")
-    print(f"[PLUGGY] client_secret set? {bool(settings.pluggy_client_secret)}")
-
-    # Inicializa o client
+    # Logs em JSON via fila: formatação e escrita no stdout ficam numa thread à parte
+    logging_pipeline = configure_logging(settings.log_level, json_format=settings.log_json)
+    timer = StartupTimer()
+
+    # DB (create_all só fora de produção; em produção o schema vem das migrations)
+    with timer.step("db"):
+        await init_db(create_all=(settings.environment != "production"))
+    # Seed só quando pedido explicitamente (SEED_ON_STARTUP=true); nunca em produção
+    if settings.seed_on_startup and settings.environment != "production":
+        from app.shared.seed import seed_db
+
+        with timer.step("seed"):
+            await seed_db()
+
+    # Pool de conexões Redis compartilhado (cache, rate limiting, pub/sub)
+    with timer.step("redis"):
+        app.state.redis = await init_redis()
+
+    logger.info(
+        "Pluggy: base_url=%s client_id set? %s client_secret set? %s",
+        settings.pluggy_base_url,
+        bool(settings.pluggy_client_id),
+        bool(settings.pluggy_client_secret),
+    )
     app.state.pluggy_client = PluggyClient(
         base_url=settings.pluggy_base_url,
         client_id=settings.pluggy_client_id,
         client_secret=settings.pluggy_client_secret,
     )
-
-    # Validação rápida (opcional, mas ajuda a pegar erro cedo)
-    try:
-        _ = await app.state.pluggy_client.auth_token()
-        print("[PLUGGY] auth_token OK")
-    except Exception as e:
-        # Não derruba a app, mas deixa claro o motivo se /connect-token falhar depois
-        print(f"[PLUGGY] auth_token FAILED: {e}")
+    # A autenticação é uma chamada HTTP externa (timeout de 30s): por padrão roda em background
+    # para não atrasar o primeiro request; 'blocking' mantém o comportamento antigo.
+    app.state.pluggy_check = None
+    if settings.pluggy_startup_check == "blocking":
+        with timer.step("pluggy"):
+            await check_pluggy(app.state.pluggy_client)
+    elif settings.pluggy_startup_check == "background":
+        app.state.pluggy_check = asyncio.create_task(check_pluggy(app.state.pluggy_client))
+
+    # Workers em background (limpeza de sessões etc.)
+    with timer.step("workers"):
+        app.state.workers = build_workers()
+        for worker in app.state.workers:
+            worker.start()
+    # Estatísticas dos workers (execuções, falhas, linhas, duração) saem em /metrics
+    if settings.metrics_enabled:
+        track_workers(app.state.workers)
+
+    app.state.startup = {"total_ms": timer.total_ms, "steps": timer.steps}
+    logger.info(
+        "Startup concluído em %.1f ms (%s)",
+        timer.total_ms,
+        ", ".join(f"{name}={ms:.1f}ms" for name, ms in timer.steps.items()),
+    )
 
     try:
         yield
     finally:
+        track_workers(())
+        for worker in app.state.workers:
+            await worker.stop()
+        check = app.state.pluggy_check
+        if check is not None and not check.done():
+            check.cancel()
+            with suppress(asyncio.CancelledError):
+                await check
         client = getattr(app.state, "pluggy_client", None)
         if client:
             await client.close()
+        await close_redis_client()
+        logging_pipeline.stop()
 
 
-
+# Mantém o JSONResponse padrão: com response_model o FastAPI valida e gera o JSON em Rust
+# (pydantic-core), e um default_response_class próprio desligaria esse caminho. Listagens de
+# dados confiáveis usam ORJSONResponse explicitamente (ver app/shared/pagination.py).
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
@@ -83,6 +167,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Métricas Prometheus: latência por rota, espera por conexão do pool, custo SQL por request e
+# chamadas à Pluggy. Fica por fora do CORS para medi-lo também.
+if settings.metrics_enabled:
+    instrument_engine(engine)
+    app.add_middleware(PrometheusMiddleware)
+    app.add_api_route("/metrics", metrics_response, methods=["GET"], include_in_schema=False)
+
+# Em debug: quantidade de queries por request nos headers e aviso de N+1 no log
+if settings.debug:
+    instrument_engine(engine)
+    app.add_middleware(QueryCountMiddleware)
+
+# Request id (X-Request-ID) em todo log do request e um log de acesso com a duração.
+# Adicionado por último para ficar por fora de todos os outros.
+app.add_middleware(RequestContextMiddleware)
+
 app.include_router(api_router, prefix="/api/v1")
 app.include_router(pessoas_router, prefix="/api/v1/pessoas")
 app.include_router(alertas_router, prefix="/api/v1/alertas")
@@ -95,7 +195,6 @@ app.include_router(solicitacoes_pagamento_router, prefix="/api/v1/solicitacoes-p
 app.include_router(pluggy_router)
 
 
-
 @app.get("/")
 async def root() -> dict[str, Any]:
     """Return basic app metadata for quick inspection."""
@@ -103,6 +202,7 @@ async def root() -> dict[str, Any]:
         "message": f"Welcome to {settings.app_name}",
         "version": settings.app_version,
         "environment": settings.environment,
+        "startup": getattr(app.state, "startup", None),
     }
 
 
@@ -215,6 +215,57 @@ class AtualizarSaldoRequest(BaseModel):
     )
 
 
+# Limite de itens por chamada de /metas/atualizar_saldo/lote
+MAX_ITENS_LOTE = 500
+
+
+class MovimentacaoLoteItem(AtualizarSaldoRequest):
+    """Item de um lote de movimentações: o mesmo corpo de atualizar_saldo, mais a meta."""
+    id_meta: int = Field(
+        ...,
+        gt=0,
+        description="ID da meta a ser movimentada"
+    )
+
+
+class AtualizarSaldoLoteRequest(BaseModel):
+    """Schema para aplicar várias movimentações de uma vez (ex.: sincronização bancária)."""
+    itens: list[MovimentacaoLoteItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_ITENS_LOTE,
+        description="Movimentações, aplicadas na ordem enviada"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "itens": [
+                    {"id_meta": 1, "action": "adicionado", "valor": 2.35, "data": "2025-01-15"},
+                    {"id_meta": 1, "action": "adicionado", "valor": 0.80, "data": "2025-01-16"},
+                    {"id_meta": 2, "action": "retirado", "valor": 50.00, "data": "2025-01-16"}
+                ]
+            }
+        }
+    )
+
+
+class ResultadoMovimentacaoResponse(BaseModel):
+    """Resultado de um item do lote."""
+    indice: int = Field(..., ge=0, description="Posição do item no lote enviado")
+    id_meta: int = Field(..., description="ID da meta do item")
+    sucesso: bool = Field(..., description="Se a movimentação foi aplicada")
+    erro: str | None = Field(None, description="Motivo da recusa, quando sucesso=false")
+    valor_atual: Decimal | None = Field(None, description="Saldo da meta após o item, quando aplicado")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AtualizarSaldoLoteResponse(BaseModel):
+    """Resposta do lote: um resultado por item, na ordem de entrada."""
+    resultados: list[ResultadoMovimentacaoResponse]
+
+
 class MovimentacaoMetaResponse(BaseModel):
     """Schema para resposta de movimentação de meta."""
     id_movimentacao: int = Field(
@@ -1,14 +1,26 @@
-from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user_id
+from app.shared.export import ExportFormat, streaming_export
+from app.shared.pagination import PageParams, PageResponse, page_params, trusted_page_json
+from ..persistence.movimentacao_meta_orm import MovimentacaoMetaORM
 from ..services.meta_service import MetaService
 from ..repositories.meta_repository_impl import MetaRepositoryImpl
 from ..repositories.movimentacao_meta_repository_impl import MovimentacaoMetaRepositoryImpl
-from .meta_schema import MetaCreate, MetaUpdate, MetaResponse, AtualizarSaldoRequest, MovimentacaoMetaResponse
+from .meta_schema import (
+    MetaCreate,
+    MetaUpdate,
+    MetaResponse,
+    AtualizarSaldoRequest,
+    AtualizarSaldoLoteRequest,
+    AtualizarSaldoLoteResponse,
+    MovimentacaoMetaResponse,
+    ResultadoMovimentacaoResponse,
+)
 
 router = APIRouter(tags=["metas"])
 
@@ -35,20 +47,24 @@ async def create_meta(
         data["fk_pessoa_id_pessoa"] = user_id
         
         created = await service.criar(data)
-        return MetaResponse.model_validate(created.__dict__)
+        return MetaResponse.model_validate(created)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[MetaResponse])
+@router.get("/", response_model=PageResponse[MetaResponse])
 async def list_metas(
+    page: PageParams = Depends(page_params),
     service: MetaService = Depends(get_meta_service),
     user_id: UUID = Depends(get_current_user_id)
-) -> List[MetaResponse]:
-    """Lista todas as metas do usuário autenticado."""
+) -> Response:
+    """Lista as metas do usuário autenticado, paginadas por cursor (use `next_cursor` na próxima chamada)."""
     try:
-        metas = await service.listar_por_pessoa(user_id)
-        return [MetaResponse.model_validate(m.__dict__) for m in metas]
+        metas = await service.listar_por_pessoa(user_id, page)
+        # Linhas vêm direto da tabela meta: serializa sem revalidar contra MetaResponse
+        return trusted_page_json(MetaResponse, metas)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -70,7 +86,7 @@ async def get_meta(
                 detail="Você não tem permissão para acessar esta meta"
             )
         
-        return MetaResponse.model_validate(meta.__dict__)
+        return MetaResponse.model_validate(meta)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -93,7 +109,7 @@ async def update_meta(
             )
         
         updated = await service.atualizar(id_meta, meta.model_dump(exclude_unset=True))
-        return MetaResponse.model_validate(updated.__dict__)
+        return MetaResponse.model_validate(updated)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -146,7 +162,7 @@ async def atualizar_saldo_meta(
             valor=request.valor,
             data_movimentacao=request.data,
         )
-        return MetaResponse.model_validate(meta_atualizada.__dict__)
+        return MetaResponse.model_validate(meta_atualizada)
     except ValueError as e:
         if "não encontrada" in str(e).lower():
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -156,26 +172,52 @@ async def atualizar_saldo_meta(
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/movimentacao/{id_meta}", response_model=List[MovimentacaoMetaResponse])
+@router.post("/atualizar_saldo/lote", response_model=AtualizarSaldoLoteResponse, status_code=status.HTTP_200_OK)
+async def atualizar_saldo_lote(
+    request: AtualizarSaldoLoteRequest,
+    service: MetaService = Depends(get_meta_service),
+    user_id: UUID = Depends(get_current_user_id)
+) -> AtualizarSaldoLoteResponse:
+    """Aplica várias movimentações de saldo em uma única chamada.
+
+    Pensado para sincronização com transações bancárias e depósitos de arredondamento:
+    o custo no banco é fixo por lote, não por movimentação.
+
+    **Regras:**
+    - As mesmas de `/{id_meta}/atualizar_saldo`, avaliadas item a item, na ordem enviada
+    - Itens recusados (meta de outro usuário, saldo insuficiente...) não afetam os demais
+    - A resposta traz um resultado por item, com o saldo após o item ou o motivo da recusa
+    """
+    try:
+        resultados = await service.atualizar_saldo_lote(
+            user_id, [item.model_dump() for item in request.itens]
+        )
+        return AtualizarSaldoLoteResponse(
+            resultados=[ResultadoMovimentacaoResponse.model_validate(r) for r in resultados]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/movimentacao/{id_meta}", response_model=PageResponse[MovimentacaoMetaResponse])
 async def listar_movimentacoes_meta(
     id_meta: int,
+    page: PageParams = Depends(page_params),
     service: MetaService = Depends(get_meta_service),
     user_id: UUID = Depends(get_current_user_id)
-) -> List[MovimentacaoMetaResponse]:
-    """Lista todas as movimentações de uma meta financeira.
+) -> Response:
+    """Lista as movimentações de uma meta financeira.
     
-    Retorna o histórico completo de movimentações (adições e retiradas)
-    da meta especificada, ordenado por data (mais recente primeiro).
+    Retorna o histórico de movimentações (adições e retiradas) da meta
+    especificada, ordenado por data (mais recente primeiro) e paginado por
+    cursor: envie `next_cursor` como `cursor` para obter a próxima página.
     
     **Requisitos:**
     - Meta deve pertencer ao usuário autenticado
     """
     try:
-        movimentacoes = await service.listar_movimentacoes(id_meta, user_id)
-        return [
-            MovimentacaoMetaResponse.model_validate(m.__dict__)
-            for m in movimentacoes
-        ]
+        movimentacoes = await service.listar_movimentacoes(id_meta, user_id, page)
+        return trusted_page_json(MovimentacaoMetaResponse, movimentacoes)
     except ValueError as e:
         if "não encontrada" in str(e).lower():
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -183,3 +225,36 @@ async def listar_movimentacoes_meta(
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
         else:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/movimentacao/{id_meta}/export", response_class=StreamingResponse)
+async def exportar_movimentacoes_meta(
+    id_meta: int,
+    formato: ExportFormat = Query("ndjson", description="Formato do arquivo: 'ndjson' ou 'csv'"),
+    service: MetaService = Depends(get_meta_service),
+    user_id: UUID = Depends(get_current_user_id)
+) -> StreamingResponse:
+    """Exporta o histórico completo de movimentações de uma meta em NDJSON ou CSV.
+    
+    As linhas são lidas do banco em lotes e enviadas à medida que chegam
+    (resposta em streaming), com uso de memória constante.
+    
+    **Requisitos:**
+    - Meta deve pertencer ao usuário autenticado
+    """
+    try:
+        meta = await service.buscar_por_id(id_meta)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if meta.fk_pessoa_id_pessoa != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não tem permissão para acessar as movimentações desta meta"
+        )
+
+    return streaming_export(
+        lambda session: MovimentacaoMetaRepositoryImpl(session).stream_by_meta_id(id_meta),
+        MovimentacaoMetaORM.__table__.columns.keys(),
+        formato,
+        f"movimentacoes_meta_{id_meta}",
+    )
@@ -36,3 +36,13 @@ class MovimentacaoMeta:
         if not AcaoMovimentacao.is_valid(self.acao):
             raise ValueError(f"Ação deve ser uma das seguintes: {', '.join([a.value for a in AcaoMovimentacao])}")
 
+
+
+@dataclass
+class ResultadoMovimentacao:
+    """Resultado de um item de um lote de movimentações (ver MetaService.atualizar_saldo_lote)."""
+    indice: int
+    id_meta: int
+    sucesso: bool
+    erro: str | None = None
+    valor_atual: Decimal | None = None
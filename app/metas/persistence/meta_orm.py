@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, Date, Numeric, ForeignKey, Integer, String, func
+from sqlalchemy import CheckConstraint, Date, Index, Numeric, ForeignKey, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,6 +18,16 @@ if TYPE_CHECKING:
 
 class MetaORM(Base):
     __tablename__ = "meta"
+    __table_args__ = (
+        Index("ix_meta_fk_pessoa_id_pessoa", "fk_pessoa_id_pessoa"),
+        # Metas candidatas a 'atrasada' (job diário de vencimento)
+        Index(
+            "ix_meta_em_andamento_termina_em",
+            "termina_em",
+            "id_meta",
+            postgresql_where=text("status = 'em_andamento'"),
+        ),
+    )
 
     id_meta: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -4,7 +4,16 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, Date, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shared.database import Base
@@ -15,6 +24,10 @@ if TYPE_CHECKING:
 
 class MovimentacaoMetaORM(Base):
     __tablename__ = "movimentacao_meta"
+    __table_args__ = (
+        # Histórico de uma meta, mais recente primeiro
+        Index("ix_movimentacao_meta_meta_data", "fk_meta_id_meta", text("data DESC"), text("id_movimentacao DESC")),
+    )
 
     id_movimentacao: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -34,4 +47,3 @@ class MovimentacaoMetaORM(Base):
 
     def __repr__(self) -> str:
         return f"<MovimentacaoMetaORM id={self.id_movimentacao} acao={self.acao} valor={self.valor}>"
-
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-from typing import Protocol
-from collections.abc import Iterable
+from datetime import date
+from decimal import Decimal
+from collections.abc import Mapping, Sequence
+from typing import Any, Protocol
 from uuid import UUID
 
+from sqlalchemy import Row, RowMapping
+
 from app.metas.persistence.meta_orm import MetaORM
+from app.shared.pagination import Page, PageParams
 
 
 class MetaRepository(Protocol):
     """Contrato que define o comportamento esperado do repositório de Meta."""
 
     async def get_by_id(self, id_meta: int) -> MetaORM | None: ...
-    async def list_by_pessoa(self, id_pessoa: UUID) -> Iterable[MetaORM]: ...
-    async def list_all(self) -> Iterable[MetaORM]: ...
+    async def list_by_pessoa(self, id_pessoa: UUID, page: PageParams) -> Page[Row[Any]]: ...
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]: ...
+    async def mark_overdue(self, *, after_id: int, limit: int) -> list[Row[tuple[int, UUID, str, str]]]: ...
+    async def apply_movement(
+        self, id_meta: int, id_pessoa: UUID, *, delta: Decimal, acao: str, data: date
+    ) -> RowMapping | None: ...
+    async def lock_balances(self, ids: Sequence[int], id_pessoa: UUID) -> list[RowMapping]: ...
+    async def apply_deltas(self, deltas: Mapping[int, Decimal]) -> list[RowMapping]: ...
     async def add(self, meta: MetaORM) -> MetaORM: ...
     async def update(self, meta: MetaORM) -> MetaORM: ...
     async def delete(self, id_meta: int) -> None: ...
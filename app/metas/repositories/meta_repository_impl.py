@@ -1,12 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from datetime import date
+from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    Date,
+    Integer,
+    Row,
+    RowMapping,
+    String,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    insert,
+    literal,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.metas.persistence.meta_orm import MetaORM
+from app.metas.persistence.movimentacao_meta_orm import MovimentacaoMetaORM
 from app.metas.repositories.meta_repository import MetaRepository
+from app.shared.pagination import Page, PageParams, paginate
 
 
 class MetaRepositoryImpl(MetaRepository):
@@ -19,32 +41,160 @@ class MetaRepositoryImpl(MetaRepository):
         """Busca uma meta pelo ID."""
         return await self.session.get(MetaORM, id_meta)
 
-    async def list_by_pessoa(self, id_pessoa: UUID) -> list[MetaORM]:
-        """Lista todas as metas de uma pessoa."""
-        result = await self.session.execute(select(MetaORM).where(MetaORM.fk_pessoa_id_pessoa == id_pessoa))
-        return list(result.scalars())  # <- lista real
+    async def list_by_pessoa(self, id_pessoa: UUID, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página das metas de uma pessoa, em ordem de ID (linhas, somente leitura)."""
+        stmt = select(*MetaORM.__table__.columns).where(MetaORM.fk_pessoa_id_pessoa == id_pessoa)
+        return await paginate(self.session, stmt, [MetaORM.id_meta], page)
 
-    async def list_all(self) -> list[MetaORM]:
-        """Lista todas as metas cadastradas."""
-        result = await self.session.execute(select(MetaORM))
-        return list(result.scalars())  # <- lista real
+    async def list_all(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todas as metas cadastradas, em ordem de ID (linhas, somente leitura)."""
+        return await paginate(self.session, select(*MetaORM.__table__.columns), [MetaORM.id_meta], page)
+
+    async def mark_overdue(self, *, after_id: int, limit: int) -> list[Row[tuple[int, UUID, str, str]]]:
+        """Marca como 'atrasada' um lote de metas 'em_andamento' com término no passado.
+
+        Paginação por keyset: considera apenas metas com `id_meta > after_id`, em ordem
+        de ID, no máximo `limit` por chamada. Linhas travadas por outra transação são
+        puladas (SKIP LOCKED) e ficam para a próxima passada. Não faz commit: o
+        chamador decide a transação (ex.: junto com os alertas gerados).
+
+        Returns:
+            Linhas (id_meta, fk_pessoa_id_pessoa, titulo, categoria) das metas alteradas.
+        """
+        lote = (
+            select(MetaORM.id_meta)
+            .where(MetaORM.status == "em_andamento")
+            .where(MetaORM.termina_em < date.today())
+            .where(MetaORM.id_meta > after_id)
+            .order_by(MetaORM.id_meta)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(MetaORM)
+            .where(MetaORM.id_meta.in_(lote.scalar_subquery()))
+            .values(status="atrasada")
+            .returning(MetaORM.id_meta, MetaORM.fk_pessoa_id_pessoa, MetaORM.titulo, MetaORM.categoria)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def apply_movement(
+        self, id_meta: int, id_pessoa: UUID, *, delta: Decimal, acao: str, data: date
+    ) -> RowMapping | None:
+        """Soma `delta` ao saldo da meta e registra a movimentação, em um único statement.
+
+        WITH upd AS (UPDATE meta SET valor_atual = valor_atual + :delta, status = ...
+                     WHERE id_meta = :id AND fk_pessoa_id_pessoa = :uid
+                       AND valor_atual + :delta >= 0 RETURNING meta.*),
+             mov AS (INSERT INTO movimentacao_meta (...) SELECT id_meta, :valor, :acao, :data FROM upd)
+        SELECT * FROM upd
+
+        O incremento é feito pelo banco sobre o valor corrente da linha (travada pelo
+        UPDATE), então depósitos/retiradas concorrentes não se sobrescrevem, e a
+        movimentação só é gravada se o saldo mudou. Não faz commit.
+
+        Returns:
+            Colunas da meta atualizada, ou None se nenhuma linha casou (meta inexistente,
+            de outra pessoa ou saldo insuficiente para a retirada).
+        """
+        novo_valor = MetaORM.valor_atual + delta
+        upd = (
+            update(MetaORM)
+            .where(MetaORM.id_meta == id_meta)
+            .where(MetaORM.fk_pessoa_id_pessoa == id_pessoa)
+            .where(novo_valor >= 0)
+            .values(
+                valor_atual=novo_valor,
+                status=case(
+                    (and_(MetaORM.status == "em_andamento", novo_valor >= MetaORM.valor_alvo), "concluida"),
+                    else_=MetaORM.status,
+                ),
+            )
+            .returning(*MetaORM.__table__.columns)
+            .cte("upd")
+        )
+        mov = (
+            insert(MovimentacaoMetaORM)
+            .from_select(
+                ["fk_meta_id_meta", "valor", "acao", "data"],
+                select(
+                    upd.c.id_meta,
+                    cast(literal(abs(delta)), MovimentacaoMetaORM.valor.type),
+                    literal(acao, String),
+                    literal(data, Date),
+                ),
+            )
+            .cte("mov")
+        )
+        result = await self.session.execute(select(upd).add_cte(mov))
+        return result.mappings().one_or_none()
+
+    async def lock_balances(self, ids: Sequence[int], id_pessoa: UUID) -> list[RowMapping]:
+        """Lê e trava (FOR UPDATE) o saldo de várias metas de uma pessoa em uma consulta.
+
+        Só metas de `id_pessoa` são lidas: ids de outras pessoas não travam nada. As linhas
+        são travadas em ordem de ID, para que lotes concorrentes sobre as mesmas metas não
+        entrem em deadlock. Não faz commit.
+
+        Returns:
+            Linhas (id_meta, fk_pessoa_id_pessoa, categoria, valor_atual) das metas encontradas.
+        """
+        stmt = (
+            select(MetaORM.id_meta, MetaORM.fk_pessoa_id_pessoa, MetaORM.categoria, MetaORM.valor_atual)
+            .where(MetaORM.id_meta.in_(ids))
+            .where(MetaORM.fk_pessoa_id_pessoa == id_pessoa)
+            .order_by(MetaORM.id_meta)
+            .with_for_update()
+        )
+        result = await self.session.execute(stmt)
+        return list(result.mappings().all())
+
+    async def apply_deltas(self, deltas: Mapping[int, Decimal]) -> list[RowMapping]:
+        """Soma a cada meta o seu delta com um único UPDATE ... FROM (VALUES ...).
+
+        Aplica a mesma transição para 'concluida' que `apply_movement`. Não valida saldo
+        nem dono: o chamador já travou as linhas com `lock_balances`. Não faz commit.
+
+        Returns:
+            Linhas (id_meta, valor_atual, status) das metas atualizadas.
+        """
+        if not deltas:
+            return []
+        v = values(column("id_meta", Integer), column("delta", MetaORM.valor_atual.type), name="v").data(
+            list(deltas.items())
+        )
+        # Parâmetros em VALUES não têm tipo de contexto: o cast evita que virem text
+        novo_valor = MetaORM.valor_atual + cast(v.c.delta, MetaORM.valor_atual.type)
+        stmt = (
+            update(MetaORM)
+            .where(MetaORM.id_meta == v.c.id_meta)
+            .values(
+                valor_atual=novo_valor,
+                status=case(
+                    (and_(MetaORM.status == "em_andamento", novo_valor >= MetaORM.valor_alvo), "concluida"),
+                    else_=MetaORM.status,
+                ),
+            )
+            .returning(MetaORM.id_meta, MetaORM.valor_atual, MetaORM.status)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.mappings().all())
 
     async def add(self, meta: MetaORM) -> MetaORM:
         """Adiciona uma nova meta."""
         self.session.add(meta)
         await self.session.flush()
-        await self.session.commit()
         return meta
 
     async def update(self, meta: MetaORM) -> MetaORM:
         """Atualiza uma meta existente."""
         merged = await self.session.merge(meta)
         await self.session.flush()
-        await self.session.commit()
         return merged
 
     async def delete(self, id_meta: int) -> None:
         """Remove uma meta pelo ID."""
         await self.session.execute(delete(MetaORM).where(MetaORM.id_meta == id_meta))
-        await self.session.flush()
-        await self.session.commit()
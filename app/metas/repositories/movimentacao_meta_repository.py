@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from typing import Protocol
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Protocol
+
+from sqlalchemy import Row, RowMapping
 
 from app.metas.persistence.movimentacao_meta_orm import MovimentacaoMetaORM
+from app.shared.pagination import Page, PageParams
 
 
 class MovimentacaoMetaRepository(Protocol):
     """Contrato que define o comportamento esperado do repositório de MovimentacaoMeta."""
 
     async def get_by_id(self, id_movimentacao: int) -> MovimentacaoMetaORM | None: ...
-    async def list_by_meta_id(self, id_meta: int) -> Iterable[MovimentacaoMetaORM]: ...
+    async def list_by_meta_id(self, id_meta: int, page: PageParams) -> Page[Row[Any]]: ...
+    def stream_by_meta_id(self, id_meta: int) -> AsyncIterator[RowMapping]: ...
     async def add(self, movimentacao: MovimentacaoMetaORM) -> MovimentacaoMetaORM: ...
+    async def add_many(self, movimentacoes: Sequence[dict[str, Any]]) -> int: ...
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import Row, RowMapping, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.metas.persistence.movimentacao_meta_orm import MovimentacaoMetaORM
 from app.metas.repositories.movimentacao_meta_repository import MovimentacaoMetaRepository
+from app.shared.export import EXPORT_BATCH_SIZE
+from app.shared.pagination import Page, PageParams, paginate
 
 
 class MovimentacaoMetaRepositoryImpl(MovimentacaoMetaRepository):
@@ -17,19 +22,39 @@ class MovimentacaoMetaRepositoryImpl(MovimentacaoMetaRepository):
         """Busca uma movimentação pelo ID."""
         return await self.session.get(MovimentacaoMetaORM, id_movimentacao)
 
-    async def list_by_meta_id(self, id_meta: int) -> list[MovimentacaoMetaORM]:
-        """Lista todas as movimentações de uma meta."""
-        result = await self.session.execute(
-            select(MovimentacaoMetaORM)
+    async def list_by_meta_id(self, id_meta: int, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página das movimentações de uma meta, mais recentes primeiro (linhas, somente leitura).
+
+        A ordem (data DESC, id DESC) é a do índice ix_movimentacao_meta_meta_data.
+        """
+        stmt = select(*MovimentacaoMetaORM.__table__.columns).where(MovimentacaoMetaORM.fk_meta_id_meta == id_meta)
+        keys = [MovimentacaoMetaORM.data, MovimentacaoMetaORM.id_movimentacao]
+        return await paginate(self.session, stmt, keys, page, descending=True)
+
+    async def stream_by_meta_id(self, id_meta: int) -> AsyncIterator[RowMapping]:
+        """Percorre todas as movimentações de uma meta via cursor no servidor (exportação).
+
+        As linhas chegam em lotes de EXPORT_BATCH_SIZE, sem materializar o histórico inteiro.
+        """
+        stmt = (
+            select(*MovimentacaoMetaORM.__table__.columns)
             .where(MovimentacaoMetaORM.fk_meta_id_meta == id_meta)
             .order_by(MovimentacaoMetaORM.data.desc(), MovimentacaoMetaORM.id_movimentacao.desc())
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
         )
-        return list(result.scalars())
+        result = await self.session.stream(stmt)
+        async for row in result.mappings():
+            yield row
 
     async def add(self, movimentacao: MovimentacaoMetaORM) -> MovimentacaoMetaORM:
         """Adiciona uma nova movimentação."""
         self.session.add(movimentacao)
         await self.session.flush()
-        await self.session.commit()
         return movimentacao
 
+    async def add_many(self, movimentacoes: Sequence[dict[str, Any]]) -> int:
+        """Insere várias movimentações com um único INSERT multi-linha (sem commit)."""
+        if not movimentacoes:
+            return 0
+        await self.session.execute(insert(MovimentacaoMetaORM).values(list(movimentacoes)))
+        return len(movimentacoes)
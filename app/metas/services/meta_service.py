@@ -1,17 +1,22 @@
+import logging
 from datetime import date
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.metas.domain.meta import Meta, CategoriaMetaEnum
-from app.metas.domain.movimentacao_meta import MovimentacaoMeta, AcaoMovimentacao
+from app.metas.domain.movimentacao_meta import AcaoMovimentacao, ResultadoMovimentacao
 from app.metas.repositories.meta_repository import MetaRepository
 from app.metas.repositories.movimentacao_meta_repository import MovimentacaoMetaRepository
 from app.metas.mappers.meta_mapper import orm_to_model, model_to_orm_new
-from app.metas.mappers.movimentacao_meta_mapper import model_to_orm_new as movimentacao_model_to_orm
+from app.shared.pagination import Page, PageParams
+from app.shared.transaction_service import transactional
+
+logger = logging.getLogger(__name__)
 
 
 class MetaService:
@@ -27,77 +32,37 @@ class MetaService:
         self.session = session
         self.movimentacao_repo = movimentacao_repo
 
-    # -------------------------------------------------------------------------
-    # Verificação automática de metas atrasadas
-    # -------------------------------------------------------------------------
-
-    async def _verificar_e_atualizar_status_atrasado(self, meta_orm) -> None:
-        """
-        Verifica se uma meta está atrasada e atualiza seu status automaticamente.
-        
-        Uma meta é considerada atrasada quando:
-        - A data atual é maior que a data de término (termina_em)
-        - O status atual é 'em_andamento' (não foi concluída ou cancelada)
-        
-        Args:
-            meta_orm: Objeto ORM da meta a ser verificada
-        """
-        if (
-            meta_orm.status == "em_andamento" 
-            and meta_orm.termina_em < date.today()
-        ):
-            meta_orm.status = "atrasada"
-            await self.repo.update(meta_orm)
-
-    async def _verificar_e_atualizar_lista_atrasadas(self, metas_orm: list) -> list:
-        """
-        Verifica e atualiza o status de uma lista de metas atrasadas.
-        
-        Args:
-            metas_orm: Lista de objetos ORM das metas a serem verificadas
-            
-        Returns:
-            Lista de metas ORM com status atualizado
-        """
-        for meta_orm in metas_orm:
-            await self._verificar_e_atualizar_status_atrasado(meta_orm)
-        return metas_orm
-
     # -------------------------------------------------------------------------
     # CRUD principal
     # -------------------------------------------------------------------------
 
-    async def listar_todas(self) -> list[Meta]:
-        """Lista todas as metas cadastradas (uso administrativo).
-        
-        Verifica automaticamente e atualiza o status das metas atrasadas.
+    async def listar_todas(self, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página de todas as metas cadastradas (uso administrativo).
+
+        Leitura pura: o status 'atrasada' é aplicado pelo job diário OverdueMetasJob.
+        Retorna as linhas do banco, serializadas direto pelo schema de resposta.
         """
-        metas_orm = await self.repo.list_all()
-        await self._verificar_e_atualizar_lista_atrasadas(list(metas_orm))
-        return [orm_to_model(meta) for meta in metas_orm]
+        return await self.repo.list_all(page)
 
-    async def listar_por_pessoa(self, id_pessoa: UUID) -> list[Meta]:
-        """Lista todas as metas vinculadas a uma pessoa.
-        
-        Verifica automaticamente e atualiza o status das metas atrasadas.
+    async def listar_por_pessoa(self, id_pessoa: UUID, page: PageParams) -> Page[Row[Any]]:
+        """Lista uma página das metas vinculadas a uma pessoa.
+
+        Leitura pura: o status 'atrasada' é aplicado pelo job diário OverdueMetasJob.
+        Retorna as linhas do banco, serializadas direto pelo schema de resposta.
         """
-        metas_orm = await self.repo.list_by_pessoa(id_pessoa)
-        if not metas_orm:
-            return []
-        await self._verificar_e_atualizar_lista_atrasadas(list(metas_orm))
-        return [orm_to_model(meta) for meta in metas_orm]
+        return await self.repo.list_by_pessoa(id_pessoa, page)
 
     async def buscar_por_id(self, id_meta: int) -> Meta:
         """Busca uma meta específica pelo ID.
-        
-        Verifica automaticamente e atualiza o status se a meta estiver atrasada.
+
+        Leitura pura: o status 'atrasada' é aplicado pelo job diário OverdueMetasJob.
         """
         meta_orm = await self.repo.get_by_id(id_meta)
         if not meta_orm:
             raise ValueError("Meta não encontrada.")
-        await self._verificar_e_atualizar_status_atrasado(meta_orm)
         return orm_to_model(meta_orm)
 
+    @transactional
     async def criar(self, dados: dict[str, Any]) -> Meta:
         """
         Cria uma nova meta financeira.
@@ -154,7 +119,7 @@ class MetaService:
             meta_criada = await self.repo.add(nova_meta)
             meta_model = orm_to_model(meta_criada)
             
-            # Cria alerta automaticamente quando meta é criada
+            # Cria alerta automaticamente quando meta é criada (via outbox, no mesmo commit)
             if self.session:
                 try:
                     from app.alertas.services.alerta_service import AlertaService
@@ -166,11 +131,9 @@ class MetaService:
                         user_id=meta_model.fk_pessoa_id_pessoa,
                         session=self.session
                     )
-                except Exception as e:
+                except Exception:
                     # Loga o erro mas não falha a criação da meta se o alerta falhar
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Erro ao criar alerta automático após criação de meta: {e}")
+                    logger.exception("Erro ao criar alerta automático após criação de meta")
             
             return meta_model
         except IntegrityError as e:
@@ -178,6 +141,7 @@ class MetaService:
         except Exception as e:
             raise ValueError(f"Erro inesperado ao criar meta: {e}")
 
+    @transactional
     async def atualizar(self, id_meta: int, dados: dict[str, Any]) -> Meta:
         """
         Atualiza os campos de uma meta existente.
@@ -216,6 +180,7 @@ class MetaService:
         except IntegrityError as e:
             raise ValueError(f"Erro ao atualizar meta: {e}")
 
+    @transactional
     async def remover(self, id_meta: int) -> None:
         """Remove uma meta existente."""
         meta = await self.repo.get_by_id(id_meta)
@@ -227,6 +192,7 @@ class MetaService:
     # Regras de negócio adicionais
     # -------------------------------------------------------------------------
 
+    @transactional
     async def atualizar_progresso(self, id_meta: int, novo_valor: Decimal) -> Meta:
         """
         Incrementa ou redefine o progresso de uma meta.
@@ -252,6 +218,7 @@ class MetaService:
         meta_atualizada = await self.repo.update(model_to_orm_new(meta))
         return orm_to_model(meta_atualizada)
 
+    @transactional
     async def atualizar_saldo(
         self,
         id_meta: int,
@@ -270,6 +237,11 @@ class MetaService:
         - Não permite valor_atual ficar negativo após retirada
         - Cria registro na tabela de movimentações
         
+        O saldo é alterado e a movimentação gravada por um único UPDATE ... RETURNING
+        (ver `MetaRepository.apply_movement`): o incremento é aplicado pelo banco sobre o
+        valor corrente, então depósitos simultâneos não se perdem. A meta só é lida de
+        novo quando o UPDATE não casa nenhuma linha, para explicar o motivo.
+        
         Args:
             id_meta: ID da meta a ser atualizada
             user_id: ID do usuário autenticado (para validação de propriedade)
@@ -283,19 +255,6 @@ class MetaService:
         Raises:
             ValueError: Se meta não existir, não pertencer ao usuário, ou operação inválida
         """
-        if not self.movimentacao_repo:
-            raise ValueError("Repositório de movimentação não configurado.")
-        
-        # Busca a meta
-        meta_orm = await self.repo.get_by_id(id_meta)
-        if not meta_orm:
-            raise ValueError("Meta não encontrada.")
-        
-        # Valida propriedade
-        meta = orm_to_model(meta_orm)
-        if meta.fk_pessoa_id_pessoa != user_id:
-            raise ValueError("Você não tem permissão para atualizar esta meta.")
-        
         # Valida action
         if not AcaoMovimentacao.is_valid(action):
             raise ValueError(f"Ação inválida. Deve ser 'adicionado' ou 'retirado'.")
@@ -305,81 +264,151 @@ class MetaService:
         if valor_normalizado <= 0:
             raise ValueError("Valor deve ser maior que zero.")
         
-        # Calcula novo valor_atual
-        if action == AcaoMovimentacao.ADICIONADO.value:
-            novo_valor_atual = meta.valor_atual + valor_normalizado
-        elif action == AcaoMovimentacao.RETIRADO.value:
-            novo_valor_atual = meta.valor_atual - valor_normalizado
-            # Valida que não fique negativo
-            if novo_valor_atual < 0:
-                raise ValueError(
-                    f"Não é possível retirar {valor_normalizado}. "
-                    f"Saldo atual: {meta.valor_atual}. "
-                    f"Saldo mínimo permitido: 0."
-                )
-        else:
-            raise ValueError(f"Ação inválida: {action}")
-        
-        # Atualiza valor_atual da meta
-        meta.valor_atual = novo_valor_atual
+        delta = valor_normalizado if action == AcaoMovimentacao.ADICIONADO.value else -valor_normalizado
         
-        # Atualiza status se necessário
-        if meta.valor_atual >= meta.valor_alvo and meta.status == "em_andamento":
-            meta.status = "concluida"
-        
-        # Atualiza meta no banco
         try:
-            meta_atualizada_orm = await self.repo.update(model_to_orm_new(meta))
-            
-            # Cria registro de movimentação
-            movimentacao = MovimentacaoMeta(
-                id_movimentacao=None,
-                fk_meta_id_meta=id_meta,
-                valor=valor_normalizado,
-                acao=action,
-                data=data_movimentacao,
+            linha = await self.repo.apply_movement(
+                id_meta, user_id, delta=delta, acao=action, data=data_movimentacao
             )
-            movimentacao_orm = movimentacao_model_to_orm(movimentacao)
-            await self.movimentacao_repo.add(movimentacao_orm)
-            
-            # Cria alerta automaticamente quando movimentação é criada
-            if self.session:
-                try:
-                    from app.alertas.services.alerta_service import AlertaService
-                    alerta_service = AlertaService(None)  # Não precisa de repo para criar_alerta_automatico
+        except IntegrityError as e:
+            raise ValueError(f"Erro ao atualizar saldo da meta: {e}")
+        
+        if linha is None:
+            # Nenhuma linha alterada: descobre o motivo para a mensagem de erro
+            meta_orm = await self.repo.get_by_id(id_meta)
+            if not meta_orm:
+                raise ValueError("Meta não encontrada.")
+            if meta_orm.fk_pessoa_id_pessoa != user_id:
+                raise ValueError("Você não tem permissão para atualizar esta meta.")
+            raise ValueError(
+                f"Não é possível retirar {valor_normalizado}. "
+                f"Saldo atual: {meta_orm.valor_atual}. "
+                f"Saldo mínimo permitido: 0."
+            )
+        
+        meta = Meta(**linha)
+        
+        # Cria alerta automaticamente quando movimentação é criada (via outbox, no mesmo commit)
+        if self.session:
+            try:
+                from app.alertas.services.alerta_service import AlertaService
+                alerta_service = AlertaService(None)  # Não precisa de repo para criar_alerta_automatico
+
+                if action == AcaoMovimentacao.ADICIONADO.value:
+                    msg = f"Você adicionou R$ {valor_normalizado} a sua meta de {meta.categoria}."
+                else:
+                    msg = f"Você retirou R$ {valor_normalizado} da sua meta de {meta.categoria}."
+
+                await alerta_service.criar_alerta_automatico(
+                    # data=data_movimentacao,
+                    conteudo=msg,
+                    user_id=user_id,
+                    session=self.session
+                )
 
-                    if action == AcaoMovimentacao.ADICIONADO.value:
-                        msg = f"Você adicionou R$ {valor_normalizado} a sua meta de {meta.categoria}."
-                    else:
-                        msg = f"Você retirou R$ {valor_normalizado} da sua meta de {meta.categoria}."
+            except Exception:
+                # Loga o erro mas não falha a criação da movimentação se o alerta falhar
+                logger.exception("Erro ao criar alerta automático após movimentação")
+        
+        return meta
 
-                    await alerta_service.criar_alerta_automatico(
-                        # data=data_movimentacao,
-                        conteudo=msg,
-                        user_id=user_id,
-                        session=self.session
+    @transactional
+    async def atualizar_saldo_lote(
+        self, user_id: UUID, itens: list[dict[str, Any]]
+    ) -> list[ResultadoMovimentacao]:
+        """
+        Aplica um lote de movimentações (depósitos/retiradas) em metas do usuário.
+
+        Cada item tem 'id_meta', 'action', 'valor' e 'data' e é avaliado com as mesmas
+        regras de `atualizar_saldo`, na ordem recebida: um item inválido (meta de outra
+        pessoa, saldo insuficiente...) é recusado sem afetar os demais.
+
+        Custo fixo por lote, independente do número de itens:
+        - uma consulta lê e trava (FOR UPDATE) o saldo de todas as metas envolvidas;
+        - um INSERT multi-linha grava as movimentações aceitas;
+        - um UPDATE ... FROM (VALUES ...) aplica o delta total de cada meta;
+        - um alerta por meta alterada (em vez de um por movimentação).
+
+        Returns:
+            Um resultado por item, na ordem de entrada, com o saldo após o item.
+        """
+        if not self.movimentacao_repo:
+            raise ValueError("Repositório de movimentação não configurado.")
+
+        metas = {
+            linha["id_meta"]: linha
+            for linha in await self.repo.lock_balances(sorted({item["id_meta"] for item in itens}), user_id)
+        }
+        saldos = {id_meta: linha["valor_atual"] for id_meta, linha in metas.items()}
+        deltas: dict[int, Decimal] = {}
+        contagem: dict[int, int] = {}
+        movimentacoes: list[dict[str, Any]] = []
+        resultados: list[ResultadoMovimentacao] = []
+
+        for indice, item in enumerate(itens):
+            id_meta, action = item["id_meta"], item["action"]
+            valor_normalizado = abs(Decimal(str(item["valor"])))
+            meta = metas.get(id_meta)
+
+            erro: str | None = None
+            if not AcaoMovimentacao.is_valid(action):
+                erro = "Ação inválida. Deve ser 'adicionado' ou 'retirado'."
+            elif valor_normalizado <= 0:
+                erro = "Valor deve ser maior que zero."
+            elif meta is None:
+                # lock_balances só devolve metas do usuário: inexistente ou de outra pessoa
+                erro = "Meta não encontrada ou sem permissão para atualizá-la."
+            else:
+                delta = valor_normalizado if action == AcaoMovimentacao.ADICIONADO.value else -valor_normalizado
+                if saldos[id_meta] + delta < 0:
+                    erro = (
+                        f"Não é possível retirar {valor_normalizado}. "
+                        f"Saldo atual: {saldos[id_meta]}. "
+                        f"Saldo mínimo permitido: 0."
                     )
 
-                except Exception as e:
-                    # Loga o erro mas não falha a criação da movimentação se o alerta falhar
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Erro ao criar alerta automático após movimentação: {e}")
-            
-            return orm_to_model(meta_atualizada_orm)
+            if erro is not None:
+                resultados.append(ResultadoMovimentacao(indice, id_meta, False, erro))
+                continue
+
+            saldos[id_meta] += delta
+            deltas[id_meta] = deltas.get(id_meta, Decimal(0)) + delta
+            contagem[id_meta] = contagem.get(id_meta, 0) + 1
+            movimentacoes.append(
+                {"fk_meta_id_meta": id_meta, "valor": valor_normalizado, "acao": action, "data": item["data"]}
+            )
+            resultados.append(ResultadoMovimentacao(indice, id_meta, True, valor_atual=saldos[id_meta]))
+
+        try:
+            await self.movimentacao_repo.add_many(movimentacoes)
+            await self.repo.apply_deltas(deltas)
         except IntegrityError as e:
-            raise ValueError(f"Erro ao atualizar saldo da meta: {e}")
+            raise ValueError(f"Erro ao atualizar saldo das metas: {e}")
+
+        # Um alerta por meta alterada, via outbox no mesmo commit (um INSERT multi-linha no flush)
+        if self.session:
+            from app.alertas.services.alerta_service import AlertaService
+            alerta_service = AlertaService(None)  # Não precisa de repo para criar_alerta_automatico
+            for id_meta, quantidade in contagem.items():
+                msg = (
+                    f"Você registrou {quantidade} movimentação(ões) na sua meta de "
+                    f"{metas[id_meta]['categoria']}. Saldo atual: R$ {saldos[id_meta]}."
+                )
+                await alerta_service.criar_alerta_automatico(conteudo=msg, user_id=user_id, session=self.session)
+
+        return resultados
 
-    async def listar_movimentacoes(self, id_meta: int, user_id: UUID) -> list[MovimentacaoMeta]:
+    async def listar_movimentacoes(self, id_meta: int, user_id: UUID, page: PageParams) -> Page[Row[Any]]:
         """
-        Lista todas as movimentações de uma meta.
+        Lista uma página das movimentações de uma meta.
         
         Args:
             id_meta: ID da meta
             user_id: ID do usuário autenticado (para validação de propriedade)
+            page: cursor e tamanho da página
             
         Returns:
-            Lista de movimentações da meta
+            Página de movimentações da meta (mais recentes primeiro), como linhas do banco
             
         Raises:
             ValueError: Se meta não existir ou não pertencer ao usuário
@@ -392,7 +421,4 @@ class MetaService:
         if meta.fk_pessoa_id_pessoa != user_id:
             raise ValueError("Você não tem permissão para acessar as movimentações desta meta.")
         
-        # Busca movimentações
-        movimentacoes_orm = await self.movimentacao_repo.list_by_meta_id(id_meta)
-        from app.metas.mappers.movimentacao_meta_mapper import orm_to_model as movimentacao_orm_to_model
-        return [movimentacao_orm_to_model(m) for m in movimentacoes_orm]
+        return await self.movimentacao_repo.list_by_meta_id(id_meta, page)
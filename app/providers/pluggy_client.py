@@ -1,14 +1,45 @@
 # app/providers/pluggy_client.py (ou app/integracoes/pluggy_client.py)
-import httpx
+import asyncio
+import time
 from typing import Any
 
+import httpx
+
+from app.core.metrics import InstrumentedTransport
+
+# A Pluggy emite API keys válidas por 2 horas.
+API_KEY_TTL_SECONDS = 2 * 60 * 60
+# Renova a API key um pouco antes de expirar para não usar uma chave vencida em voo.
+API_KEY_REFRESH_MARGIN_SECONDS = 5 * 60
+
 
 class PluggyClient:
-    def __init__(self, base_url: str, client_id: str, client_secret: str, timeout: int = 30) -> None:
-        self._client = httpx.AsyncClient(base_url=base_url.rstrip("/"), timeout=timeout)
+    def __init__(
+        self,
+        base_url: str,
+        client_id: str,
+        client_secret: str,
+        timeout: int = 30,
+        *,
+        api_key_ttl: float = API_KEY_TTL_SECONDS,
+        refresh_margin: float = API_KEY_REFRESH_MARGIN_SECONDS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            timeout=timeout,
+            transport=InstrumentedTransport(transport or httpx.AsyncHTTPTransport()),
+        )
         self.client_id = client_id
         self.client_secret = client_secret
 
+        # Cache da API key (em memória, por processo)
+        self._api_key_ttl = api_key_ttl
+        self._refresh_margin = refresh_margin
+        self._api_key: str | None = None
+        self._api_key_expires_at = 0.0
+        self._api_key_lock = asyncio.Lock()
+
     async def close(self) -> None:
         await self._client.aclose()
 
@@ -35,6 +66,52 @@ class PluggyClient:
         r.raise_for_status()
         return r.json()  # type: ignore[no-any-return]
 
+    async def _get_authenticated(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """
+        GET autenticado com a API key em cache.
+        Se a Pluggy responder 401 (chave revogada/expirada antes do previsto),
+        renova a chave uma única vez e repete a chamada.
+        """
+        api_key = await self.api_key()
+        r = await self._client.get(path, params=params or {}, headers={"X-API-Key": api_key})
+        if r.status_code == httpx.codes.UNAUTHORIZED:
+            api_key = await self.api_key(force_refresh=True, stale_key=api_key)
+            r = await self._client.get(path, params=params or {}, headers={"X-API-Key": api_key})
+        r.raise_for_status()
+        return r.json()
+
+    # ---------- cache da API key ----------
+    def _api_key_is_fresh(self) -> bool:
+        return self._api_key is not None and time.monotonic() < self._api_key_expires_at - self._refresh_margin
+
+    def invalidate_api_key(self) -> None:
+        """Descarta a API key em cache; a próxima chamada autentica de novo."""
+        self._api_key = None
+        self._api_key_expires_at = 0.0
+
+    async def api_key(self, *, force_refresh: bool = False, stale_key: str | None = None) -> str:
+        """
+        Retorna a API key em cache, renovando-a quando estiver perto de expirar.
+
+        A renovação é single-flight: várias corrotinas concorrentes aguardam o
+        mesmo lock e apenas a primeira chama /auth; as demais reaproveitam a chave nova.
+        `stale_key` indica a chave que falhou com 401 — se outra corrotina já a
+        substituiu, não há necessidade de autenticar de novo.
+        """
+        if not force_refresh and self._api_key_is_fresh():
+            return self._api_key  # type: ignore[return-value]
+
+        async with self._api_key_lock:
+            if force_refresh and self._api_key is not None and self._api_key != stale_key:
+                return self._api_key
+            if not force_refresh and self._api_key_is_fresh():
+                return self._api_key  # type: ignore[return-value]
+
+            api_key = await self.auth_token()
+            self._api_key = api_key
+            self._api_key_expires_at = time.monotonic() + self._api_key_ttl
+            return api_key
+
     # ---------- tokens ----------
     async def auth_token(self) -> str:
         """
@@ -56,25 +133,34 @@ class PluggyClient:
         Gera o token para o Pluggy Connect. Alguns ambientes devolvem 'connectToken',
         outros 'token' ou até 'accessToken'. Tornamos tolerante e normalizamos.
         """
-        api_key = await self.auth_token()
-
-        async def try_path(path: str, headers: dict[str, str]) -> str | None:
-            data = await self._post_json(path, {}, headers=headers)
+        api_key = await self.api_key()
+        renovada = False
+
+        async def try_path(path: str, headers: dict[str, str]) -> tuple[str | None, int]:
+            r = await self._client.post(path, json={}, headers=headers)
+            if 500 <= r.status_code:
+                r.raise_for_status()
+            data = r.json()
             for k in ("connectToken", "token", "accessToken", "access_token"):
                 v = data.get(k)
                 if isinstance(v, str) and v:
-                    return v
-            return None
+                    return v, r.status_code
+            return None, r.status_code
 
         # Preferência: X-API-Key
         for path in ("/connect_token", "/connect/token"):
-            tok = await try_path(path, {"X-API-Key": api_key})
+            tok, status = await try_path(path, {"X-API-Key": api_key})
+            if status == httpx.codes.UNAUTHORIZED and not renovada:
+                # A chave em cache pode ter sido revogada: renova uma única vez e repete o path
+                renovada = True
+                api_key = await self.api_key(force_refresh=True, stale_key=api_key)
+                tok, _ = await try_path(path, {"X-API-Key": api_key})
             if tok:
                 return tok
 
         # Fallback: Bearer
         for path in ("/connect_token", "/connect/token"):
-            tok = await try_path(path, {"Authorization": f"Bearer {api_key}"})
+            tok, _ = await try_path(path, {"Authorization": f"Bearer {api_key}"})
             if tok:
                 return tok
 
@@ -86,12 +172,7 @@ class PluggyClient:
         """
         Lista as contas vinculadas a um item (instituição conectada).
         """
-        api_key = await self.auth_token()
-        data = await self._get(
-            "/accounts",
-            params={"itemId": item_id},
-            headers={"X-API-Key": api_key},
-        )
+        data = await self._get_authenticated("/accounts", params={"itemId": item_id})
         if isinstance(data, list):
             return data
         return data.get("results", [])
@@ -100,12 +181,7 @@ class PluggyClient:
         """
         Busca uma conta específica pelo accountId.
         """
-        api_key = await self.auth_token()
-        data = await self._get(
-            f"/accounts/{account_id}",
-            params={},
-            headers={"X-API-Key": api_key},
-        )
+        data = await self._get_authenticated(f"/accounts/{account_id}")
         # Aqui a API normalmente retorna um objeto único
         return data
 
@@ -120,18 +196,13 @@ class PluggyClient:
         Lista transações de uma conta.
         from_date/to_date devem estar no formato 'YYYY-MM-DD', se usados.
         """
-        api_key = await self.auth_token()
         params: dict[str, Any] = {"accountId": account_id}
         if from_date:
             params["from"] = from_date
         if to_date:
             params["to"] = to_date
 
-        data = await self._get(
-            "/transactions",
-            params=params,
-            headers={"X-API-Key": api_key},
-        )
+        data = await self._get_authenticated("/transactions", params=params)
 
         if isinstance(data, list):
             return data
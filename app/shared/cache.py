@@ -0,0 +1,175 @@
+"""Caching primitives shared across modules."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.shared.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries expire ``ttl`` seconds after being stored.
+
+    The cache lives in the memory of a single process: invalidations done in one
+    uvicorn worker are not seen by the others, so ``ttl`` is also the upper bound
+    for how long another worker may serve a stale entry. A ``maxsize`` or ``ttl``
+    of zero disables the cache.
+
+    Not thread-safe; intended to be used from the event loop thread only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, *, timer: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for ``key``, or ``None`` if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= self._timer():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        self._data[key] = (self._timer() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove ``key`` from the cache, returning its value if present."""
+        item = self._data.pop(key, None)
+        return item[1] if item else None
+
+    def discard_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Remove every entry matching ``predicate`` and return how many were removed."""
+        keys = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+
+class TwoTierCache:
+    """Read-through cache with an in-process :class:`TTLCache` in front of Redis.
+
+    Values are JSON documents stored in Redis under ``{namespace}:v{version}:{key}``.
+    :meth:`invalidate` bumps the namespace version with ``INCR``, which orphans every entry of
+    the namespace at once (they simply expire) and clears this process's local tier. Other
+    processes see the new version once their local entries expire, so ``local_ttl`` bounds how
+    long they may serve stale data.
+
+    Redis errors are logged and treated as misses: the loader still answers, uncached in Redis.
+    ``None`` results (e.g. "not found") are never cached. A ``ttl`` of zero disables the cache.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        ttl: float,
+        local_ttl: float,
+        local_maxsize: int = 1024,
+        client_factory: Callable[[], Redis] = get_redis_client,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local: TTLCache[str, Any] = TTLCache(local_maxsize, local_ttl, timer=timer)
+        self._client_factory = client_factory
+
+    @property
+    def enabled(self) -> bool:
+        """Whether values are cached at all."""
+        return self.ttl > 0
+
+    @property
+    def version_key(self) -> str:
+        """Redis key holding the current version of the namespace."""
+        return f"{self.namespace}:version"
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key``, calling ``loader`` and caching its result on a miss.
+
+        The loader must return JSON-serializable data (dicts, lists, scalars). Hits from either
+        tier return the JSON-decoded form, so callers always get the same shape.
+        """
+        if not self.enabled:
+            return await loader()
+
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        client: Redis | None = None
+        redis_key = None
+        try:
+            client = self._client_factory()
+            version = await client.get(self.version_key) or "0"
+            redis_key = f"{self.namespace}:v{version}:{key}"
+            raw = await client.get(redis_key)
+        except (RedisError, OSError) as exc:
+            logger.warning("Cache %s: Redis unavailable on read (%s)", self.namespace, exc)
+            raw = None
+
+        if raw is None:
+            loaded = await loader()
+            if loaded is None:
+                return None
+            raw = json.dumps(loaded, default=str)
+            if client is not None and redis_key is not None:
+                try:
+                    await client.set(redis_key, raw, ex=math.ceil(self.ttl))
+                except (RedisError, OSError) as exc:
+                    logger.warning("Cache %s: Redis unavailable on write (%s)", self.namespace, exc)
+
+        value = json.loads(raw)
+        self.local.set(key, value)
+        return value
+
+    async def invalidate(self) -> None:
+        """Drop every entry of the namespace, in this process and (via a new version) in Redis."""
+        self.local.clear()
+        if not self.enabled:
+            return
+        try:
+            await self._client_factory().incr(self.version_key)
+        except (RedisError, OSError) as exc:
+            logger.warning("Cache %s: Redis unavailable on invalidate (%s)", self.namespace, exc)
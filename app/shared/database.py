@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
-from app.core.settings import settings
+from app.core.settings import Settings, settings
 
 
 # ════════════════════════════════════════════
@@ -22,12 +26,51 @@ class Base(DeclarativeBase):
 # ════════════════════════════════════════════
 # Engine e SessionMaker (era app/db/session.py)
 # ════════════════════════════════════════════
-engine = create_async_engine(
-    str(settings.database_url),
-    echo=settings.debug,
-    future=True,
-    pool_pre_ping=True,
-)
+def engine_options(cfg: Settings) -> dict[str, Any]:
+    """Keyword arguments for ``create_async_engine`` derived from settings.
+
+    Pool sizing is per process: with N uvicorn workers the database sees up to
+    N * (db_pool_size + db_max_overflow) connections in queue mode.
+
+    ``db_pool_mode="null"`` targets PgBouncer in transaction mode: connections are not kept by
+    SQLAlchemy (PgBouncer pools them) and server-side prepared statements are disabled, since
+    consecutive statements may land on different backends.
+    """
+    options: dict[str, Any] = {"echo": cfg.debug, "pool_pre_ping": cfg.db_pool_pre_ping}
+    if cfg.db_pool_mode == "null":
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=cfg.db_pool_size,
+            max_overflow=cfg.db_max_overflow,
+            pool_timeout=cfg.db_pool_timeout_seconds,
+            pool_recycle=cfg.db_pool_recycle_seconds,
+        )
+
+    if make_url(cfg.database_url).get_driver_name() == "asyncpg":
+        connect_args: dict[str, Any] = {
+            "command_timeout": cfg.db_command_timeout_seconds,
+            "server_settings": {
+                "application_name": cfg.db_application_name,
+                "jit": "on" if cfg.db_jit else "off",
+            },
+        }
+        if cfg.db_pool_mode == "null":
+            connect_args.update(
+                statement_cache_size=0,
+                prepared_statement_cache_size=0,
+                prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+            )
+        else:
+            connect_args.update(
+                statement_cache_size=cfg.db_statement_cache_size,
+                prepared_statement_cache_size=cfg.db_statement_cache_size,
+            )
+        options["connect_args"] = connect_args
+    return options
+
+
+engine = create_async_engine(str(settings.database_url), **engine_options(settings))
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -40,12 +83,14 @@ AsyncSessionLocal = async_sessionmaker(
 # Dependency injection para FastAPI
 # ════════════════════════════════════════════
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Provide a request-scoped async SQLAlchemy session."""
+    """Provide the request-scoped async SQLAlchemy session.
+
+    This is the only session dependency: FastAPI caches a dependency's value per request, so
+    authentication (``get_current_user_id``) and every service resolved for the same request
+    share this one session and check out a single pooled connection.
+    """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 # ════════════════════════════════════════════
@@ -63,6 +108,3 @@ async def init_db(create_all: bool = True) -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
-
-async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
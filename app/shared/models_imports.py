@@ -16,6 +16,7 @@ def import_all_models() -> None:
     """
     # fmt: off
     from app.alertas.persistence.alerta_orm import AlertaORM  # noqa: F401
+    from app.alertas.persistence.alerta_outbox_orm import AlertaOutboxORM  # noqa: F401
     from app.comercial.persistence.assinatura_orm import AssinaturaORM  # noqa: F401
     from app.comercial.persistence.plano_orm import PlanoORM  # noqa: F401
     from app.comercial.persistence.solicitacao_pagamento_orm import (  # noqa: F401
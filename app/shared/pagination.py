@@ -0,0 +1,179 @@
+"""Keyset (cursor) pagination shared by the list endpoints.
+
+A page is fetched with ``WHERE (k1, k2, ...) > (:v1, :v2, ...) ORDER BY k1, k2, ... LIMIT n + 1``
+(``<`` and ``DESC`` for descending listings), so the cost of a page does not grow with how far
+the client has scrolled. The last key tuple of a page is handed back to the client as an opaque,
+URL-safe cursor; the extra row tells whether there is a next page.
+
+The order keys must end in a unique column (usually the primary key) so that the ordering is total.
+
+List endpoints select plain columns (``Row`` tuples) and hand the page to :func:`page_json`, which
+validates and serializes it in one pydantic-core pass through a pre-built ``TypeAdapter``, with no
+ORM instances, domain objects or intermediate dicts per row. Hot endpoints whose rows come straight
+from our own tables use :func:`trusted_page_json`, which skips validation altogether.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from fastapi import Query, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.shared.responses import ORJSONResponse
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """Requested page: opaque cursor from the previous page (``None`` for the first) and size."""
+
+    cursor: str | None = None
+    limit: int = DEFAULT_PAGE_SIZE
+
+
+def page_params(
+    cursor: str | None = Query(None, description="Cursor retornado em `next_cursor` pela página anterior"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Quantidade máxima de itens"),
+) -> PageParams:
+    """FastAPI dependency reading ``?cursor=&limit=`` from the query string."""
+    return PageParams(cursor=cursor, limit=limit)
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results plus the cursor for the next one (``None`` on the last page)."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    def map(self, fn: Callable[[T], U]) -> Page[U]:
+        """Return a page with ``fn`` applied to every item, keeping the cursor."""
+        return Page([fn(item) for item in self.items], self.next_cursor)
+
+
+class PageResponse(BaseModel, Generic[T]):
+    """Response envelope for paginated endpoints."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Serialize a key tuple into an opaque, URL-safe cursor."""
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: Sequence[InstrumentedAttribute[Any]]) -> list[Any]:
+    """Parse a cursor produced by :func:`encode_cursor` back into values typed after ``keys``.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match ``keys``.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        return [_from_json(key, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Cursor de paginação inválido.") from None
+
+
+def page_adapter(model: type[T]) -> TypeAdapter[PageResponse[T]]:
+    """Build (once, at import time) the adapter used by :func:`page_json` for ``model`` items."""
+    return TypeAdapter(PageResponse[model])  # type: ignore[valid-type]
+
+
+def page_json(adapter: TypeAdapter[PageResponse[Any]], page: Page[Any]) -> Response:
+    """Serialize ``page`` to a JSON response through a :func:`page_adapter` adapter.
+
+    Items are read by attribute, so ``Row`` tuples, ORM instances and dataclasses all work.
+    Returning a ``Response`` also skips FastAPI's second validation against ``response_model``,
+    which stays on the route only for the OpenAPI schema.
+    """
+    content = adapter.validate_python({"items": page.items, "next_cursor": page.next_cursor}, from_attributes=True)
+    return Response(adapter.dump_json(content), media_type="application/json")
+
+
+def trusted_page_json(model: type[BaseModel], page: Page[Any]) -> ORJSONResponse:
+    """Serialize ``page`` as ``PageResponse[model]`` JSON without validating the items.
+
+    Each item is read by attribute, one key per ``model`` field, and the result is encoded with
+    orjson in the same wire format as pydantic. Only use this for trusted data, such as rows selected
+    from the table that backs ``model``: constraints declared on ``model`` are not checked.
+    """
+    fields = tuple(model.model_fields)
+    items = [{name: getattr(item, name) for name in fields} for item in page.items]
+    return ORJSONResponse({"items": items, "next_cursor": page.next_cursor})
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select[Any],
+    keys: Sequence[InstrumentedAttribute[Any]],
+    params: PageParams,
+    *,
+    descending: bool = False,
+) -> Page[Any]:
+    """Run ``stmt`` (with its filters) for the page described by ``params``.
+
+    ``stmt`` may select one ORM entity (items are instances) or plain columns (items are
+    ``Row`` tuples, which must include the ``keys`` columns). ``keys`` are the ORM attributes
+    defining the order; all of them are sorted in the same direction so a single row-value
+    comparison can seek straight to the cursor position.
+    """
+    if params.cursor:
+        row, last = tuple_(*keys), tuple_(*decode_cursor(params.cursor, keys))
+        stmt = stmt.where(row < last if descending else row > last)
+    stmt = stmt.order_by(*(key.desc() if descending else key.asc() for key in keys)).limit(params.limit + 1)
+
+    result = await session.execute(stmt)
+    rows = list(result.scalars() if _selects_entity(stmt) else result.all())
+    if len(rows) <= params.limit:
+        return Page(rows)
+    rows = rows[: params.limit]
+    return Page(rows, encode_cursor([getattr(rows[-1], key.key) for key in keys]))
+
+
+def _selects_entity(stmt: Select[Any]) -> bool:
+    descriptions = stmt.column_descriptions
+    return len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _from_json(key: InstrumentedAttribute[Any], value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = key.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type in (int, str, UUID, Decimal):
+        return python_type(value)
+    return value
@@ -0,0 +1,67 @@
+"""Shared Redis connection pool.
+
+One ``redis.asyncio`` pool per process, created in the application lifespan and closed on
+shutdown. Features (caching, rate limiting, pub/sub) borrow connections from it through
+:func:`get_redis_client` or the ``get_redis`` FastAPI dependency instead of opening their own.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Redis | None = None
+
+
+def create_redis_client() -> Redis:
+    """Build a client over a new bounded pool sized and timed from settings.
+
+    ``BlockingConnectionPool`` makes callers wait up to ``redis_pool_timeout_seconds`` for a free
+    connection once ``redis_max_connections`` are in use, instead of failing immediately.
+    """
+    pool = BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout_seconds,
+        socket_timeout=settings.redis_socket_timeout_seconds,
+        socket_connect_timeout=settings.redis_socket_connect_timeout_seconds,
+        health_check_interval=settings.redis_health_check_interval_seconds,
+        decode_responses=True,
+    )
+    return Redis(connection_pool=pool)
+
+
+async def init_redis() -> Redis:
+    """Create the process-wide client and check connectivity.
+
+    A failed PING is logged, not raised: Redis-backed features degrade (caches fall back to the
+    database) instead of keeping the API from starting.
+    """
+    client = get_redis_client()
+    try:
+        await client.ping()
+    except (RedisError, OSError) as exc:
+        logger.warning("Redis unavailable at startup (%s): %s", settings.redis_url, exc)
+    return client
+
+
+def get_redis_client() -> Redis:
+    """Return the process-wide client, creating it on first use outside the lifespan (scripts, workers)."""
+    global _client
+    if _client is None:
+        _client = create_redis_client()
+    return _client
+
+
+async def close_redis_client() -> None:
+    """Close the process-wide client and disconnect every pooled connection."""
+    global _client
+    if _client is not None:
+        await _client.aclose(close_connection_pool=True)
+        _client = None
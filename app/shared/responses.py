@@ -0,0 +1,41 @@
+"""orjson-encoded JSON responses for data that needs no response-model validation.
+
+Routes with a ``response_model`` keep FastAPI's default ``JSONResponse``: FastAPI validates the
+return value and dumps it to JSON in Rust (pydantic-core), and any custom response class turns
+that fast path off. This module is for the other case, where the data comes straight from our
+own queries and validating it again would only burn CPU (see ``pagination.trusted_page_json``).
+
+The encoding matches pydantic's JSON output, so both paths produce the same wire format:
+``Decimal`` as a string (``"1500.00"``), ``UUID`` as its canonical string, dates as ISO 8601,
+and UTC datetimes with a ``Z`` suffix.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    # orjson only encodes the exact uuid.UUID type; asyncpg returns its own subclass for uuid columns
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` to JSON bytes with orjson (pydantic-compatible wire format)."""
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with :func:`dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
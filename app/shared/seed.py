@@ -1,17 +1,28 @@
 # app/shared/seed.py
+"""Seed do banco: dados demo e massa sintética para testes de carga.
+
+Não roda mais no startup por padrão (ver ``SEED_ON_STARTUP``). Linha de comando:
+
+    python -m app.shared.seed demo
+    python -m app.shared.seed synthetic --pessoas 10000 --metas 5 --movimentacoes 20 --alertas 10
+"""
 from __future__ import annotations
 
+import argparse
+import asyncio
+import logging
 from datetime import date, datetime
 from decimal import Decimal
-from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.database import async_session_maker  # ajusta o nome se for diferente
+from app.core.logging import configure_logging
+from app.core.settings import settings
+from app.shared.database import AsyncSessionLocal
+from app.shared.transaction import UnitOfWork
 
 from app.identidade.persistence.pessoa_orm import PessoaORM
-from app.identidade.persistence.sessao_orm import SessaoORM  # se não usar, pode remover
 from app.metas.persistence.meta_orm import MetaORM
 from app.comercial.persistence.plano_orm import PlanoORM
 from app.comercial.persistence.assinatura_orm import AssinaturaORM
@@ -19,22 +30,32 @@ from app.comercial.persistence.tipo_pagamento_orm import TipoPagamentoORM
 from app.comercial.persistence.solicitacao_pagamento_orm import SolicitacaoPagamentoORM
 
 
+logger = logging.getLogger(__name__)
+
 DEMO_EMAIL = "demo@fink.dev"
 
 
 async def seed_db() -> None:
-    print("[SEED] Iniciando seed do banco...")
-    async with async_session_maker() as session:
+    logger.info("[SEED] Iniciando seed do banco...")
+    # Tudo numa transação só: ou o demo inteiro é recriado, ou nada muda
+    async with AsyncSessionLocal() as session, UnitOfWork(session):
         # Limpa dados demo antes de popular
         await clear_demo_data(session)
-        
+
         await seed_tipos_pagamento(session)
         await seed_planos(session)
         pessoa_demo = await seed_pessoa_demo(session)
-        meta_demos = await seed_metas_demo(session, pessoa_demo)
+        await seed_metas_demo(session, pessoa_demo)
         assinatura_demo = await seed_assinatura_demo(session, pessoa_demo)
         await seed_solicitacao_pagamento_demo(session, assinatura_demo)
-    print("[SEED] Seed finalizado com sucesso!")
+
+    # Os catálogos podem estar em cache no Redis de uma base anterior
+    from app.comercial.services.plano_service import plano_cache
+    from app.comercial.services.tipo_pagamento_service import tipo_pagamento_cache
+
+    await plano_cache.invalidate()
+    await tipo_pagamento_cache.invalidate()
+    logger.info("[SEED] Seed finalizado com sucesso!")
 
 
 async def clear_demo_data(session: AsyncSession) -> None:
@@ -42,7 +63,7 @@ async def clear_demo_data(session: AsyncSession) -> None:
     Remove dados demo existentes antes de popular novamente.
     Isso permite que o seed seja idempotente e sempre crie dados frescos.
     """
-    print("[SEED] Limpando dados demo existentes...")
+    logger.info("[SEED] Limpando dados demo existentes...")
     
     # Busca pessoa demo
     result = await session.execute(
@@ -51,16 +72,15 @@ async def clear_demo_data(session: AsyncSession) -> None:
     pessoa = result.scalar_one_or_none()
     
     if pessoa:
-        print(f"[SEED] Removendo pessoa demo (ID: {pessoa.id_pessoa}) e dados relacionados...")
+        logger.info("[SEED] Removendo pessoa demo (ID: %s) e dados relacionados...", pessoa.id_pessoa)
         # Usa DELETE explícito para evitar problemas com tipos
         # O CASCADE no banco remove automaticamente: metas, alertas, sessões, assinaturas, etc.
         from sqlalchemy import delete
         stmt = delete(PessoaORM).where(PessoaORM.id_pessoa == pessoa.id_pessoa)
         await session.execute(stmt)
-        await session.commit()
-        print("[SEED] Dados demo removidos com sucesso!")
+        logger.info("[SEED] Dados demo removidos com sucesso!")
     else:
-        print("[SEED] Nenhum dado demo encontrado para remover.")
+        logger.info("[SEED] Nenhum dado demo encontrado para remover.")
 
 
 
@@ -85,7 +105,7 @@ async def seed_tipos_pagamento(session: AsyncSession) -> None:
     ]
 
     session.add_all([TipoPagamentoORM(tipo_pagamento=nome) for nome in tipos])
-    await session.commit()
+    await session.flush()
 
 
 # -------------------------- PLANOS ----------------------------
@@ -125,7 +145,7 @@ async def seed_planos(session: AsyncSession) -> None:
     ]
 
     session.add_all(planos)
-    await session.commit()
+    await session.flush()
 
 
 # -------------------------- PESSOA ----------------------------
@@ -151,9 +171,8 @@ async def seed_pessoa_demo(session: AsyncSession) -> PessoaORM:
     )
 
     session.add(pessoa)
-    await session.commit()
-    await session.refresh(pessoa)
-    print(f"[SEED] Pessoa demo criada (ID: {pessoa.id_pessoa})")
+    await session.flush()
+    logger.info("[SEED] Pessoa demo criada (ID: %s)", pessoa.id_pessoa)
     return pessoa
 
 
@@ -227,11 +246,9 @@ async def seed_metas_demo(session: AsyncSession, pessoa: PessoaORM) -> list[Meta
         session.add(meta)
         metas_criadas.append(meta)
 
-    await session.commit()
-    for meta in metas_criadas:
-        await session.refresh(meta)
+    await session.flush()
 
-    print(f"[SEED] {len(metas_criadas)} metas demo criadas")
+    logger.info("[SEED] %d metas demo criadas", len(metas_criadas))
     return metas_criadas
 
 # ------------------------ ASSINATURA --------------------------
@@ -263,9 +280,8 @@ async def seed_assinatura_demo(session: AsyncSession, pessoa: PessoaORM) -> Assi
     )
 
     session.add(assinatura)
-    await session.commit()
-    await session.refresh(assinatura)
-    print(f"[SEED] Assinatura demo criada (Plano: {plano.titulo})")
+    await session.flush()
+    logger.info("[SEED] Assinatura demo criada (Plano: %s)", plano.titulo)
     return assinatura
 
 
@@ -296,7 +312,57 @@ async def seed_solicitacao_pagamento_demo(
     )
 
     session.add(solicitacao)
-    await session.commit()
-    print("[SEED] Solicitação de pagamento demo criada")
+    await session.flush()
+    logger.info("[SEED] Solicitação de pagamento demo criada")
+
+
+# ---------------------------- CLI -----------------------------
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.shared.seed", description="Popula o banco de dados.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("demo", help="recria a pessoa demo, planos, tipos de pagamento etc.")
+    synthetic = sub.add_parser("synthetic", help="gera massa sintética em bulk (COPY) para testes de carga")
+    synthetic.add_argument("--pessoas", type=int, required=True)
+    synthetic.add_argument("--metas", type=int, default=5, help="metas por pessoa")
+    synthetic.add_argument("--movimentacoes", type=int, default=20, help="movimentações por meta")
+    synthetic.add_argument("--alertas", type=int, default=10, help="alertas por pessoa")
+    synthetic.add_argument("--chunk-size", type=int, default=1000, help="pessoas por transação")
+    synthetic.add_argument(
+        "--seed", type=int, default=42, help="seed do gerador (execuções com a mesma seed se substituem)"
+    )
+    args = parser.parse_args(argv)
+
+    # Fora da app os relationships só resolvem com todos os models registrados
+    from app.shared import models_imports  # noqa: F401
+
+    if settings.environment == "production":
+        parser.error("seed desabilitado em produção")
+
+    logging_pipeline = configure_logging(settings.log_level, json_format=settings.log_json)
+    try:
+        _run(args)
+    finally:
+        logging_pipeline.stop()
+
+
+def _run(args: argparse.Namespace) -> None:
+    if args.comando == "demo":
+        asyncio.run(seed_db())
+    else:
+        from app.shared.seed_synthetic import SyntheticSpec, seed_synthetic
+
+        spec = SyntheticSpec(
+            pessoas=args.pessoas,
+            metas_por_pessoa=args.metas,
+            movimentacoes_por_meta=args.movimentacoes,
+            alertas_por_pessoa=args.alertas,
+            chunk_size=args.chunk_size,
+            seed=args.seed,
+        )
+        asyncio.run(seed_synthetic(spec))
 
 
+if __name__ == "__main__":
+    main()
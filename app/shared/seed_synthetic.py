@@ -0,0 +1,259 @@
+"""Geração de massa de dados sintética para testes de carga.
+
+Cria N pessoas, cada uma com M metas, K movimentações por meta e A alertas, em lotes de
+``chunk_size`` pessoas (uma transação por lote, memória constante). Com asyncpg as linhas vão por
+``COPY`` (``copy_records_to_table``); em outros drivers, por ``insert().values([...])`` em lotes.
+
+Os ids das metas são reservados na sequence antes do COPY, para que as movimentações já saiam com
+a FK certa sem um round trip por meta. O saldo (``valor_atual``) e o status de cada meta batem com
+as movimentações geradas. A geração é determinística para uma mesma ``seed``.
+
+Uso: ``python -m app.shared.seed synthetic --pessoas 10000 --metas 5 --movimentacoes 20``.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Table, delete, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.alertas.persistence.alerta_orm import AlertaORM
+from app.identidade.persistence.pessoa_orm import PessoaORM
+from app.metas.persistence.meta_orm import MetaORM
+from app.metas.persistence.movimentacao_meta_orm import MovimentacaoMetaORM
+from app.shared.database import AsyncSessionLocal
+from app.shared.transaction import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+EMAIL_DOMAIN = "fink.dev"
+
+# Limite de parâmetros por statement no protocolo do PostgreSQL
+MAX_BIND_PARAMS = 32767
+
+PESSOA_COLUMNS = (
+    "id_pessoa",
+    "email",
+    "senha",
+    "nome",
+    "data_nascimento",
+    "telefone",
+    "genero",
+    "estado",
+    "cidade",
+    "rua",
+    "numero",
+    "cep",
+    "data_criacao",
+    "admin",
+)
+META_COLUMNS = (
+    "id_meta",
+    "fk_pessoa_id_pessoa",
+    "titulo",
+    "categoria",
+    "valor_alvo",
+    "valor_atual",
+    "criada_em",
+    "termina_em",
+    "status",
+)
+MOVIMENTACAO_COLUMNS = ("fk_meta_id_meta", "valor", "acao", "data")
+ALERTA_COLUMNS = ("fk_pessoa_id_pessoa", "data", "conteudo", "lida")
+
+NOMES = ("Ana", "Bruno", "Carla", "Diego", "Eduarda", "Felipe", "Gabriela", "Heitor", "Isabela", "João")
+SOBRENOMES = ("Silva", "Souza", "Oliveira", "Santos", "Lima", "Pereira", "Costa", "Almeida")
+CIDADES = (
+    ("PE", "Recife"),
+    ("SP", "São Paulo"),
+    ("RJ", "Rio de Janeiro"),
+    ("BA", "Salvador"),
+    ("MG", "Belo Horizonte"),
+)
+GENEROS = ("feminino", "masculino", "nao_informado")
+# Só categorias aceitas pela API (Literal de `categoria` em app/metas/api/meta_schema.py)
+METAS = (
+    ("Reserva de Emergência", "Emergência"),
+    ("Viagem de Férias", "Viagem"),
+    ("Notebook Novo", "Compras"),
+    ("Entrada do Apartamento", "Outros"),
+    ("Curso de Idiomas", "Outros"),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Volumes da massa sintética; ``seed`` identifica a execução (emails e aleatoriedade)."""
+
+    pessoas: int
+    metas_por_pessoa: int = 5
+    movimentacoes_por_meta: int = 20
+    alertas_por_pessoa: int = 10
+    chunk_size: int = 1000
+    seed: int = 42
+
+    @property
+    def email_prefix(self) -> str:
+        return f"synthetic+{self.seed}-"
+
+
+@dataclass
+class SyntheticChunk:
+    """Linhas de um lote, como tuplas na ordem das ``*_COLUMNS``."""
+
+    pessoas: list[tuple[Any, ...]] = field(default_factory=list)
+    metas: list[tuple[Any, ...]] = field(default_factory=list)
+    movimentacoes: list[tuple[Any, ...]] = field(default_factory=list)
+    alertas: list[tuple[Any, ...]] = field(default_factory=list)
+
+
+def generate_chunk(
+    spec: SyntheticSpec,
+    start: int,
+    count: int,
+    meta_ids: Iterator[int],
+    *,
+    rng: random.Random,
+    today: date,
+) -> SyntheticChunk:
+    """Gera as pessoas ``start .. start + count - 1`` e tudo que pertence a elas."""
+    chunk = SyntheticChunk()
+    agora = datetime.combine(today, datetime.min.time(), tzinfo=UTC)
+
+    for i in range(start, start + count):
+        id_pessoa = UUID(int=rng.getrandbits(128), version=4)
+        estado, cidade = rng.choice(CIDADES)
+        chunk.pessoas.append(
+            (
+                id_pessoa,
+                f"{spec.email_prefix}{i}@{EMAIL_DOMAIN}",
+                "demo123",
+                f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)}",
+                date(rng.randint(1960, 2006), rng.randint(1, 12), rng.randint(1, 28)),
+                f"81{rng.randint(900000000, 999999999)}",
+                rng.choice(GENEROS),
+                estado,
+                cidade,
+                "Rua Sintética",
+                str(rng.randint(1, 9999)),
+                f"{rng.randint(10000000, 99999999)}",
+                today - timedelta(days=rng.randint(0, 720)),
+                False,
+            )
+        )
+
+        for _ in range(spec.metas_por_pessoa):
+            id_meta = next(meta_ids)
+            titulo, categoria = rng.choice(METAS)
+            valor_alvo = Decimal(rng.randint(1000, 20000))
+            criada_em = today - timedelta(days=rng.randint(30, 720))
+            termina_em = criada_em + timedelta(days=rng.randint(180, 1080))
+
+            saldo = Decimal(0)
+            dias = sorted(rng.randint(0, (today - criada_em).days) for _ in range(spec.movimentacoes_por_meta))
+            for dia in dias:
+                valor = Decimal(rng.randint(1000, 50000)) / 100
+                acao = "retirado" if saldo >= valor and rng.random() < 0.2 else "adicionado"
+                saldo += valor if acao == "adicionado" else -valor
+                chunk.movimentacoes.append((id_meta, valor, acao, criada_em + timedelta(days=dia)))
+
+            if saldo >= valor_alvo:
+                status = "concluida"
+            elif termina_em < today:
+                status = "atrasada"
+            else:
+                status = "em_andamento"
+            chunk.metas.append(
+                (id_meta, id_pessoa, titulo, categoria, valor_alvo, saldo, criada_em, termina_em, status)
+            )
+
+        for _ in range(spec.alertas_por_pessoa):
+            data = agora - timedelta(minutes=rng.randint(0, 90 * 24 * 60))
+            conteudo = f"Movimentação de R$ {rng.randint(10, 500)},00 registrada na sua meta"
+            chunk.alertas.append((id_pessoa, data, conteudo, rng.random() < 0.5))
+
+    return chunk
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    table: Table,
+    columns: Sequence[str],
+    records: Sequence[tuple[Any, ...]],
+) -> None:
+    """Insere ``records`` em ``table``: COPY com asyncpg, ``insert().values`` em lotes nos demais."""
+    if not records:
+        return
+    conn = await session.connection()
+    if conn.dialect.driver == "asyncpg":
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(table.name, records=records, columns=list(columns))
+        return
+
+    batch_size = MAX_BIND_PARAMS // len(columns)
+    for offset in range(0, len(records), batch_size):
+        batch = records[offset : offset + batch_size]
+        await session.execute(insert(table).values([dict(zip(columns, row)) for row in batch]))
+
+
+async def reserve_meta_ids(session: AsyncSession, count: int) -> list[int]:
+    """Reserva ``count`` ids na sequence de ``meta.id_meta`` (COPY não devolve ids gerados)."""
+    result = await session.execute(
+        text("SELECT nextval(pg_get_serial_sequence('meta', 'id_meta')) FROM generate_series(1, :n)"),
+        {"n": count},
+    )
+    return list(result.scalars())
+
+
+async def clear_synthetic_data(session: AsyncSession, spec: SyntheticSpec) -> int:
+    """Remove as pessoas de uma execução anterior com a mesma ``seed`` (CASCADE leva o resto)."""
+    result = await session.execute(
+        delete(PessoaORM).where(PessoaORM.email.startswith(spec.email_prefix, autoescape=True))
+    )
+    return result.rowcount
+
+
+async def seed_synthetic(
+    spec: SyntheticSpec,
+    *,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+) -> dict[str, int]:
+    """Popula o banco conforme ``spec`` e retorna o total de linhas inseridas por tabela."""
+    rng = random.Random(spec.seed)
+    today = date.today()
+    totals = dict.fromkeys(("pessoa", "meta", "movimentacao_meta", "alerta"), 0)
+
+    async with session_factory() as session, UnitOfWork(session):
+        removidas = await clear_synthetic_data(session, spec)
+    if removidas:
+        logger.info("[SEED] %d pessoas sintéticas anteriores removidas", removidas)
+
+    started = time.perf_counter()
+    for start in range(0, spec.pessoas, spec.chunk_size):
+        count = min(spec.chunk_size, spec.pessoas - start)
+        async with session_factory() as session, UnitOfWork(session):
+            meta_ids = await reserve_meta_ids(session, count * spec.metas_por_pessoa)
+            chunk = generate_chunk(spec, start, count, iter(meta_ids), rng=rng, today=today)
+            await bulk_insert(session, PessoaORM.__table__, PESSOA_COLUMNS, chunk.pessoas)
+            await bulk_insert(session, MetaORM.__table__, META_COLUMNS, chunk.metas)
+            await bulk_insert(session, MovimentacaoMetaORM.__table__, MOVIMENTACAO_COLUMNS, chunk.movimentacoes)
+            await bulk_insert(session, AlertaORM.__table__, ALERTA_COLUMNS, chunk.alertas)
+
+        totals["pessoa"] += len(chunk.pessoas)
+        totals["meta"] += len(chunk.metas)
+        totals["movimentacao_meta"] += len(chunk.movimentacoes)
+        totals["alerta"] += len(chunk.alertas)
+        logger.info("[SEED] %d/%d pessoas (%d linhas)", start + count, spec.pessoas, sum(totals.values()))
+
+    elapsed = time.perf_counter() - started
+    logger.info("[SEED] %d linhas em %.1fs: %s", sum(totals.values()), elapsed, totals)
+    return totals
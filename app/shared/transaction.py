@@ -1 +1,54 @@
-"""Module transaction."""
+"""Unit of work: one transaction, one commit per service operation."""
+
+from __future__ import annotations
+
+from types import TracebackType
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DEPTH_KEY = "uow_depth"
+
+
+class UnitOfWork:
+    """Group the writes made through a session into a single commit.
+
+    Repositories only ``flush`` (sending SQL and getting generated IDs); the unit of work commits
+    once when the outermost block exits cleanly and rolls back if it raises::
+
+        async with UnitOfWork(session):
+            await meta_repo.update(meta)
+            await movimentacao_repo.add(movimentacao)   # same transaction, one commit
+
+    Blocks nest: the depth is tracked on ``session.info``, so a service operation can call
+    another one and everything still lands in the outermost commit. Without a session (services
+    built over in-memory fakes in unit tests) it does nothing.
+    """
+
+    def __init__(self, session: AsyncSession | None) -> None:
+        self.session = session
+
+    async def __aenter__(self) -> AsyncSession | None:
+        if self.session is not None:
+            self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+        return self.session
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self.session is None:
+            return
+        depth = self.session.info[_DEPTH_KEY] - 1
+        self.session.info[_DEPTH_KEY] = depth
+        if depth > 0:
+            return
+        if exc_type is not None:
+            await self.session.rollback()
+            return
+        try:
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
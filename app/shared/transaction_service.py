@@ -1 +1,30 @@
-"""Module transaction_service."""
+"""Decorator that runs service methods inside a unit of work."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any, Concatenate, ParamSpec, TypeVar
+
+from app.shared.transaction import UnitOfWork
+
+P = ParamSpec("P")
+R = TypeVar("R")
+S = TypeVar("S")
+
+
+def transactional(method: Callable[Concatenate[S, P], Awaitable[R]]) -> Callable[Concatenate[S, P], Awaitable[R]]:
+    """Wrap an async service method in ``UnitOfWork(self.session)``.
+
+    The method's writes are committed together when it returns, or rolled back if it raises.
+    Calls between decorated methods nest into the caller's transaction. The service must expose
+    the request session as ``self.session`` (``None`` disables transaction handling).
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> R:
+        session: Any = getattr(self, "session", None)
+        async with UnitOfWork(session):
+            return await method(self, *args, **kwargs)
+
+    return wrapper
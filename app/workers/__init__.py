@@ -1 +1,57 @@
-"""Module __init__."""
+"""Background workers started from the application lifespan."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from app.core.settings import settings
+from app.workers.alerta_outbox import AlertaOutboxWorker
+from app.workers.alerta_retention import AlertaRetentionJob
+from app.workers.base import PeriodicWorker, WorkerStats
+from app.workers.overdue_metas import OverdueMetasJob
+from app.workers.session_sweeper import SessionSweeper
+
+__all__ = [
+    "AlertaOutboxWorker",
+    "AlertaRetentionJob",
+    "OverdueMetasJob",
+    "PeriodicWorker",
+    "SessionSweeper",
+    "WorkerStats",
+    "build_workers",
+]
+
+
+def build_workers() -> list[PeriodicWorker]:
+    """Instancia os workers habilitados em `settings`."""
+    workers: list[PeriodicWorker] = []
+    if settings.session_sweeper_enabled:
+        workers.append(
+            SessionSweeper(
+                interval_seconds=settings.session_sweeper_interval_seconds,
+                batch_size=settings.session_sweeper_batch_size,
+            )
+        )
+    if settings.overdue_metas_job_enabled:
+        workers.append(
+            OverdueMetasJob(
+                run_at=settings.overdue_metas_job_run_at,
+                chunk_size=settings.overdue_metas_job_chunk_size,
+            )
+        )
+    if settings.alerta_outbox_enabled:
+        workers.append(
+            AlertaOutboxWorker(
+                interval_seconds=settings.alerta_outbox_interval_seconds,
+                batch_size=settings.alerta_outbox_batch_size,
+            )
+        )
+    if settings.alerta_retention_enabled:
+        workers.append(
+            AlertaRetentionJob(
+                interval_seconds=settings.alerta_retention_interval_seconds,
+                retention=timedelta(days=settings.alerta_retention_days),
+                batch_size=settings.alerta_retention_batch_size,
+            )
+        )
+    return workers
@@ -0,0 +1,41 @@
+"""Entrega dos alertas gravados no outbox."""
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.alertas.repositories.alerta_repository_impl import AlertaRepositoryImpl
+from app.shared.database import AsyncSessionLocal
+from app.shared.transaction import UnitOfWork
+from app.workers.base import PeriodicWorker
+
+
+class AlertaOutboxWorker(PeriodicWorker):
+    """Move os alertas de `alerta_outbox` para `alerta` em lotes.
+
+    Os services só registram a intenção (um INSERT barato numa tabela sem índices
+    secundários, na mesma transação da operação); este worker faz a entrega com um
+    INSERT multi-linha por lote, cada lote com seu próprio commit curto. Como a
+    intenção e a remoção do outbox andam na mesma transação do INSERT em `alerta`,
+    nenhum alerta é perdido nem entregue duas vezes.
+    """
+
+    name = "alerta_outbox"
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        batch_size: int,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        super().__init__(interval_seconds, session_factory)
+        self.batch_size = batch_size
+
+    async def run_once(self) -> int:
+        total = 0
+        while True:
+            async with self.session_factory() as session, UnitOfWork(session):
+                entregues = await AlertaRepositoryImpl(session).deliver_outbox(limit=self.batch_size)
+            total += entregues
+            if entregues < self.batch_size:
+                return total
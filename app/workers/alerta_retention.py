@@ -0,0 +1,44 @@
+"""Remoção periódica de alertas antigos."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.alertas.repositories.alerta_repository_impl import AlertaRepositoryImpl
+from app.shared.database import AsyncSessionLocal
+from app.shared.transaction import UnitOfWork
+from app.workers.base import PeriodicWorker
+
+
+class AlertaRetentionJob(PeriodicWorker):
+    """Apaga alertas (de todas as pessoas) mais antigos que `retention`, em lotes limitados.
+
+    Antes cada GET /api/v1/alertas fazia essa limpeza para o próprio usuário, o que
+    transformava a listagem em escrita. Aqui cada lote é um DELETE + COMMIT curto pelo
+    índice ix_alerta_data, e o corte é calculado uma vez por passada.
+    """
+
+    name = "alerta_retention"
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        retention: timedelta,
+        batch_size: int,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        super().__init__(interval_seconds, session_factory)
+        self.retention = retention
+        self.batch_size = batch_size
+
+    async def run_once(self) -> int:
+        corte = datetime.now() - self.retention
+        total = 0
+        while True:
+            async with self.session_factory() as session, UnitOfWork(session):
+                removed = await AlertaRepositoryImpl(session).purge_older_than(corte, batch_size=self.batch_size)
+            total += removed
+            if removed < self.batch_size:
+                return total
@@ -0,0 +1,116 @@
+"""Base para jobs periódicos executados dentro do processo da API."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.shared.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WorkerStats:
+    """Métricas acumuladas de um worker desde o início do processo (expostas em /metrics)."""
+
+    runs: int = 0
+    failures: int = 0
+    rows_processed: int = 0
+    last_rows: int = 0
+    last_duration_seconds: float = 0.0
+    total_duration_seconds: float = 0.0
+    last_run_at: datetime | None = None
+    last_error: str | None = None
+
+
+class PeriodicWorker(ABC):
+    """Executa `run_once` em loop, com intervalo definido por `seconds_until_next_run`.
+
+    Cada passada abre suas próprias sessões de banco via `session_factory`, fora
+    do ciclo de vida das requisições. Falhas são registradas em `stats` e no log,
+    sem derrubar o loop.
+    """
+
+    name: str = "worker"
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self.session_factory = session_factory
+        self.stats = WorkerStats()
+        self._task: asyncio.Task[None] | None = None
+
+    @abstractmethod
+    async def run_once(self) -> int:
+        """Executa uma passada completa e retorna quantas linhas foram processadas."""
+
+    def seconds_until_next_run(self) -> float:
+        """Intervalo até a próxima passada (sobrescreva para agendamentos diários etc.)."""
+        return self.interval_seconds
+
+    async def tick(self) -> int:
+        """Executa uma passada medindo duração e atualizando `stats`."""
+        started = time.perf_counter()
+        self.stats.last_run_at = datetime.now(UTC)
+        try:
+            rows = await self.run_once()
+        except Exception as e:
+            self.stats.failures += 1
+            self.stats.last_error = str(e)
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self.stats.runs += 1
+            self.stats.last_duration_seconds = duration
+            self.stats.total_duration_seconds += duration
+
+        self.stats.last_rows = rows
+        self.stats.rows_processed += rows
+        self.stats.last_error = None
+        return rows
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.seconds_until_next_run())
+            try:
+                rows = await self.tick()
+                # Passadas vazias só em debug: workers de intervalo curto (outbox) poluiriam o log
+                logger.log(
+                    logging.INFO if rows else logging.DEBUG,
+                    "%s: %d linha(s) processada(s) em %.3fs",
+                    self.name,
+                    rows,
+                    self.stats.last_duration_seconds,
+                )
+            except Exception:
+                logger.exception("%s: falha na execução", self.name)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Agenda o loop do worker no event loop atual."""
+        if not self.running:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        """Cancela o loop e aguarda a passada em andamento terminar de ser cancelada."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,74 @@
+"""Transição diária de metas vencidas para 'atrasada'."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.alertas.repositories.alerta_repository_impl import AlertaRepositoryImpl
+from app.metas.repositories.meta_repository_impl import MetaRepositoryImpl
+from app.shared.database import AsyncSessionLocal
+from app.shared.transaction import UnitOfWork
+from app.workers.base import PeriodicWorker
+
+
+class OverdueMetasJob(PeriodicWorker):
+    """Marca como 'atrasada' todas as metas vencidas e gera os alertas correspondentes.
+
+    Roda uma vez por dia, logo após `run_at` (horário local do servidor, o mesmo
+    usado por `date.today()` nas regras de meta), e uma vez ao iniciar o processo
+    para cobrir o período em que a aplicação esteve fora do ar.
+
+    Percorre as metas em lotes paginados por `id_meta` (keyset); cada lote faz o
+    UPDATE e o INSERT multi-linha dos alertas na mesma transação. É idempotente:
+    só metas ainda 'em_andamento' mudam de status, então uma segunda execução no
+    mesmo dia não altera nada nem duplica alertas.
+    """
+
+    name = "overdue_metas"
+
+    def __init__(
+        self,
+        run_at: time,
+        chunk_size: int,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        super().__init__(interval_seconds=24 * 60 * 60, session_factory=session_factory)
+        self.run_at = run_at
+        self.chunk_size = chunk_size
+        self._ran_on_start = False
+
+    def seconds_until_next_run(self) -> float:
+        if not self._ran_on_start:
+            self._ran_on_start = True
+            return 0.0
+        now = datetime.now()
+        proxima = datetime.combine(now.date(), self.run_at)
+        if proxima <= now:
+            proxima += timedelta(days=1)
+        return (proxima - now).total_seconds()
+
+    async def run_once(self) -> int:
+        total = 0
+        after_id = 0
+        while True:
+            async with self.session_factory() as session, UnitOfWork(session):
+                atrasadas = await MetaRepositoryImpl(session).mark_overdue(after_id=after_id, limit=self.chunk_size)
+                agora = datetime.now()
+                await AlertaRepositoryImpl(session).add_many(
+                    [
+                        {
+                            "fk_pessoa_id_pessoa": meta.fk_pessoa_id_pessoa,
+                            "data": agora,
+                            "conteudo": f"Sua meta '{meta.titulo}' ({meta.categoria}) passou do prazo e está atrasada.",
+                            "lida": False,
+                        }
+                        for meta in atrasadas
+                    ]
+                )
+
+            total += len(atrasadas)
+            if len(atrasadas) < self.chunk_size:
+                return total
+            after_id = max(meta.id_meta for meta in atrasadas)
@@ -0,0 +1,38 @@
+"""Remoção periódica de sessões expiradas."""
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.identidade.repositories.sessao_repository_impl import SessaoRepositoryImpl
+from app.shared.database import AsyncSessionLocal
+from app.shared.transaction import UnitOfWork
+from app.workers.base import PeriodicWorker
+
+
+class SessionSweeper(PeriodicWorker):
+    """Apaga sessões com `expira_em` no passado, em lotes limitados.
+
+    Cada lote é um DELETE + COMMIT curto, para não segurar locks nem gerar
+    um pico de WAL quando houver muitas sessões vencidas de uma vez.
+    """
+
+    name = "session_sweeper"
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        batch_size: int,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        super().__init__(interval_seconds, session_factory)
+        self.batch_size = batch_size
+
+    async def run_once(self) -> int:
+        total = 0
+        while True:
+            async with self.session_factory() as session, UnitOfWork(session):
+                removed = await SessaoRepositoryImpl(session).purge_expired(batch_size=self.batch_size)
+            total += removed
+            if removed < self.batch_size:
+                return total
@@ -0,0 +1,7 @@
+"""Load-testing and benchmark suite for the API hot paths.
+
+Runs against a live stack (``make up``) seeded with synthetic data (``make bench-seed``) and
+reports p50/p95/p99 latency and throughput per flow (see ``benchmarks.flows``). Results are JSON
+files; ``benchmarks/baselines/baseline.json`` is the committed reference that ``make bench-check``
+compares against before a release.
+"""
@@ -0,0 +1,76 @@
+"""Command line entry point: ``python -m benchmarks run|compare``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from benchmarks.flows import FLOWS
+from benchmarks.runner import RunConfig, run
+from benchmarks.stats import find_regressions
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "baseline.json"
+
+
+def _write(path: Path, document: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Sorted keys and fixed indentation: re-recording a baseline only changes the numbers in the diff
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="API benchmark suite.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = sub.add_parser("run", help="run the flows against a live API and write a result file")
+    run_cmd.add_argument("--base-url", default=RunConfig.base_url)
+    run_cmd.add_argument("--flows", nargs="+", choices=sorted(FLOWS), default=list(FLOWS))
+    run_cmd.add_argument("--concurrency", type=int, default=RunConfig.concurrency)
+    run_cmd.add_argument("--duration", type=float, default=RunConfig.duration_s, help="seconds measured per flow")
+    run_cmd.add_argument("--warmup", type=float, default=RunConfig.warmup_s, help="seconds discarded per flow")
+    run_cmd.add_argument("--users", type=int, default=RunConfig.users, help="synthetic pessoas logged in")
+    run_cmd.add_argument("--seed", type=int, default=42, help="--seed used by `python -m app.shared.seed synthetic`")
+    run_cmd.add_argument("--plano-id", type=int, help="plano used by assinatura_create (default: first listed)")
+    run_cmd.add_argument("--output", type=Path, required=True)
+
+    compare_cmd = sub.add_parser("compare", help="fail if a result file regressed against the baseline")
+    compare_cmd.add_argument("current", type=Path)
+    compare_cmd.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare_cmd.add_argument("--tolerance", type=float, default=0.10, help="allowed relative change (0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        config = RunConfig(
+            base_url=args.base_url,
+            flows=tuple(args.flows),
+            concurrency=args.concurrency,
+            duration_s=args.duration,
+            warmup_s=args.warmup,
+            users=args.users,
+            email_prefix=f"synthetic+{args.seed}-",
+            plano_id=args.plano_id,
+        )
+        _write(args.output, asyncio.run(run(config)))
+        print(f"results written to {args.output}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; record one with `make bench-baseline`", file=sys.stderr)
+        return 2
+    baseline = json.loads(args.baseline.read_text())["flows"]
+    current = json.loads(args.current.read_text())["flows"]
+    problems = find_regressions(baseline, current, tolerance=args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}", file=sys.stderr)
+    if not problems:
+        print(f"no regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
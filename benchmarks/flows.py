@@ -0,0 +1,104 @@
+"""API flows exercised by the benchmark, one HTTP round trip sequence per iteration.
+
+Every flow runs as one of the synthetic pessoas created by ``python -m app.shared.seed synthetic``
+(password ``demo123``), already logged in during setup, so each iteration only measures the flow
+itself. A non-2xx response raises and is counted as an error by the runner.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import httpx
+
+API = "/api/v1"
+PASSWORD = "demo123"
+
+
+@dataclass
+class BenchUser:
+    email: str
+    token: str
+    id_pessoa: str
+    id_meta: int
+    id_plano: int
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+async def login(client: httpx.AsyncClient, email: str) -> dict[str, str]:
+    response = await client.post(f"{API}/sessoes/login", json={"email": email, "senha": PASSWORD})
+    response.raise_for_status()
+    return response.json()
+
+
+async def prepare_user(client: httpx.AsyncClient, email: str, id_plano: int) -> BenchUser:
+    """Log in and pick the first meta of ``email``; the synthetic seed gives every pessoa some."""
+    sessao = await login(client, email)
+    headers = {"Authorization": f"Bearer {sessao['token']}"}
+    metas = await client.get(f"{API}/metas/", params={"limit": 1}, headers=headers)
+    metas.raise_for_status()
+    items = metas.json()["items"]
+    if not items:
+        raise RuntimeError(f"{email} has no metas; seed with --metas >= 1")
+    return BenchUser(email, sessao["token"], sessao["fk_pessoa_id_pessoa"], items[0]["id_meta"], id_plano)
+
+
+async def login_validate(client: httpx.AsyncClient, user: BenchUser) -> None:
+    sessao = await login(client, user.email)
+    response = await client.get(f"{API}/sessoes/validar", headers={"Authorization": f"Bearer {sessao['token']}"})
+    response.raise_for_status()
+
+
+async def list_metas(client: httpx.AsyncClient, user: BenchUser) -> None:
+    (await client.get(f"{API}/metas/", headers=user.headers)).raise_for_status()
+
+
+async def atualizar_saldo(client: httpx.AsyncClient, user: BenchUser) -> None:
+    response = await client.post(
+        f"{API}/metas/{user.id_meta}/atualizar_saldo",
+        json={"action": "adicionado", "valor": "10.00", "data": date.today().isoformat()},
+        headers=user.headers,
+    )
+    response.raise_for_status()
+
+
+async def list_alertas(client: httpx.AsyncClient, user: BenchUser) -> None:
+    (await client.get(f"{API}/alertas/", headers=user.headers)).raise_for_status()
+
+
+async def list_movimentacoes(client: httpx.AsyncClient, user: BenchUser) -> None:
+    (await client.get(f"{API}/metas/movimentacao/{user.id_meta}", headers=user.headers)).raise_for_status()
+
+
+async def assinatura_create(client: httpx.AsyncClient, user: BenchUser) -> None:
+    # 'pendente' keeps the "one active subscription per plan" rule from rejecting repeated creates
+    hoje = date.today()
+    response = await client.post(
+        f"{API}/assinaturas/",
+        json={
+            "fk_pessoa_id_pessoa": user.id_pessoa,
+            "fk_plano_id_plano": user.id_plano,
+            "comeca_em": hoje.isoformat(),
+            "termina_em": (hoje + timedelta(days=30)).isoformat(),
+            "status": "pendente",
+        },
+        headers=user.headers,
+    )
+    response.raise_for_status()
+
+
+Flow = Callable[[httpx.AsyncClient, BenchUser], Awaitable[None]]
+
+FLOWS: dict[str, Flow] = {
+    "login_validate": login_validate,
+    "list_metas": list_metas,
+    "atualizar_saldo": atualizar_saldo,
+    "list_alertas": list_alertas,
+    "list_movimentacoes": list_movimentacoes,
+    "assinatura_create": assinatura_create,
+}
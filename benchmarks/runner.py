@@ -0,0 +1,116 @@
+"""Closed-loop load runner: ``concurrency`` workers repeat a flow back to back for a fixed time."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import platform
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+
+from benchmarks.flows import FLOWS, BenchUser, Flow, prepare_user
+from benchmarks.stats import FlowSummary, summarize
+
+
+@dataclass(frozen=True)
+class RunConfig:
+    base_url: str = "http://localhost:8000"
+    flows: tuple[str, ...] = tuple(FLOWS)
+    concurrency: int = 10
+    duration_s: float = 30.0
+    warmup_s: float = 5.0
+    users: int = 50
+    email_prefix: str = "synthetic+42-"
+    email_domain: str = "fink.dev"
+    plano_id: int | None = None
+
+
+async def run_flow(
+    client: httpx.AsyncClient,
+    flow: Flow,
+    users: list[BenchUser],
+    *,
+    concurrency: int,
+    duration_s: float,
+    warmup_s: float,
+) -> FlowSummary:
+    """Run ``flow`` for ``warmup_s + duration_s``; only iterations started after the warmup count."""
+    latencies: list[float] = []
+    errors = 0
+    pool = itertools.cycle(users)
+    started = time.perf_counter()
+    measure_from = started + warmup_s
+    deadline = measure_from + duration_s
+
+    async def worker() -> None:
+        nonlocal errors
+        while (begin := time.perf_counter()) < deadline:
+            try:
+                await flow(client, next(pool))
+                ok = True
+            except (httpx.HTTPError, KeyError, ValueError):
+                ok = False
+            if begin >= measure_from:
+                if ok:
+                    latencies.append(time.perf_counter() - begin)
+                else:
+                    errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - measure_from)
+
+
+async def run(config: RunConfig) -> dict[str, Any]:
+    """Prepare the user pool, run every selected flow in sequence and return the result document."""
+    limits = httpx.Limits(max_connections=config.concurrency, max_keepalive_connections=config.concurrency)
+    async with httpx.AsyncClient(base_url=config.base_url, limits=limits, timeout=30.0) as client:
+        id_plano = config.plano_id
+        if id_plano is None:
+            planos = await client.get("/api/v1/planos/")
+            planos.raise_for_status()
+            id_plano = planos.json()[0]["id_plano"]
+        emails = [f"{config.email_prefix}{i}@{config.email_domain}" for i in range(config.users)]
+        users = list(await asyncio.gather(*(prepare_user(client, email, id_plano) for email in emails)))
+
+        results: dict[str, dict[str, Any]] = {}
+        for name in config.flows:
+            summary = await run_flow(
+                client,
+                FLOWS[name],
+                users,
+                concurrency=config.concurrency,
+                duration_s=config.duration_s,
+                warmup_s=config.warmup_s,
+            )
+            results[name] = summary.to_dict()
+            print(
+                f"{name:<20} {summary.throughput_rps:>8.1f} req/s  p50 {summary.p50_ms:>7.1f}  "
+                f"p95 {summary.p95_ms:>7.1f}  p99 {summary.p99_ms:>7.1f} ms  errors {summary.errors}"
+            )
+
+    return {
+        "meta": {
+            "recorded_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "base_url": config.base_url,
+            "concurrency": config.concurrency,
+            "duration_s": config.duration_s,
+            "warmup_s": config.warmup_s,
+            "users": config.users,
+        },
+        "flows": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
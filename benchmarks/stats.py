@@ -0,0 +1,79 @@
+"""Latency/throughput summaries and the baseline regression check."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class FlowSummary:
+    """Aggregated result of one flow; latencies in milliseconds, rounded for stable result files."""
+
+    requests: int
+    errors: int
+    throughput_rps: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0..100) of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies_s: Sequence[float], errors: int, elapsed_s: float) -> FlowSummary:
+    """Summarize per-iteration latencies (seconds) measured over ``elapsed_s`` of wall time."""
+    ms = sorted(v * 1000 for v in latencies_s)
+    return FlowSummary(
+        requests=len(ms),
+        errors=errors,
+        throughput_rps=round(len(ms) / elapsed_s, 1) if elapsed_s > 0 else 0.0,
+        mean_ms=round(sum(ms) / len(ms), 2) if ms else 0.0,
+        p50_ms=round(percentile(ms, 50), 2),
+        p95_ms=round(percentile(ms, 95), 2),
+        p99_ms=round(percentile(ms, 99), 2),
+        max_ms=round(ms[-1], 2) if ms else 0.0,
+    )
+
+
+def find_regressions(
+    baseline: Mapping[str, Mapping[str, Any]],
+    current: Mapping[str, Mapping[str, Any]],
+    *,
+    tolerance: float = 0.10,
+) -> list[str]:
+    """Compare ``current`` flow summaries against ``baseline``; returns one message per regression.
+
+    A flow regresses when its p95 or p99 latency grows, or its throughput drops, by more than
+    ``tolerance`` (a fraction), or when it starts returning errors. Flows missing from either side
+    are reported too, so a renamed or dropped flow does not silently pass.
+    """
+    problems: list[str] = []
+    for name, base in baseline.items():
+        cur = current.get(name)
+        if cur is None:
+            problems.append(f"{name}: missing from current results")
+            continue
+        for key in ("p95_ms", "p99_ms"):
+            if base[key] and cur[key] > base[key] * (1 + tolerance):
+                problems.append(f"{name}: {key} {base[key]} -> {cur[key]} (+{cur[key] / base[key] - 1:.0%})")
+        if base["throughput_rps"] and cur["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            drop = 1 - cur["throughput_rps"] / base["throughput_rps"]
+            problems.append(f"{name}: throughput_rps {base['throughput_rps']} -> {cur['throughput_rps']} (-{drop:.0%})")
+        if cur["errors"] > base["errors"]:
+            problems.append(f"{name}: errors {base['errors']} -> {cur['errors']}")
+    for name in current.keys() - baseline.keys():
+        problems.append(f"{name}: no baseline (record one with `make bench-baseline`)")
+    return problems
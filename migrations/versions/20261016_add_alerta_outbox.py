@@ -0,0 +1,46 @@
+"""add alerta_outbox table
+
+Revision ID: 20261016_alerta_outbox
+Revises: 20261016_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_alerta_outbox'
+down_revision = '20261016_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cria o outbox de alertas automáticos (entregues em lote pelo AlertaOutboxWorker).
+
+    Sem FK para pessoa e sem índices além da PK: a tabela só recebe INSERTs no caminho
+    do usuário e é esvaziada em ordem de id_outbox pelo worker.
+    """
+    op.create_table(
+        'alerta_outbox',
+        sa.Column('id_outbox', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('fk_pessoa_id_pessoa', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('data', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('conteudo', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id_outbox'),
+    )
+
+
+def downgrade() -> None:
+    """Entrega o que ainda estiver pendente e remove o outbox."""
+    op.execute(
+        """
+        INSERT INTO alerta (fk_pessoa_id_pessoa, data, conteudo, lida)
+        SELECT o.fk_pessoa_id_pessoa, o.data, o.conteudo, false
+        FROM alerta_outbox o JOIN pessoa p ON p.id_pessoa = o.fk_pessoa_id_pessoa
+        ORDER BY o.id_outbox
+        """
+    )
+    op.drop_table('alerta_outbox')
@@ -0,0 +1,64 @@
+"""add indexes for foreign keys and hot filter columns
+
+Revision ID: 20261016_indexes
+Revises: 20250116_refactor_alerta
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20261016_indexes'
+down_revision = '20250116_refactor_alerta'
+branch_labels = None
+depends_on = None
+
+
+# (nome, tabela, colunas, where) — espelha os Index declarados nos ORMs
+INDEXES = [
+    ("ix_meta_fk_pessoa_id_pessoa", "meta", ["fk_pessoa_id_pessoa"], None),
+    ("ix_meta_em_andamento_termina_em", "meta", ["termina_em", "id_meta"], "status = 'em_andamento'"),
+    (
+        "ix_movimentacao_meta_meta_data",
+        "movimentacao_meta",
+        ["fk_meta_id_meta", sa.text("data DESC"), sa.text("id_movimentacao DESC")],
+        None,
+    ),
+    ("ix_alerta_fk_pessoa_id_pessoa_lida", "alerta", ["fk_pessoa_id_pessoa", "lida"], None),
+    ("ix_alerta_nao_lidas", "alerta", ["fk_pessoa_id_pessoa", "id_alerta"], "lida = false"),
+    ("ix_alerta_data", "alerta", ["data"], None),
+    ("ix_sessao_fk_pessoa_id_pessoa", "sessao", ["fk_pessoa_id_pessoa"], None),
+    ("ix_sessao_expira_em", "sessao", ["expira_em"], None),
+    ("ix_assinatura_fk_pessoa_id_pessoa", "assinatura", ["fk_pessoa_id_pessoa"], None),
+    ("ix_assinatura_fk_plano_id_plano", "assinatura", ["fk_plano_id_plano"], None),
+    ("ix_plano_titulo", "plano", ["titulo"], None),
+]
+
+
+def upgrade() -> None:
+    """Cria os índices com CREATE INDEX CONCURRENTLY (sem bloquear escritas).
+
+    CONCURRENTLY não pode rodar dentro de uma transação, por isso o autocommit_block.
+    Se uma criação concorrente falhar, o Postgres deixa um índice INVALID para trás:
+    remova-o (DROP INDEX CONCURRENTLY) e rode a migração de novo.
+    """
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Remove os índices criados em upgrade()."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
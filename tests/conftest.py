@@ -0,0 +1,35 @@
+"""Shared fixtures."""
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+from app.core.metrics import (
+    N_PLUS_ONE_THRESHOLD,
+    RequestDbStats,
+    instrument_engine,
+    track_queries,
+)
+from app.shared.database import engine
+
+QueryBudget = Callable[..., AbstractContextManager[RequestDbStats]]
+
+
+@pytest.fixture
+def query_budget() -> QueryBudget:
+    """Fail the test when the wrapped block runs more SQL than allowed, or the same SQL in a loop.
+
+    with query_budget(2):
+        response = await client.get("/api/v1/metas/", headers=auth)
+    """
+    instrument_engine(engine)
+
+    @contextmanager
+    def budget(max_queries: int, *, repeat_threshold: int = N_PLUS_ONE_THRESHOLD) -> Iterator[RequestDbStats]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.queries <= max_queries, f"query budget {max_queries} exceeded: {stats.report(repeat_threshold)}"
+        assert not stats.repeated(repeat_threshold), f"possible N+1: {stats.report(repeat_threshold)}"
+
+    return budget
@@ -0,0 +1,57 @@
+"""Fixtures for tests against the Postgres from docker-compose (skipped without it)."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import delete
+
+from app.identidade.persistence.pessoa_orm import PessoaORM
+from app.main import app
+from app.shared.database import AsyncSessionLocal, engine, init_db
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    try:
+        await asyncio.wait_for(init_db(create_all=True), timeout=3)
+    except (OSError, asyncio.TimeoutError) as exc:
+        pytest.skip(f"database unavailable: {exc}")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+    # Conexões do pool ficam presas ao event loop deste teste
+    await engine.dispose()
+
+
+@pytest.fixture
+async def auth(client: httpx.AsyncClient) -> AsyncIterator[dict[str, str]]:
+    email = f"budget-{uuid4().hex[:12]}@fink.dev"
+    pessoa = await client.post(
+        "/api/v1/pessoas/",
+        json={
+            "email": email,
+            "senha": "budget123",
+            "nome": "Query Budget",
+            "data_nascimento": "1990-01-01",
+            "telefone": "81999999999",
+            "genero": "nao_informado",
+            "estado": "PE",
+            "cidade": "Recife",
+            "rua": "Rua de Teste",
+            "numero": "1",
+            "cep": "50000000",
+        },
+    )
+    assert pessoa.status_code == 201, pessoa.text
+    login = await client.post("/api/v1/sessoes/login", json={"email": email, "senha": "budget123"})
+    assert login.status_code == 201, login.text
+
+    yield {"Authorization": f"Bearer {login.json()['token']}"}
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(PessoaORM).where(PessoaORM.email == email))
+        await session.commit()
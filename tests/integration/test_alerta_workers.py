@@ -0,0 +1,66 @@
+"""Alert outbox delivery and retention (needs the Postgres from docker-compose; skipped without it)."""
+
+from datetime import date, datetime, timedelta
+from uuid import UUID, uuid4
+
+import httpx
+from sqlalchemy import select
+
+from app.alertas.persistence.alerta_orm import AlertaORM
+from app.alertas.persistence.alerta_outbox_orm import AlertaOutboxORM
+from app.alertas.repositories.alerta_repository_impl import AlertaRepositoryImpl
+from app.shared.database import AsyncSessionLocal
+from app.workers.alerta_outbox import AlertaOutboxWorker
+from app.workers.alerta_retention import AlertaRetentionJob
+
+
+async def test_alerts_are_delivered_by_the_worker(client: httpx.AsyncClient, auth: dict[str, str]) -> None:
+    meta = await client.post(
+        "/api/v1/metas/",
+        json={
+            "titulo": "Viagem",
+            "categoria": "Viagem",
+            "valor_alvo": "500.00",
+            "termina_em": (date.today() + timedelta(days=90)).isoformat(),
+        },
+        headers=auth,
+    )
+    assert meta.status_code == 201, meta.text
+
+    # Intenção gravada com a meta, mas ainda não entregue
+    before = await client.get("/api/v1/alertas/", headers=auth)
+    assert before.json()["items"] == []
+
+    # Intenção de uma pessoa que não existe mais: sai do outbox sem virar alerta
+    async with AsyncSessionLocal() as session:
+        session.add(AlertaOutboxORM(fk_pessoa_id_pessoa=uuid4(), data=datetime.now(), conteudo="órfão"))
+        await session.commit()
+
+    worker = AlertaOutboxWorker(interval_seconds=60, batch_size=1)
+    assert await worker.tick() >= 2
+
+    after = await client.get("/api/v1/alertas/", headers=auth)
+    [alerta] = after.json()["items"]
+    assert "Viagem" in alerta["conteudo"]
+    assert await worker.tick() == 0
+
+
+async def test_retention_job_removes_old_alerts_in_batches(client: httpx.AsyncClient, auth: dict[str, str]) -> None:
+    sessao = await client.get("/api/v1/sessoes/validar", headers=auth)
+    id_pessoa = UUID(sessao.json()["fk_pessoa_id_pessoa"])
+    agora = datetime.now()
+    alertas = [
+        {"fk_pessoa_id_pessoa": id_pessoa, "data": agora - timedelta(days=dias), "conteudo": conteudo, "lida": False}
+        for dias, conteudo in [(45, "antigo"), (31, "antigo"), (1, "recente")]
+    ]
+    async with AsyncSessionLocal() as session:
+        await AlertaRepositoryImpl(session).add_many(alertas)
+        await session.commit()
+
+    # Lote de 1: a passada só termina depois de vários DELETE + COMMIT
+    job = AlertaRetentionJob(interval_seconds=3600, retention=timedelta(days=30), batch_size=1)
+    assert await job.tick() >= 2
+
+    async with AsyncSessionLocal() as session:
+        restantes = await session.scalars(select(AlertaORM.conteudo).where(AlertaORM.fk_pessoa_id_pessoa == id_pessoa))
+        assert list(restantes) == ["recente"]
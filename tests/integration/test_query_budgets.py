@@ -0,0 +1,92 @@
+"""Query budgets for the hot endpoints (needs the Postgres from docker-compose; skipped without it).
+
+Budgets count SQL statements per request, authentication included (at most one lookup; a warm
+session cache needs none). Raise a budget only together with the change that justifies it.
+"""
+
+from datetime import date, timedelta
+
+import httpx
+import pytest
+
+
+async def create_meta(client: httpx.AsyncClient, auth: dict[str, str]) -> int:
+    response = await client.post(
+        "/api/v1/metas/",
+        json={
+            "titulo": "Reserva",
+            "categoria": "Emergência",
+            "valor_alvo": "1000.00",
+            "termina_em": (date.today() + timedelta(days=365)).isoformat(),
+        },
+        headers=auth,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id_meta"]
+
+
+async def test_budget_sees_queries_behind_request_middlewares(
+    client: httpx.AsyncClient, auth: dict[str, str], query_budget
+) -> None:
+    # As middlewares de métricas/debug contam as queries do request num tracker próprio
+    with pytest.raises(AssertionError, match="query budget 0 exceeded"):
+        with query_budget(0):
+            await client.get("/api/v1/metas/", headers=auth)
+
+
+async def test_list_metas(client: httpx.AsyncClient, auth: dict[str, str], query_budget) -> None:
+    await create_meta(client, auth)
+
+    with query_budget(2):
+        response = await client.get("/api/v1/metas/", headers=auth)
+
+    assert response.status_code == 200
+
+
+async def test_atualizar_saldo(client: httpx.AsyncClient, auth: dict[str, str], query_budget) -> None:
+    id_meta = await create_meta(client, auth)
+
+    # auth + UPDATE…RETURNING com o INSERT da movimentação + INSERT no outbox de alertas
+    with query_budget(3):
+        response = await client.post(
+            f"/api/v1/metas/{id_meta}/atualizar_saldo",
+            json={"action": "adicionado", "valor": "10.00", "data": date.today().isoformat()},
+            headers=auth,
+        )
+
+    assert response.status_code == 200, response.text
+
+
+async def test_atualizar_saldo_lote_has_no_per_item_queries(
+    client: httpx.AsyncClient, auth: dict[str, str], query_budget
+) -> None:
+    ids = [await create_meta(client, auth) for _ in range(5)]
+    itens = [
+        {"id_meta": id_meta, "action": "adicionado", "valor": "5.00", "data": date.today().isoformat()}
+        for id_meta in ids
+        for _ in range(2)
+    ]
+
+    # auth + lock + UPDATE…FROM (VALUES) + INSERT das movimentações + INSERT no outbox de alertas
+    with query_budget(5):
+        response = await client.post("/api/v1/metas/atualizar_saldo/lote", json={"itens": itens}, headers=auth)
+
+    assert response.status_code == 200, response.text
+
+
+async def test_list_movimentacoes(client: httpx.AsyncClient, auth: dict[str, str], query_budget) -> None:
+    id_meta = await create_meta(client, auth)
+
+    # auth + checagem de dono da meta + página
+    with query_budget(3):
+        response = await client.get(f"/api/v1/metas/movimentacao/{id_meta}", headers=auth)
+
+    assert response.status_code == 200
+
+
+async def test_list_alertas(client: httpx.AsyncClient, auth: dict[str, str], query_budget) -> None:
+    # auth + página (leitura pura: a retenção roda em background)
+    with query_budget(2):
+        response = await client.get("/api/v1/alertas/", headers=auth)
+
+    assert response.status_code == 200
@@ -0,0 +1,55 @@
+"""Benchmark suite statistics and regression check tests."""
+
+import httpx
+
+from benchmarks.runner import run_flow
+from benchmarks.stats import find_regressions, percentile, summarize
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
+
+
+def test_summarize_reports_milliseconds_and_throughput() -> None:
+    summary = summarize([0.010, 0.020, 0.030, 0.040], errors=1, elapsed_s=2.0)
+
+    assert summary.requests == 4
+    assert summary.throughput_rps == 2.0
+    assert summary.p50_ms == 20.0
+    assert summary.p99_ms == 40.0
+
+
+def flow(p95: float, rps: float, errors: int = 0) -> dict[str, float]:
+    return {"p95_ms": p95, "p99_ms": p95 * 2, "throughput_rps": rps, "errors": errors}
+
+
+def test_regressions_beyond_tolerance_are_reported() -> None:
+    baseline = {"list_metas": flow(10, 500), "list_alertas": flow(8, 600), "login_validate": flow(20, 100)}
+    current = {"list_metas": flow(10.9, 460), "list_alertas": flow(9.5, 600), "atualizar_saldo": flow(5, 100, errors=3)}
+
+    problems = find_regressions(baseline, current, tolerance=0.10)
+
+    assert not any(p.startswith("list_metas") for p in problems)
+    assert "list_alertas: p95_ms 8 -> 9.5 (+19%)" in problems
+    assert "login_validate: missing from current results" in problems
+    assert any(p.startswith("atualizar_saldo: no baseline") for p in problems)
+
+
+async def test_run_flow_discards_warmup_and_counts_errors() -> None:
+    calls = 0
+
+    async def flaky(client: httpx.AsyncClient, user: object) -> None:
+        nonlocal calls
+        calls += 1
+        if calls % 4 == 0:
+            raise httpx.HTTPStatusError("500", request=httpx.Request("GET", "/"), response=httpx.Response(500))
+
+    summary = await run_flow(None, flaky, ["u"], concurrency=2, duration_s=0.05, warmup_s=0)  # type: ignore[arg-type,list-item]
+
+    assert summary.requests + summary.errors == calls
+    assert summary.errors == calls // 4
@@ -0,0 +1,39 @@
+"""Request-scoped session dependency tests."""
+
+from typing import Any
+
+from fastapi.routing import APIRoute
+
+from app import main
+from app.shared.database import get_db
+
+ROUTERS = [
+    main.pessoas_router,
+    main.alertas_router,
+    main.metas_router,
+    main.planos_router,
+    main.sessoes_router,
+    main.assinaturas_router,
+    main.tipos_pagamento_router,
+    main.solicitacoes_pagamento_router,
+]
+
+
+def session_providers(dependant: Any) -> set[Any]:
+    found = set()
+    for dep in dependant.dependencies:
+        if getattr(dep.call, "__name__", "") == "get_db":
+            found.add(dep.call)
+        found |= session_providers(dep)
+    return found
+
+
+def test_every_route_shares_the_single_get_db() -> None:
+    """FastAPI caches a dependency per request only when every path uses the same callable."""
+    providers: set[Any] = set()
+    for router in ROUTERS:
+        for route in router.routes:
+            if isinstance(route, APIRoute):
+                providers |= session_providers(route.dependant)
+
+    assert providers == {get_db}
@@ -0,0 +1,25 @@
+"""Engine/pool configuration tests."""
+
+from sqlalchemy.pool import NullPool
+
+from app.core.settings import Settings
+from app.shared.database import engine_options
+
+
+def test_queue_mode_sizes_pool_and_tunes_asyncpg() -> None:
+    cfg = Settings(db_pool_size=3, db_max_overflow=2, db_pool_recycle_seconds=600, db_statement_cache_size=50)
+
+    options = engine_options(cfg)
+
+    assert (options["pool_size"], options["max_overflow"], options["pool_recycle"]) == (3, 2, 600)
+    assert options["connect_args"]["statement_cache_size"] == 50
+    assert options["connect_args"]["server_settings"] == {"application_name": "fink-backend", "jit": "off"}
+
+
+def test_null_mode_disables_pooling_and_prepared_statements() -> None:
+    options = engine_options(Settings(db_pool_mode="null"))
+
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
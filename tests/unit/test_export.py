@@ -0,0 +1,60 @@
+"""Streaming export tests."""
+
+import json
+from collections.abc import AsyncIterator
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from app.shared import export
+from app.shared.export import streaming_export
+
+COLUMNS = ["id_movimentacao", "valor", "acao", "data"]
+
+
+class FakeSession:
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+def rows(count: int):
+    async def source(session: Any) -> AsyncIterator[dict[str, Any]]:
+        assert isinstance(session, FakeSession)
+        for i in range(1, count + 1):
+            yield {"id_movimentacao": i, "valor": Decimal("10.50"), "acao": "adicionado", "data": date(2025, 1, i)}
+
+    return source
+
+
+async def body(response: Any) -> list[bytes]:
+    return [chunk async for chunk in response.body_iterator]
+
+
+async def test_ndjson_export_emits_one_object_per_line() -> None:
+    response = streaming_export(rows(2), COLUMNS, "ndjson", "movs", session_factory=FakeSession)  # type: ignore[arg-type]
+
+    lines = b"".join(await body(response)).decode().splitlines()
+
+    assert response.media_type == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="movs.ndjson"'
+    assert json.loads(lines[1]) == {"id_movimentacao": 2, "valor": "10.50", "acao": "adicionado", "data": "2025-01-02"}
+
+
+async def test_csv_export_writes_header_and_flushes_in_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+    response = streaming_export(rows(3), COLUMNS, "csv", "movs", session_factory=FakeSession)  # type: ignore[arg-type]
+
+    chunks = await body(response)
+
+    assert len(chunks) == 2
+    assert b"".join(chunks).decode().splitlines() == [
+        "id_movimentacao,valor,acao,data",
+        "1,10.50,adicionado,2025-01-01",
+        "2,10.50,adicionado,2025-01-02",
+        "3,10.50,adicionado,2025-01-03",
+    ]
@@ -0,0 +1,74 @@
+"""Queue-based JSON logging tests."""
+
+import io
+import logging
+import threading
+
+import httpx
+import orjson
+from fastapi import FastAPI
+
+from app.core.logging import RequestContextMiddleware, configure_logging
+
+logger = logging.getLogger("tests.logging")
+
+
+def read_lines(stream: io.StringIO) -> list[dict]:
+    return [orjson.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_formatted_by_the_listener_thread() -> None:
+    stream = io.StringIO()
+    threads: list[str] = []
+
+    class RecordingStream(io.StringIO):
+        def write(self, s: str) -> int:
+            threads.append(threading.current_thread().name)
+            return stream.write(s)
+
+    pipeline = configure_logging("INFO", stream=RecordingStream())
+    try:
+        logger.info("saldo %s de %s", "10.00", "meta", extra={"id_meta": 7})
+        logger.debug("abaixo do nível")
+    finally:
+        pipeline.stop()
+
+    [line] = read_lines(stream)
+    assert line["message"] == "saldo 10.00 de meta"
+    assert line["level"] == "INFO"
+    assert line["id_meta"] == 7
+    assert "request_id" not in line
+    assert threading.main_thread().name not in threads
+
+
+async def test_request_logs_carry_request_id_and_timing() -> None:
+    app = FastAPI()
+
+    @app.get("/metas")
+    async def metas() -> list[int]:
+        logger.info("listando metas")
+        return []
+
+    app.add_middleware(RequestContextMiddleware)
+
+    stream = io.StringIO()
+    pipeline = configure_logging("INFO", stream=stream)
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            generated = await client.get("/metas")
+            forwarded = await client.get("/metas", headers={"X-Request-ID": "abc-123"})
+    finally:
+        pipeline.stop()
+
+    assert forwarded.headers["x-request-id"] == "abc-123"
+    request_id = generated.headers["x-request-id"]
+
+    lines = [line for line in read_lines(stream) if line["logger"] != "httpx"]
+    handler_log, access_log, _, forwarded_access = lines
+    assert handler_log["request_id"] == request_id
+    assert handler_log["elapsed_ms"] >= 0
+    assert access_log["logger"] == "app.access"
+    assert access_log["request_id"] == request_id
+    assert (access_log["method"], access_log["path"], access_log["status"]) == ("GET", "/metas", 200)
+    assert access_log["duration_ms"] >= 0
+    assert forwarded_access["request_id"] == "abc-123"
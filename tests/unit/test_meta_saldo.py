@@ -0,0 +1,148 @@
+"""Atomic balance update (atualizar_saldo) tests."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.metas.persistence.meta_orm import MetaORM
+from app.metas.repositories.meta_repository_impl import MetaRepositoryImpl
+from app.metas.services.meta_service import MetaService
+
+DONO = uuid4()
+
+
+def meta_row(valor_atual: str) -> dict[str, Any]:
+    return {
+        "id_meta": 1,
+        "fk_pessoa_id_pessoa": DONO,
+        "titulo": "Viagem",
+        "categoria": "Viagem",
+        "valor_alvo": Decimal("100"),
+        "valor_atual": Decimal(valor_atual),
+        "criada_em": date(2025, 1, 1),
+        "termina_em": date(2030, 1, 1),
+        "status": "em_andamento",
+    }
+
+
+class FakeResult:
+    def mappings(self) -> "FakeResult":
+        return self
+
+    def one_or_none(self) -> None:
+        return None
+
+    def all(self) -> list[Any]:
+        return []
+
+
+class CapturingSession:
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+
+    async def execute(self, stmt: Any) -> FakeResult:
+        self.statements.append(stmt)
+        return FakeResult()
+
+
+class FakeMetaRepo:
+    def __init__(self, row: dict[str, Any] | None) -> None:
+        self.row = row
+        self.calls: list[tuple[Any, ...]] = []
+
+    async def apply_movement(self, id_meta: int, id_pessoa: UUID, *, delta: Decimal, acao: str, data: date) -> Any:
+        self.calls.append((id_meta, id_pessoa, delta, acao))
+        return self.row
+
+    async def get_by_id(self, id_meta: int) -> MetaORM | None:
+        return MetaORM(**meta_row("3")) if id_meta == 1 else None
+
+    async def lock_balances(self, ids: list[int], id_pessoa: UUID) -> list[dict[str, Any]]:
+        self.calls.append(("lock", ids))
+        outra = {**meta_row("50"), "id_meta": 2, "fk_pessoa_id_pessoa": uuid4()}
+        return [r for r in (meta_row("3"), outra) if r["id_meta"] in ids and r["fk_pessoa_id_pessoa"] == id_pessoa]
+
+    async def apply_deltas(self, deltas: dict[int, Decimal]) -> list[Any]:
+        self.calls.append(("deltas", deltas))
+        return []
+
+
+class FakeMovimentacaoRepo:
+    def __init__(self) -> None:
+        self.inserted: list[dict[str, Any]] = []
+
+    async def add_many(self, movimentacoes: list[dict[str, Any]]) -> int:
+        self.inserted.extend(movimentacoes)
+        return len(movimentacoes)
+
+
+async def test_balance_update_and_movement_are_one_statement() -> None:
+    session = CapturingSession()
+
+    await MetaRepositoryImpl(session).apply_movement(  # type: ignore[arg-type]
+        1, DONO, delta=Decimal("-5"), acao="retirado", data=date(2025, 1, 2)
+    )
+
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH upd AS \n(UPDATE meta SET valor_atual=(meta.valor_atual + ")
+    assert "meta.valor_atual + %(valor_atual_1)s >= " in sql
+    assert "INSERT INTO movimentacao_meta (fk_meta_id_meta, valor, acao, data) SELECT upd.id_meta" in sql
+
+
+async def test_batch_only_locks_the_users_own_metas() -> None:
+    session = CapturingSession()
+
+    await MetaRepositoryImpl(session).lock_balances([1, 2], DONO)  # type: ignore[arg-type]
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "meta.fk_pessoa_id_pessoa = %(fk_pessoa_id_pessoa_1)s" in sql
+    assert sql.endswith("FOR UPDATE")
+
+
+async def test_withdrawal_sends_negative_delta_and_returns_new_balance() -> None:
+    repo = FakeMetaRepo(meta_row("7"))
+
+    meta = await MetaService(repo).atualizar_saldo(1, DONO, "retirado", Decimal("-3"), date.today())  # type: ignore[arg-type]
+
+    assert repo.calls == [(1, DONO, Decimal("-3"), "retirado")]
+    assert meta.valor_atual == Decimal("7")
+
+
+@pytest.mark.parametrize(
+    ("id_meta", "user_id", "erro"),
+    [(2, DONO, "não encontrada"), (1, uuid4(), "permissão"), (1, DONO, "Saldo atual: 3")],
+)
+async def test_no_row_updated_explains_why(id_meta: int, user_id: UUID, erro: str) -> None:
+    service = MetaService(FakeMetaRepo(None))  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match=erro):
+        await service.atualizar_saldo(id_meta, user_id, "retirado", Decimal("5"), date.today())
+
+
+async def test_batch_validates_items_in_order_and_writes_once() -> None:
+    repo, movs = FakeMetaRepo(None), FakeMovimentacaoRepo()
+    hoje = date.today()
+    itens = [
+        {"id_meta": 1, "action": "adicionado", "valor": Decimal("2"), "data": hoje},
+        {"id_meta": 1, "action": "retirado", "valor": Decimal("9"), "data": hoje},
+        {"id_meta": 2, "action": "adicionado", "valor": Decimal("1"), "data": hoje},
+        {"id_meta": 1, "action": "retirado", "valor": Decimal("5"), "data": hoje},
+    ]
+
+    resultados = await MetaService(repo, movs).atualizar_saldo_lote(DONO, itens)  # type: ignore[arg-type]
+
+    assert [(r.sucesso, r.valor_atual) for r in resultados] == [
+        (True, Decimal("5")),
+        (False, None),
+        (False, None),
+        (True, Decimal("0")),
+    ]
+    assert "Saldo atual: 5" in (resultados[1].erro or "")
+    assert "não encontrada ou sem permissão" in (resultados[2].erro or "")
+    assert repo.calls == [("lock", [1, 2]), ("deltas", {1: Decimal("-3")})]
+    assert [m["valor"] for m in movs.inserted] == [Decimal("2"), Decimal("5")]
@@ -0,0 +1,112 @@
+"""Prometheus instrumentation tests."""
+
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from prometheus_client import REGISTRY
+
+from app.core import metrics
+from app.core.metrics import PrometheusMiddleware, metrics_response, track_workers
+from app.providers.pluggy_client import PluggyClient
+from app.workers.base import PeriodicWorker
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.info: dict[str, Any] = {}
+
+
+def run_query(conn: FakeConnection) -> None:
+    metrics._before_cursor_execute(conn, None, "SELECT 1", None, None, False)
+    metrics._after_cursor_execute(conn, None, "SELECT 1", None, None, False)
+
+
+def make_app() -> FastAPI:
+    router = APIRouter()
+
+    @router.get("/{id_item}")
+    async def get_item(id_item: int) -> dict[str, int]:
+        conn = FakeConnection()
+        run_query(conn)
+        run_query(conn)
+        return {"id": id_item}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/itens")
+    app.add_middleware(PrometheusMiddleware)
+    app.add_api_route("/metrics", metrics_response, methods=["GET"], include_in_schema=False)
+    return app
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+async def test_middleware_labels_by_route_template_and_counts_queries() -> None:
+    labels = {"method": "GET", "route": "/api/v1/itens/{id_item}"}
+    before_count = sample("http_request_duration_seconds_count", **labels, status="200")
+    before_queries = sample("http_request_db_queries_sum", **labels)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=make_app()), base_url="http://test") as client:
+        await client.get("/api/v1/itens/7")
+        await client.get("/api/v1/itens/8")
+        await client.get("/nao-existe")
+        body = (await client.get("/metrics")).text
+
+    assert sample("http_request_duration_seconds_count", **labels, status="200") == before_count + 2
+    assert sample("http_request_db_queries_sum", **labels) == before_queries + 4
+    assert sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404") >= 1
+    assert 'route="/api/v1/itens/{id_item}"' in body
+    assert 'route="/metrics"' not in body
+
+
+def test_queries_outside_requests_are_not_attributed() -> None:
+    before = sample("db_query_duration_seconds_count")
+
+    run_query(FakeConnection())
+
+    assert sample("db_query_duration_seconds_count") == before + 1
+
+
+async def test_pluggy_calls_are_timed_per_endpoint() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"apiKey": "k", "results": []})
+
+    labels = {"method": "GET", "endpoint": "/accounts", "status": "200"}
+    before = sample("pluggy_request_duration_seconds_count", **labels)
+    client = PluggyClient("https://pluggy.test", "id", "secret", transport=httpx.MockTransport(handler))
+
+    await client.get_account("acc-1")
+    await client.list_accounts("item-1")
+    await client.close()
+
+    assert sample("pluggy_request_duration_seconds_count", **labels) == before + 2
+    assert sample("pluggy_request_duration_seconds_count", method="POST", endpoint="/auth", status="200") >= 1
+
+
+class FailingWorker(PeriodicWorker):
+    name = "failing"
+
+    async def run_once(self) -> int:
+        raise RuntimeError("password authentication failed for user fink")
+
+
+async def test_worker_stats_are_exported_without_error_text() -> None:
+    worker = FailingWorker(interval_seconds=60)
+    with pytest.raises(RuntimeError):
+        await worker.tick()
+
+    track_workers([worker])
+    try:
+        body = metrics_response().body.decode()
+        assert sample("worker_runs_total", worker="failing") == 1
+        assert sample("worker_failures_total", worker="failing") == 1
+        assert sample("worker_last_run_failed", worker="failing") == 1
+        assert sample("worker_running", worker="failing") == 0
+    finally:
+        track_workers(())
+
+    assert 'worker="failing"' in body
+    assert "password" not in body
@@ -0,0 +1,137 @@
+"""Keyset pagination helper tests."""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.alertas.api.schemas import AlertaResponse
+from app.metas.api.meta_schema import MovimentacaoMetaResponse
+from app.metas.persistence.movimentacao_meta_orm import MovimentacaoMetaORM
+from app.shared.pagination import (
+    Page,
+    PageParams,
+    decode_cursor,
+    encode_cursor,
+    page_adapter,
+    page_json,
+    paginate,
+    trusted_page_json,
+)
+
+KEYS = [MovimentacaoMetaORM.data, MovimentacaoMetaORM.id_movimentacao]
+
+
+class FakeResult:
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+
+    def scalars(self) -> list[Any]:
+        return self.rows
+
+
+class FakeSession:
+    """Captures the executed statement and returns canned rows."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.statements: list[Any] = []
+
+    async def execute(self, stmt: Any) -> FakeResult:
+        self.statements.append(stmt)
+        return FakeResult(self.rows)
+
+
+def make_mov(id_movimentacao: int, data: date) -> MovimentacaoMetaORM:
+    return MovimentacaoMetaORM(
+        id_movimentacao=id_movimentacao, fk_meta_id_meta=1, valor=1, acao="adicionado", data=data
+    )
+
+
+def sql(stmt: Any) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip_restores_column_types() -> None:
+    cursor = encode_cursor([date(2025, 1, 15), 42])
+
+    assert decode_cursor(cursor, KEYS) == [date(2025, 1, 15), 42]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor([1]), encode_cursor(["x", 1])])
+def test_invalid_cursor_raises_value_error(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Cursor"):
+        decode_cursor(cursor, KEYS)
+
+
+async def test_paginate_fetches_one_extra_row_and_emits_next_cursor() -> None:
+    rows = [make_mov(i, date(2025, 1, 10 - i)) for i in (1, 2, 3)]
+    session = FakeSession(rows)
+
+    page = await paginate(session, select(MovimentacaoMetaORM), KEYS, PageParams(limit=2), descending=True)  # type: ignore[arg-type]
+
+    assert [m.id_movimentacao for m in page.items] == [1, 2]
+    assert decode_cursor(page.next_cursor or "", KEYS) == [date(2025, 1, 8), 2]
+    statement = sql(session.statements[0])
+    assert "ORDER BY movimentacao_meta.data DESC, movimentacao_meta.id_movimentacao DESC" in statement
+    assert "LIMIT" in statement and session.statements[0]._limit == 3
+
+
+async def test_paginate_seeks_past_cursor_and_stops_on_last_page() -> None:
+    session = FakeSession([make_mov(3, date(2025, 1, 7))])
+    cursor = encode_cursor([date(2025, 1, 8), 2])
+
+    page = await paginate(session, select(MovimentacaoMetaORM), KEYS, PageParams(cursor, 2), descending=True)  # type: ignore[arg-type]
+
+    assert page.next_cursor is None
+    assert "(movimentacao_meta.data, movimentacao_meta.id_movimentacao) < (" in sql(session.statements[0])
+
+
+def test_page_json_serializes_rows_by_attribute() -> None:
+    row = SimpleNamespace(
+        id_movimentacao=7, fk_meta_id_meta=1, valor=Decimal("2.50"), acao="adicionado", data=date(2025, 1, 2), extra="x"
+    )
+
+    response = page_json(page_adapter(MovimentacaoMetaResponse), Page([row], "abc"))
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {
+        "items": [{"id_movimentacao": 7, "fk_meta_id_meta": 1, "valor": "2.50", "acao": "adicionado", "data": "2025-01-02"}],
+        "next_cursor": "abc",
+    }
+
+
+def test_trusted_page_json_matches_validated_wire_format() -> None:
+    row = SimpleNamespace(
+        id_alerta=3,
+        fk_pessoa_id_pessoa=UUID("550e8400-e29b-41d4-a716-446655440000"),
+        data=datetime(2025, 1, 2, 3, 4, 5, 123, tzinfo=timezone.utc),
+        conteudo="Meta atingida",
+        lida=False,
+    )
+    page = Page([row], None)
+
+    assert trusted_page_json(AlertaResponse, page).body == page_json(page_adapter(AlertaResponse), page).body
+
+
+def test_trusted_page_json_encodes_driver_uuid_subclasses() -> None:
+    class DriverUUID(UUID):
+        """Like asyncpg's ``pgproto.UUID``: a ``uuid.UUID`` subclass orjson does not encode natively."""
+
+    row = SimpleNamespace(
+        id_alerta=1,
+        fk_pessoa_id_pessoa=DriverUUID("550e8400-e29b-41d4-a716-446655440000"),
+        data=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        conteudo="x",
+        lida=True,
+    )
+
+    body = json.loads(trusted_page_json(AlertaResponse, Page([row], None)).body)
+
+    assert body["items"][0]["fk_pessoa_id_pessoa"] == "550e8400-e29b-41d4-a716-446655440000"
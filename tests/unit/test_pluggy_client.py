@@ -0,0 +1,133 @@
+"""PluggyClient API key cache tests."""
+
+import asyncio
+
+import httpx
+
+from app.providers.pluggy_client import PluggyClient
+
+
+class FakePluggy:
+    """Minimal Pluggy double counting /auth calls."""
+
+    def __init__(self) -> None:
+        self.auth_calls = 0
+        self.valid_key = "key-1"
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/auth":
+            self.auth_calls += 1
+            self.valid_key = f"key-{self.auth_calls}"
+            return httpx.Response(200, json={"apiKey": self.valid_key})
+        if request.headers.get("X-API-Key") != self.valid_key:
+            return httpx.Response(401, json={"message": "unauthorized"})
+        return httpx.Response(200, json={"results": [{"id": "acc-1"}]})
+
+
+def make_client(fake: FakePluggy) -> PluggyClient:
+    return PluggyClient(
+        base_url="https://pluggy.test",
+        client_id="id",
+        client_secret="secret",
+        transport=httpx.MockTransport(fake.handler),
+    )
+
+
+async def test_api_key_is_reused_between_calls() -> None:
+    """Consecutive data calls authenticate only once."""
+    fake = FakePluggy()
+    client = make_client(fake)
+
+    await client.list_accounts("item-1")
+    await client.list_accounts("item-1")
+
+    assert fake.auth_calls == 1
+    await client.close()
+
+
+async def test_concurrent_callers_share_a_single_refresh() -> None:
+    """Many coroutines hitting a cold cache trigger one /auth call."""
+    fake = FakePluggy()
+    client = make_client(fake)
+
+    await asyncio.gather(*(client.list_accounts("item-1") for _ in range(20)))
+
+    assert fake.auth_calls == 1
+    await client.close()
+
+
+async def test_reauthenticates_transparently_on_401() -> None:
+    """A revoked key is refreshed once and the request retried."""
+    fake = FakePluggy()
+    client = make_client(fake)
+    await client.list_accounts("item-1")
+
+    fake.valid_key = "rotated"  # Pluggy invalidou a chave em cache
+    fake.auth_calls = 9  # próxima chave emitida será "key-10"
+
+    accounts = await client.list_accounts("item-1")
+
+    assert accounts == [{"id": "acc-1"}]
+    assert fake.auth_calls == 10
+    await client.close()
+
+
+async def test_persistent_401_on_connect_token_falls_back_to_api_key() -> None:
+    """A 401 that survives the refresh walks the remaining paths instead of raising."""
+    fake = FakePluggy()
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/auth":
+            return fake.handler(request)
+        calls.append(request.url.path)
+        return httpx.Response(401, json={"message": "unauthorized"})
+
+    client = PluggyClient(
+        base_url="https://pluggy.test", client_id="id", client_secret="secret", transport=httpx.MockTransport(handler)
+    )
+
+    token = await client.create_connect_token()
+
+    assert token == "key-2"
+    assert fake.auth_calls == 2  # uma renovação só
+    assert calls == ["/connect_token", "/connect_token", "/connect/token", "/connect_token", "/connect/token"]
+    await client.close()
+
+
+async def test_connect_token_tries_the_next_path_after_401() -> None:
+    """A 401 on /connect_token still lets /connect/token answer."""
+    fake = FakePluggy()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/connect_token":
+            return httpx.Response(401, json={"message": "unauthorized"})
+        if request.url.path == "/connect/token":
+            return httpx.Response(200, json={"accessToken": "connect-tok"})
+        return fake.handler(request)
+
+    client = PluggyClient(
+        base_url="https://pluggy.test", client_id="id", client_secret="secret", transport=httpx.MockTransport(handler)
+    )
+
+    assert await client.create_connect_token() == "connect-tok"
+    await client.close()
+
+
+async def test_key_is_refreshed_ahead_of_expiry() -> None:
+    """Keys inside the refresh margin are renewed before use."""
+    fake = FakePluggy()
+    client = PluggyClient(
+        base_url="https://pluggy.test",
+        client_id="id",
+        client_secret="secret",
+        api_key_ttl=10,
+        refresh_margin=10,
+        transport=httpx.MockTransport(fake.handler),
+    )
+
+    await client.list_accounts("item-1")
+    await client.list_accounts("item-1")
+
+    assert fake.auth_calls == 2
+    await client.close()
@@ -0,0 +1,81 @@
+"""Query counter / N+1 detector tests."""
+
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core import metrics
+from app.core.metrics import QueryCountMiddleware, track_queries
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.info: dict[str, Any] = {}
+
+
+def execute(sql: str) -> None:
+    conn = FakeConnection()
+    metrics._before_cursor_execute(conn, None, sql, None, None, False)
+    metrics._after_cursor_execute(conn, None, sql, None, None, False)
+
+
+def test_tracker_counts_and_flags_repeated_statements() -> None:
+    with track_queries() as tracker:
+        execute("SELECT * FROM meta WHERE id_pessoa = $1")
+        for _ in range(3):
+            execute("SELECT * FROM movimentacao_meta WHERE fk_meta_id_meta = $1")
+
+    execute("SELECT 1")  # fora do contexto: não conta
+
+    assert tracker.queries == 4
+    assert tracker.repeated() == {"SELECT * FROM movimentacao_meta WHERE fk_meta_id_meta = $1": 3}
+    assert "3x SELECT * FROM movimentacao_meta" in tracker.report()
+
+
+def test_nested_trackers_all_count() -> None:
+    with track_queries() as outer:
+        execute("SELECT 1")
+        with track_queries() as inner:
+            execute("SELECT 2")
+
+    assert inner.queries == 1
+    assert outer.queries == 2
+
+
+async def test_middleware_reports_counts_in_headers(caplog: pytest.LogCaptureFixture) -> None:
+    app = FastAPI()
+
+    @app.get("/metas")
+    async def metas() -> list[int]:
+        execute("SELECT * FROM meta")
+        for _ in range(3):
+            execute("SELECT * FROM alerta WHERE id = $1")
+        return []
+
+    app.add_middleware(QueryCountMiddleware)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        with track_queries() as outer:
+            response = await client.get("/metas")
+
+    assert response.headers["x-db-query-count"] == "4"
+    assert response.headers["x-db-repeated-queries"] == "1"
+    assert outer.queries == 4  # o tracker do middleware não esconde o de fora
+    assert "Possible N+1 in GET /metas" in caplog.text
+
+
+def test_query_budget_fails_on_excess_and_n_plus_one(query_budget) -> None:
+    with query_budget(2):
+        execute("SELECT 1")
+
+    with pytest.raises(AssertionError, match="query budget 1 exceeded"):
+        with query_budget(1):
+            execute("SELECT 1")
+            execute("SELECT 2")
+
+    with pytest.raises(AssertionError, match="possible N\\+1"):
+        with query_budget(10):
+            for _ in range(3):
+                execute("SELECT * FROM meta WHERE id_meta = $1")
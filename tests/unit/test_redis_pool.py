@@ -0,0 +1,23 @@
+"""Shared Redis pool tests."""
+
+import pytest
+
+from app.core.settings import settings
+from app.shared import redis as shared_redis
+
+
+async def test_pool_is_shared_sized_from_settings_and_released(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "redis_max_connections", 7)
+    monkeypatch.setattr(settings, "redis_pool_timeout_seconds", 0.5)
+    await shared_redis.close_redis_client()
+
+    client = shared_redis.get_redis_client()
+    pool = client.connection_pool
+
+    assert shared_redis.get_redis_client() is client
+    assert pool.max_connections == 7
+    assert pool.timeout == 0.5
+    assert pool.connection_kwargs["health_check_interval"] == settings.redis_health_check_interval_seconds
+
+    await shared_redis.close_redis_client()
+    assert shared_redis._client is None
@@ -0,0 +1,74 @@
+"""Synthetic seed generator tests."""
+
+import random
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from itertools import count
+from typing import Any
+
+from app.metas.persistence.movimentacao_meta_orm import MovimentacaoMetaORM
+from app.shared import seed_synthetic
+from app.shared.seed_synthetic import META_COLUMNS, MOVIMENTACAO_COLUMNS, SyntheticSpec, bulk_insert, generate_chunk
+
+TODAY = date(2025, 6, 1)
+SPEC = SyntheticSpec(pessoas=3, metas_por_pessoa=2, movimentacoes_por_meta=15, alertas_por_pessoa=4)
+
+
+def chunk(seed: int = 42):
+    return generate_chunk(SPEC, 0, SPEC.pessoas, count(100), rng=random.Random(seed), today=TODAY)
+
+
+def test_volumes_and_foreign_keys() -> None:
+    result = chunk()
+
+    assert len(result.pessoas) == 3
+    assert len(result.metas) == 6
+    assert len(result.movimentacoes) == 6 * 15
+    assert len(result.alertas) == 3 * 4
+    assert [m[0] for m in result.metas] == list(range(100, 106))
+    assert {m[1] for m in result.metas} == {p[0] for p in result.pessoas}
+    assert result.pessoas[2][1] == "synthetic+42-2@fink.dev"
+
+
+def test_meta_balance_matches_movements() -> None:
+    result = chunk()
+    saldos: dict[int, Decimal] = defaultdict(Decimal)
+    for id_meta, valor, acao, _ in result.movimentacoes:
+        saldos[id_meta] += valor if acao == "adicionado" else -valor
+        assert saldos[id_meta] >= 0
+
+    for meta in result.metas:
+        row = dict(zip(META_COLUMNS, meta))
+        assert row["valor_atual"] == saldos[row["id_meta"]]
+        assert (row["status"] == "concluida") == (row["valor_atual"] >= row["valor_alvo"])
+
+
+def test_generation_is_deterministic() -> None:
+    assert chunk() == chunk()
+    assert chunk().pessoas != chunk(seed=7).pessoas
+
+
+class FakeConnection:
+    class dialect:
+        driver = "psycopg"
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+
+    async def connection(self) -> FakeConnection:
+        return FakeConnection()
+
+    async def execute(self, stmt: Any) -> None:
+        self.statements.append(stmt)
+
+
+async def test_bulk_insert_batches_multi_row_inserts(monkeypatch) -> None:
+    monkeypatch.setattr(seed_synthetic, "MAX_BIND_PARAMS", 40)  # 10 linhas de 4 colunas por statement
+    session = FakeSession()
+
+    await bulk_insert(session, MovimentacaoMetaORM.__table__, MOVIMENTACAO_COLUMNS, chunk().movimentacoes[:25])  # type: ignore[arg-type]
+
+    assert len(session.statements) == 3
@@ -0,0 +1,124 @@
+"""Session validation cache tests."""
+
+from datetime import date, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.identidade.mappers.sessao_mapper import orm_to_model
+from app.identidade.persistence.sessao_orm import SessaoORM
+from app.identidade.services.sessao_service import SessaoService, _sha256
+from app.shared.cache import TTLCache
+
+
+class FakeSessaoRepo:
+    """In-memory double counting database round trips."""
+
+    def __init__(self, sessao: SessaoORM) -> None:
+        self.sessoes = {sessao.token_hash: sessao}
+        self.lookups = 0
+
+    async def purge_expired(self, *args: Any, **kwargs: Any) -> int:
+        return 0
+
+    async def get_by_token_hash(self, token_hash: str) -> SessaoORM | None:
+        self.lookups += 1
+        return self.sessoes.get(token_hash)
+
+    async def delete_by_token_hash(self, token_hash: str) -> None:
+        self.sessoes.pop(token_hash, None)
+
+    async def delete_all_for_pessoa(self, id_pessoa: Any) -> int:
+        return 0
+
+
+def make_service(token: str = "tok") -> tuple[SessaoService, FakeSessaoRepo, SessaoORM]:
+    sessao = SessaoORM(
+        id_sessao=1,
+        fk_pessoa_id_pessoa=uuid4(),
+        token_hash=_sha256(token),
+        criada_em=date.today(),
+        expira_em=date.today() + timedelta(days=1),
+    )
+    repo = FakeSessaoRepo(sessao)
+    service = SessaoService(repo, None, cache=TTLCache(maxsize=10, ttl=60))  # type: ignore[arg-type]
+    return service, repo, sessao
+
+
+async def test_warm_token_skips_database() -> None:
+    """The second validation of a token is served from cache."""
+    service, repo, sessao = make_service()
+
+    first = await service.validar("tok")
+    second = await service.validar("tok")
+
+    assert first.fk_pessoa_id_pessoa == second.fk_pessoa_id_pessoa == sessao.fk_pessoa_id_pessoa
+    assert repo.lookups == 1
+
+
+async def test_logout_invalidates_cached_token() -> None:
+    """Ending a session drops it from the cache."""
+    service, _, _ = make_service()
+    await service.validar("tok")
+
+    await service.encerrar_por_token("tok")
+
+    with pytest.raises(ValueError):
+        await service.validar("tok")
+
+
+class RacingSession:
+    """Session double whose commit lets a concurrent request re-cache the session first.
+
+    Until the commit, other transactions still see the row, so a validation running
+    in between puts the token back in the cache.
+    """
+
+    def __init__(self, on_commit: Any) -> None:
+        self.info: dict[str, Any] = {}
+        self.on_commit = on_commit
+
+    async def commit(self) -> None:
+        self.on_commit()
+
+    async def rollback(self) -> None:
+        pass
+
+
+async def test_logout_evicts_after_commit() -> None:
+    """A token re-cached by a concurrent validation before the commit is still dropped."""
+    service, _, sessao = make_service()
+    service.session = RacingSession(lambda: service.cache.set(sessao.token_hash, orm_to_model(sessao)))  # type: ignore[assignment]
+
+    await service.encerrar_por_token("tok")
+
+    with pytest.raises(ValueError):
+        await service.validar("tok")
+
+
+async def test_ending_all_sessions_of_pessoa_invalidates_cache() -> None:
+    """encerrar_todas_de_pessoa discards every cached token of that person."""
+    service, repo, sessao = make_service()
+    await service.validar("tok")
+
+    await service.encerrar_todas_de_pessoa(sessao.fk_pessoa_id_pessoa)
+    await service.validar("tok")
+
+    assert repo.lookups == 2
+
+
+def test_ttl_cache_expires_and_evicts() -> None:
+    """Entries expire after the TTL and the LRU entry is evicted when full."""
+    now = [0.0]
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] = 11
+    assert cache.get("a") is None
@@ -0,0 +1,73 @@
+"""Lifespan startup tests: no seeding by default, Pluggy check off the critical path."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+
+from app import main
+from app.core.settings import settings
+
+
+class SlowPluggyClient:
+    def __init__(self, **kwargs: Any) -> None:
+        self.closed = False
+
+    async def api_key(self) -> str:
+        await asyncio.sleep(10)
+        return "key"
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_startup(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    async def init_db(create_all: bool = False) -> None:
+        calls.append("db")
+
+    async def init_redis() -> None:
+        calls.append("redis")
+
+    async def close_redis_client() -> None:
+        calls.append("close_redis")
+
+    async def seed_db() -> None:
+        calls.append("seed")
+
+    monkeypatch.setattr(main, "init_db", init_db)
+    monkeypatch.setattr(main, "init_redis", init_redis)
+    monkeypatch.setattr(main, "close_redis_client", close_redis_client)
+    monkeypatch.setattr(main, "build_workers", list)
+    monkeypatch.setattr(main, "PluggyClient", SlowPluggyClient)
+    monkeypatch.setattr("app.shared.seed.seed_db", seed_db)
+    return calls
+
+
+async def test_background_check_does_not_delay_startup(fake_startup: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "pluggy_startup_check", "background")
+    app = FastAPI()
+
+    async with asyncio.timeout(1), main.lifespan(app):
+        check = app.state.pluggy_check
+        assert not check.done()
+        assert set(app.state.startup["steps"]) == {"db", "redis", "workers"}
+
+    assert check.cancelled()
+    assert app.state.pluggy_client.closed
+    assert fake_startup == ["db", "redis", "close_redis"]
+
+
+async def test_seed_only_when_requested(fake_startup: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "pluggy_startup_check", "off")
+    monkeypatch.setattr(settings, "seed_on_startup", True)
+    monkeypatch.setattr(settings, "environment", "development")
+    app = FastAPI()
+
+    async with main.lifespan(app):
+        assert app.state.pluggy_check is None
+
+    assert fake_startup == ["db", "seed", "redis", "close_redis"]
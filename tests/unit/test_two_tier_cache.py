@@ -0,0 +1,119 @@
+"""Two-tier (local + Redis) cache tests."""
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.comercial.persistence.plano_orm import PlanoORM
+from app.comercial.services.plano_service import PlanoService
+from app.shared.cache import TwoTierCache
+
+
+class FakeRedis:
+    """Minimal async Redis double (GET/SET/INCR) recording calls."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.calls: list[str] = []
+
+    async def get(self, key: str) -> str | None:
+        self.calls.append(f"GET {key}")
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.calls.append(f"SET {key}")
+        self.data[key] = value
+
+    async def incr(self, key: str) -> int:
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+        return int(self.data[key])
+
+
+class BrokenRedis(FakeRedis):
+    async def get(self, key: str) -> str | None:
+        raise RedisConnectionError("down")
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(redis: FakeRedis, clock: Clock | None = None) -> TwoTierCache:
+    return TwoTierCache("test", ttl=60, local_ttl=5, client_factory=lambda: redis, timer=clock or Clock())  # type: ignore[arg-type,return-value]
+
+
+async def test_local_tier_then_redis_then_loader() -> None:
+    redis, clock = FakeRedis(), Clock()
+    loads = 0
+
+    async def loader() -> list[int]:
+        nonlocal loads
+        loads += 1
+        return [1, 2]
+
+    first = make_cache(redis, clock)
+    assert await first.get_or_load("all", loader) == [1, 2]
+    assert await first.get_or_load("all", loader) == [1, 2]
+    assert redis.calls == ["GET test:version", "GET test:v0:all", "SET test:v0:all"]
+
+    # Outro processo: tier local vazio, mas acha o valor no Redis
+    second = make_cache(redis, clock)
+    assert await second.get_or_load("all", loader) == [1, 2]
+    assert loads == 1
+
+
+async def test_invalidate_bumps_version_for_every_process() -> None:
+    redis, clock = FakeRedis(), Clock()
+    values = iter([["old"], ["new"]])
+
+    async def loader() -> list[str]:
+        return next(values)
+
+    writer, reader = make_cache(redis, clock), make_cache(redis, clock)
+    assert await reader.get_or_load("all", loader) == ["old"]
+
+    await writer.invalidate()
+    clock.now = 6  # entrada local do leitor expira
+
+    assert await reader.get_or_load("all", loader) == ["new"]
+    assert "GET test:v1:all" in redis.calls
+
+
+async def test_redis_failure_falls_back_to_loader() -> None:
+    async def loader() -> dict[str, int]:
+        return {"id": 1}
+
+    cache = make_cache(BrokenRedis())
+
+    assert await cache.get_or_load("id:1", loader) == {"id": 1}
+
+
+class FakePlanoRepo:
+    def __init__(self) -> None:
+        self.plano = PlanoORM(
+            id_plano=1, titulo="Essencial", descricao="d", preco=19.9, duracao_meses=1, status="ativo"
+        )
+        self.gets = 0
+
+    async def get_by_id(self, id_plano: int) -> PlanoORM | None:
+        self.gets += 1
+        return self.plano if id_plano == 1 else None
+
+    async def update(self, plano: PlanoORM) -> PlanoORM:
+        return plano
+
+
+async def test_plano_service_caches_reads_and_invalidates_on_write() -> None:
+    repo = FakePlanoRepo()
+    service = PlanoService(repo, cache=make_cache(FakeRedis()))  # type: ignore[arg-type]
+
+    assert (await service.buscar_por_id(1)).status == "ativo"
+    await service.buscar_por_id(1)
+    assert repo.gets == 1
+
+    await service.desativar(1)
+
+    assert (await service.buscar_por_id(1)).status == "inativo"
+    assert repo.gets == 3
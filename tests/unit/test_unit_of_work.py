@@ -0,0 +1,77 @@
+"""Unit of work / @transactional tests."""
+
+from typing import Any
+
+import pytest
+
+from app.shared.transaction import UnitOfWork
+from app.shared.transaction_service import transactional
+
+
+class FakeSession:
+    """Records commits and rollbacks; ``info`` mirrors ``AsyncSession.info``."""
+
+    def __init__(self) -> None:
+        self.info: dict[str, Any] = {}
+        self.calls: list[str] = []
+
+    async def commit(self) -> None:
+        self.calls.append("commit")
+
+    async def rollback(self) -> None:
+        self.calls.append("rollback")
+
+
+class FakeService:
+    def __init__(self, session: FakeSession | None) -> None:
+        self.session = session
+
+    @transactional
+    async def externo(self) -> str:
+        await self.interno()
+        return "ok"
+
+    @transactional
+    async def interno(self) -> None:
+        assert self.session is None or self.session.calls == []
+
+    @transactional
+    async def falha(self) -> None:
+        raise ValueError("regra violada")
+
+
+async def test_nested_operations_commit_once() -> None:
+    session = FakeSession()
+
+    assert await FakeService(session).externo() == "ok"
+
+    assert session.calls == ["commit"]
+    assert session.info["uow_depth"] == 0
+
+
+async def test_exception_rolls_back_and_propagates() -> None:
+    session = FakeSession()
+
+    with pytest.raises(ValueError, match="regra violada"):
+        await FakeService(session).falha()
+
+    assert session.calls == ["rollback"]
+
+
+async def test_failed_commit_rolls_back() -> None:
+    session = FakeSession()
+
+    async def commit() -> None:
+        raise RuntimeError("serialization failure")
+
+    session.commit = commit  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(session):  # type: ignore[arg-type]
+            pass
+
+    assert session.calls == ["rollback"]
+
+
+async def test_without_session_is_a_no_op() -> None:
+    assert await FakeService(None).externo() == "ok"
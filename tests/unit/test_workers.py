@@ -0,0 +1,54 @@
+"""Periodic worker base tests."""
+
+import pytest
+
+from app.workers.base import PeriodicWorker
+
+
+class CountingWorker(PeriodicWorker):
+    name = "counting"
+
+    def __init__(self, results: list[int | Exception]) -> None:
+        super().__init__(interval_seconds=0.01)
+        self.results = results
+
+    async def run_once(self) -> int:
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+async def test_tick_accumulates_stats() -> None:
+    """Each run updates rows processed and durations."""
+    worker = CountingWorker([3, 5])
+
+    await worker.tick()
+    await worker.tick()
+
+    assert worker.stats.runs == 2
+    assert worker.stats.rows_processed == 8
+    assert worker.stats.last_rows == 5
+    assert worker.stats.total_duration_seconds >= worker.stats.last_duration_seconds
+
+
+async def test_failed_run_is_recorded() -> None:
+    """Failures are counted and keep the error message."""
+    worker = CountingWorker([RuntimeError("db down")])
+
+    with pytest.raises(RuntimeError):
+        await worker.tick()
+
+    assert worker.stats.failures == 1
+    assert worker.stats.last_error == "db down"
+
+
+async def test_start_and_stop() -> None:
+    """The loop task can be started and cancelled cleanly."""
+    worker = CountingWorker([1] * 100)
+
+    worker.start()
+    assert worker.running
+    await worker.stop()
+
+    assert not worker.running